@@ -47,6 +47,17 @@ class Settings(BaseSettings):
     VISION_LLM_MODE: str = "fallback"  # 模式: "primary"(优先使用), "fallback"(传统OCR失败时使用), "disabled"(禁用)
     VISION_LLM_FALLBACK_THRESHOLD: int = 3  # 传统OCR提取字段数低于3个时触发fallback
 
+    # 照片页标签OCR并发数（默认等于CPU核数）
+    OCR_CONCURRENCY: int = os.cpu_count() or 1
+    # 视觉大模型OCR调用限流（每秒请求数，0表示不限流，进程内所有核对共享）与临时性失败的最多尝试次数
+    OCR_RATE_LIMIT_RPS: float = 0
+    OCR_MAX_ATTEMPTS: int = 3
+    # 服务启动时是否在后台预热OCR引擎（开发调试、频繁重启时可关闭）
+    OCR_WARMUP_ON_STARTUP: bool = True
+
+    # 核对结果JSON是否缩进输出（结果文件仅供接口读取，默认紧凑输出；调试时可开启便于阅读）
+    RESULT_JSON_PRETTY: bool = False
+
     model_config = SettingsConfigDict(
         env_file=BASE_DIR / ".env",
         env_file_encoding="utf-8",
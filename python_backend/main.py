@@ -7,6 +7,8 @@ import os
 import sys
 import uuid
 import shutil
+import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime
@@ -17,7 +19,8 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
 # 导入本地模块
-from services.pdf_parser import PDFParser
+from config import settings as app_settings
+from services.pdf_parser import PDFParser, close_cached_docs
 from services.docx_parser import DocxParser
 from services.ocr_service import OCRService
 from services.report_checker import ReportChecker
@@ -35,11 +38,31 @@ from models.schemas import (
     RequirementCheck
 )
 
+
+def _warmup_ocr_engine():
+    """预热OCR引擎（模型加载较慢，失败不影响服务启动）"""
+    try:
+        ocr_service.warmup()
+    except Exception as e:
+        print(f"OCR引擎预热失败: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """服务生命周期：启动后按配置在工作线程中预热OCR引擎，避免首个识别请求承担冷启动耗时"""
+    warmup_task = None  # 保留任务引用，避免预热期间任务被垃圾回收
+    if app_settings.OCR_WARMUP_ON_STARTUP:
+        # 不等待预热完成，服务可立即接收请求
+        warmup_task = asyncio.create_task(asyncio.to_thread(_warmup_ocr_engine))
+    yield
+
+
 # 创建FastAPI应用
 app = FastAPI(
     title="报告审核工具API",
     description="PDF/DOCX报告解析与OCR核对服务",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # 配置CORS
@@ -222,7 +245,6 @@ async def ocr_image(file_id: str, image_path: str):
 # ============ 报告核对 ============
 
 from fastapi import Query
-from config import settings as app_settings
 
 @app.post("/api/check/{file_id}", response_model=CheckResult)
 async def check_report(
@@ -367,6 +389,8 @@ async def export_result(file_id: str, format: str = "pdf"):
 
 def cleanup_temp_files(file_id: str):
     """清理临时文件"""
+    # 先释放缓存的文档句柄，否则Windows下无法删除仍被打开的PDF
+    close_cached_docs(str(TEMP_DIR / f"{file_id}.pdf"))
     try:
         temp_files = [
             TEMP_DIR / f"{file_id}.pdf",
@@ -376,6 +400,8 @@ def cleanup_temp_files(file_id: str):
             for file in Path('.').glob(str(pattern)):
                 if file.exists():
                     file.unlink()
+        # 核对时提取的照片页图片
+        shutil.rmtree(TEMP_DIR / file_id, ignore_errors=True)
     except Exception as e:
         print(f"清理临时文件失败: {e}")
 
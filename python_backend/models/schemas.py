@@ -30,6 +30,7 @@ class PageInfo(BaseModel):
     page_num: int
     page_header: Optional[str] = None
     text_content: Optional[str] = None
+    page_number_raw: Optional[str] = None  # 右上角页码原文（"共XXX页 第Y页"），未找到为None
     has_table: bool = False
     has_image: bool = False
     tables: List[Dict[str, Any]] = []
@@ -13,7 +13,7 @@ from models.schemas import (
     InspectionItemCheckResult, InspectionItemCheck, ClauseCheck,
     RequirementCheck, ErrorItem, TableData
 )
-from services.pdf_parser import PDFParser
+from services.pdf_parser import PDFParser, _open_doc
 
 
 class ConclusionStatus(str, Enum):
@@ -148,31 +148,26 @@ class InspectionItemChecker:
         Returns:
             List[Tuple[int, int]]: [(页码, 表格索引), ...]
         """
-        import fitz
-
         tables = []
-        doc = fitz.open(pdf_path)
-
-        try:
-            for page_info in pages:
-                page_num = page_info.page_num
-                page = doc[page_num - 1]
-
-                # 查找表格
-                tab = page.find_tables()
-                for table_idx in range(len(tab.tables)):
-                    # 提取表格文本检查表头
-                    table_data = self.pdf_parser.extract_table_detailed(
-                        pdf_path, page_num, table_idx
-                    )
-
-                    if table_data and self._is_inspection_table(table_data):
-                        tables.append((page_num, table_idx))
+        # 使用共享的缓存文档（由缓存管理，此处不关闭）
+        doc = _open_doc(pdf_path)
+
+        for page_info in pages:
+            page_num = page_info.page_num
+            page = doc[page_num - 1]
+
+            # 查找表格
+            tab = page.find_tables()
+            for table_idx in range(len(tab.tables)):
+                # 提取表格文本检查表头
+                table_data = self.pdf_parser.extract_table_detailed(
+                    pdf_path, page_num, table_idx, doc=doc
+                )
 
-            return tables
+                if table_data and self._is_inspection_table(table_data):
+                    tables.append((page_num, table_idx))
 
-        finally:
-            doc.close()
+        return tables
 
     def _is_inspection_table(self, table_data: TableData) -> bool:
         """判断是否为检验项目表格"""
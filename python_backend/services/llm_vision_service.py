@@ -97,13 +97,14 @@ class LLMVisionService:
         """检查视觉LLM服务是否可用"""
         return self.provider != "none" and self.client is not None
 
-    def _encode_image(self, image_path: str) -> Tuple[str, str]:
+    def _encode_image(self, image_path: str, image_data: Optional[bytes] = None) -> Tuple[str, str]:
         """
-        将图片编码为base64
+        将图片编码为base64（提供image_data时直接编码该数据，image_path仅用于判断类型）
         返回: (base64字符串, mime类型)
         """
-        with open(image_path, "rb") as f:
-            image_data = f.read()
+        if image_data is None:
+            with open(image_path, "rb") as f:
+                image_data = f.read()
 
         # 检测文件类型
         mime_type = "image/jpeg"
@@ -129,12 +130,13 @@ class LLMVisionService:
         base64_data = base64.b64encode(buffer).decode('utf-8')
         return base64_data, "image/jpeg"
 
-    def recognize_image(self, image_path: str) -> Dict[str, Any]:
+    def recognize_image(self, image_path: str, image_data: Optional[bytes] = None) -> Dict[str, Any]:
         """
         对图片进行视觉OCR识别
 
         Args:
             image_path: 图片路径
+            image_data: 图片文件内容（已在内存中时提供，不再读取文件）
 
         Returns:
             包含识别结果的字典
@@ -142,7 +144,7 @@ class LLMVisionService:
         if not self.is_available():
             raise RuntimeError("视觉LLM服务不可用，请检查API密钥配置")
 
-        base64_image, mime_type = self._encode_image(image_path)
+        base64_image, mime_type = self._encode_image(image_path, image_data)
 
         try:
             if self.provider == "openrouter":
@@ -3,31 +3,336 @@ OCR识别服务
 基于PaddleOCR实现中文标签识别，支持视觉大模型OCR作为备选/增强
 """
 
+import calendar
+import heapq
+import logging
+import os
 import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 import cv2
 import numpy as np
 from PIL import Image
 
+from config import settings
 from models.schemas import OCRResult, OCRTextBlock
 from services.llm_vision_service import get_vision_service, is_vision_llm_available
+from utils.rate_limit import RateLimiter, retry_call
+
+logger = logging.getLogger(__name__)
+
+# 视觉大模型调用限流器（进程内共享，并发的多个核对共同受限）
+_vision_rate_limiter = RateLimiter(settings.OCR_RATE_LIMIT_RPS)
 
 # 延迟导入PaddleOCR，避免启动时加载
 _paddle_ocr = None
+# PaddleOCR实例为进程内共享单例：初始化与推理均需加锁（推理不保证线程安全）
+_paddle_ocr_init_lock = threading.Lock()
+_paddle_ocr_call_lock = threading.Lock()
+
+# 形态学操作核（常量，避免每次调用重复分配）
+_KERNEL_2X2 = np.ones((2, 2), np.uint8)
+_KERNEL_5X5 = np.ones((5, 5), np.uint8)
+
+# 线程局部的页面渲染缓冲区（按需扩容，跨页面复用）
+_render_local = threading.local()
+# 复用缓冲区的大小上限：容纳400DPI下一整页A4/Letter（BGR约46MB），
+# 每个渲染线程常驻至多48MB；更大的页面（如A3）每次单独分配、用后即释放
+_RENDER_BUFFER_MAX_BYTES = 48 * 1024 * 1024
+
+# 字段校验用正则（预编译；整串校验的模式不带锚点，统一用fullmatch）
+_RE_CJK = re.compile(r'[\u4e00-\u9fff]')
+_RE_ALNUM = re.compile(r'[A-Z0-9]', re.IGNORECASE)
+_RE_MODEL_CHARS = re.compile(r'[A-Z0-9\-.]+', re.IGNORECASE)
+_RE_UPPER = re.compile(r'[A-Z]')
+_RE_NUMBER_DASH_NUMBER = re.compile(r'\d{2,}[\-]\d{5,}')
+_RE_STANDARD_NUMBER = re.compile(r'\d{4}\.\d{1,3}')
+
+# 日期格式
+_RE_DATE_FULL = re.compile(r'(\d{4})[-./年](\d{1,2})[-./月](\d{1,2})日?')
+_RE_DATE_YMD = re.compile(r'\d{4}-\d{2}-\d{2}')
+_RE_YEARMONTH = re.compile(r'\d{4}-\d{2}')
+_DATE_SEPARATORS = '-./年'
+_RE_STANDALONE_DATE = re.compile(r'\b(20\d{2}[-./](0[1-9]|1[0-2])[-./](0[1-9]|[12]\d|3[01]))\b')
+
+# 字段名同义词分组
+_FIELD_NAME_SYNONYMS = {
+    '批号': ['批号', 'lot', 'batch', 'batchno', 'lotno'],
+    '序列号': ['序列号', 'sn', 's/n', 'serial', 'serialno'],
+    '生产日期': ['生产日期', 'mfg', 'mfd', 'manufacturedate', 'productiondate'],
+    '失效日期': ['失效日期', '有效期至', 'exp', 'expiry', 'expirationdate'],
+    '型号规格': ['型号规格', '规格型号', '型号', '规格', 'model', 'specification'],
+    '产品名称': ['产品名称', '名称', 'productname', 'name'],
+}
+
+# OCR易混淆字符：O/o -> 0
+_O_TO_ZERO = str.maketrans('Oo', '00')
+
+# 每月天数（下标为月份，2月按平年）
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# 型号格式
+_RE_MODEL_1 = re.compile(r'[A-Z]{2,4}-[A-Z0-9\-]+')
+_RE_MODEL_2 = re.compile(r'\d{2,}[\-\.]\d+')
+_RE_MODEL_TABLE_CELL = re.compile(r'[A-Z]{2,}-[A-Z0-9\-]+')
+_RE_MODEL_TOKEN = re.compile(r'[A-Z0-9\-]+')
+_RE_ENGX_MODEL = re.compile(r'\b(ENGX-[A-Z0-9\-]+)\b')
+
+# 型号字段前缀：各前缀按顺序最多去除一次（顺序很重要，更长的前缀在前），合并为单个正则一次完成
+_RE_MODEL_PREFIX = re.compile(
+    r'^(?:型号规格[：:\s]*)?'
+    r'(?:规格型号[：:\s]*)?'
+    r'(?:规格[：:\s]*)?'
+    r'(?:型号[：:\s]*)?'
+    r'(?:REF[：:\s]*)?',
+    re.IGNORECASE
+)
+
+# 特定产品名称到型号的映射模式（表格布局）
+_SPECIFIC_MODEL_PATTERNS = tuple((re.compile(p, re.IGNORECASE | re.MULTILINE), name) for p, name in (
+    # 显示触控一体机
+    (r'显示触控一体机\s*[\s:：]*([A-Z]{2,}-[A-Z0-9\-]+)', '显示触控一体机'),
+    # 脉冲电场消融设备
+    (r'脉冲电场消融设备\s*[\s:：]*([A-Z]{2,}-[A-Z0-9\-]+)', '脉冲电场消融设备'),
+    # 通用表格行模式：产品名称 + 型号（在同一行或相邻行）
+    (r'(?:4|5|6)\s*显示触控一体机\s+([A-Z]{2,}-[A-Z0-9\-]+)', '显示触控一体机'),
+    # 支持数字-数字格式的型号（如80-0000001）
+    (r'显示触控一体机\s*[\s:：]*(\d+[\-\.]\d+)', '显示触控一体机'),
+))
+
+# REF标签后的型号（REF: XXX 或 REF XXX 格式）
+_REF_MODEL_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'REF\s*[:：]?\s*([A-Z0-9\-]+)',
+    r'REF\s*[:：]?\s*\n?\s*([A-Z0-9\-]+)',
+))
+
+# 表格中特定产品名称后的型号
+_TABLE_MODEL_PATTERNS = tuple(re.compile(p, re.IGNORECASE | re.MULTILINE) for p in (
+    r'显示触控一体机\s*[\s:：]*([A-Z0-9\-]+)',
+    r'(?:部件名称|名称)[\s\S]*?显示触控一体机[\s\S]*?(?:规格型号|型号)[\s:：]*([A-Z0-9\-]+)',
+    r'显示触控一体机.*?\n.*?([A-Z]{2,}-[A-Z0-9\-]+)',
+    # 支持数字-数字格式的型号（如80-0000001）
+    r'显示触控一体机\s*[\s:：]*(\d+[\-\.]\d+)',
+    r'(?:规格型号|型号|规格)[\s:：]*(\d{2,}[\-\.]\d+)',
+))
+
+# 表格中的序列号格式：
+# 1. 字母+数字（如G250030, RC250030, LC250030）
+# 2. 字母-数字格式（如OT3-250030）
+# 3. 表格布局：批号/序列号列后的值
+_SERIAL_TABLE_PATTERNS = tuple(re.compile(p, re.IGNORECASE | re.MULTILINE) for p in (
+    # 表格布局：批号/序列号标题后，换行，然后是字母开头的序列号
+    r'批号[/／]序列号[^\n]*\n+\s*([A-Z]\w+)\s*\n',  # 批号/序列号后跟字母开头的值
+    r'批号[/／]序列号[^\n]*\n+\s*([A-Z]{2,3}\d{4,})\s*\n',  # 2-3字母+数字（如RC250030）
+    r'批号[/／]序列号[^\n]*\n+\s*([A-Z]\d{2,}-\d{4,})\s*\n',  # 字母+数字-数字（如OT3-250030）
+    # 通用模式
+    r'(?:批号[/／]序列号|序列号)[\s:：]*\n?\s*([A-Z]\d{4,})',  # 序列号后跟字母+数字
+    r'(?:批号[/／]序列号|序列号)[\s:：]*\n?\s*([A-Z]{2,3}\d{4,})',  # 2-3字母+数字
+    r'(?:批号[/／]序列号|序列号)[\s:：]*\n?\s*([A-Z]\d{2,}-\d{4,})',  # 字母+数字-数字
+    # 独立的序列号格式（在表格上下文中）
+    r'\b([A-Z]\d{6})\b',  # 独立的字母+6位数字（如G250030）
+    r'\b([A-Z]{2,3}\d{6})\b',  # 独立的2-3字母+6位数字（如RC250030）
+))
+
+# GS1条形码数据标识符，如 (21)G250030
+_RE_GS1_AI = re.compile(r'\((\d{2})\)\s*([A-Z0-9]+)', re.IGNORECASE)
+_RE_UPPER_ALNUM = re.compile(r'[A-Z0-9]+')
+
+# 型号无效格式
+_MODEL_INVALID_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'^\d{4}-\d{2}-\d{2}$',  # 日期格式
+    r'^\d{4}-\d{2}$',         # 年月格式如 2024-01
+    r'^[\s\/]+$',            # 纯符号
+    r'^(批号|日期|序列号|规格|型号|名称)',  # 常见前缀
+    r'^\d{4}\.\d{1,2}$',      # 标准引用号格式如 0466.1, 5465.2 (GB/T, YY/T等标准)
+    r'^\d{2}\.\d$',           # 短数字格式如 16.9
+))
+
+# 批号无效格式
+_BATCH_INVALID_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'^\d{4}-\d{2}-\d{2}$',   # 日期格式
+    r'^\d{4}-\d{2}$',          # 年月格式
+    r'^[\s\/]+$',             # 纯符号
+    r'^(生产|委托|抽样|签发|检验)',  # 常见中文前缀
+    r'^批号[/／]序列号',       # 列标题
+))
+
+
+def _pixmap_to_bgr(pix, reuse_buffer: bool = False) -> np.ndarray:
+    """
+    将PyMuPDF渲染的Pixmap转换为OpenCV BGR图像
+    直接使用pix.samples原始像素，不经过PNG编码/解码
+
+    Args:
+        pix: fitz.Pixmap（alpha=False，RGB）
+        reuse_buffer: 是否写入当前线程的复用缓冲区（图像不超过_RENDER_BUFFER_MAX_BYTES时）。
+            返回的数组在该线程下次调用前有效，仅用于立即处理、不保留引用的场景
+    """
+    rgb = np.frombuffer(pix.samples, np.uint8).reshape(pix.height, pix.width, pix.n)
+    if pix.n == 4:
+        rgb = rgb[:, :, :3]
+
+    size = pix.height * pix.width * 3
+    if not reuse_buffer or size > _RENDER_BUFFER_MAX_BYTES:
+        return cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+
+    buffer = getattr(_render_local, 'buffer', None)
+    if buffer is None or buffer.size < size:
+        buffer = _render_local.buffer = np.empty(size, np.uint8)
+    out = buffer[:size].reshape(pix.height, pix.width, 3)
+    cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR, dst=out)
+    return out
+
+
+def _iter_nearest_first(xs: np.ndarray, k: int = 8):
+    """
+    按x坐标从小到大产出候选下标
+
+    先只取最近的k个（型号通常就在其中，命中即停止），全部落空时再对剩余候选完整排序；
+    产出顺序与对全部候选做稳定排序一致
+    """
+    yield from heapq.nsmallest(k, range(len(xs)), key=xs.__getitem__)
+    if len(xs) > k:
+        yield from np.argsort(xs, kind='stable')[k:]
+
+
+def _render_page(pdf_path: str, page_num: int, zoom: float = 400 / 72) -> np.ndarray:
+    """
+    将PDF单页渲染为OpenCV BGR图像
+    每次调用独立打开文档（fitz.Document不能跨线程共享），可在线程池中并发调用
+    """
+    import fitz
+
+    doc = fitz.open(pdf_path)
+    try:
+        pix = doc[page_num - 1].get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+        return _pixmap_to_bgr(pix)
+    finally:
+        doc.close()
+
+
+def _as_int(value) -> Optional[int]:
+    """将整数或十进制数字字符串转为int，其他输入返回None（避免异常开销）"""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isdecimal():
+        return int(value)
+    return None
+
+
+def _normalize_field_name(name: str) -> str:
+    """标准化字段名：去除半角/全角空格并转小写"""
+    return name.replace(' ', '').replace('　', '').lower()
+
+
+def _build_synonym_index() -> Dict[str, frozenset]:
+    """构建同义词反查表：同义词 -> 所有包含它的分组中的全部同义词"""
+    index: Dict[str, set] = {}
+    for group in _FIELD_NAME_SYNONYMS.values():
+        for term in group:
+            index.setdefault(term, set()).update(group)
+    return {term: frozenset(terms) for term, terms in index.items()}
+
+
+def _build_month_correction_table() -> Dict[int, int]:
+    """
+    预计算月份OCR校正表：无效月份(13-99) -> 校正后的月份
+
+    常见错误模式：
+    - 10被识别为15（1->1, 0->5）
+    - 11被识别为17
+    - 12被识别为18
+    其他两位数月份：第一位可能是0或1被误识别（如22可能是12），
+    第二位5-9可能是0-2被误识别，取所有候选中最小的有效月份（最保守的选择）
+    """
+    table = {}
+    for month_int in range(13, 100):
+        first_digit, second_digit = str(month_int)
+        candidates = []
+        if first_digit in '23456789':
+            for replacement in '01':
+                try_month = int(replacement + second_digit)
+                if 1 <= try_month <= 12:
+                    candidates.append(try_month)
+        if second_digit in '56789':
+            for replacement in '012':
+                try_month = int(first_digit + replacement)
+                if 1 <= try_month <= 12:
+                    candidates.append(try_month)
+        if candidates:
+            table[month_int] = min(candidates)
+
+    table.update({15: 10, 17: 11, 18: 12})
+    return table
+
+
+def _build_day_correction_table() -> Dict[Tuple[int, int], int]:
+    """
+    预计算日期OCR校正表：(超出当月天数的日期, 当月天数) -> 校正后的日期
+    尝试将第一位减小（如35->25->15->05），取最大的有效日期
+    """
+    table = {}
+    for max_day in (28, 29, 30, 31):
+        for day_int in range(max_day + 1, 100):
+            first_digit, second_digit = str(day_int)
+            candidates = []
+            for replacement in '012':
+                if replacement <= first_digit:
+                    try_day = int(replacement + second_digit)
+                    if 1 <= try_day <= max_day:
+                        candidates.append(try_day)
+            if candidates:
+                table[(day_int, max_day)] = max(candidates)
+    return table
+
+
+def _build_month_digits_correction_table() -> Dict[str, str]:
+    """
+    预计算日期字符串中月份数字的OCR校正表：两位月份字符串(13-99) -> 校正后的字符串
+    15 -> 10, 17 -> 11, 18 -> 12，其他情况尝试将第一位改为0或1
+    """
+    table = {}
+    for month_int in range(13, 100):
+        digits = str(month_int)
+        for first in '01':
+            if 1 <= int(first + digits[1]) <= 12:
+                table[digits] = first + digits[1]
+                break
+    table.update({'15': '10', '17': '11', '18': '12'})
+    return table
+
+
+# 由上方构建函数预计算的查找表
+_SYNONYM_INDEX = _build_synonym_index()
+_MONTH_CORRECTION = _build_month_correction_table()
+_DAY_CORRECTION = _build_day_correction_table()
+_MONTH_DIGITS_CORRECTION = _build_month_digits_correction_table()
 
 
 def get_paddle_ocr():
-    """获取PaddleOCR实例（延迟加载）"""
+    """获取PaddleOCR实例（延迟加载，首次创建时用小图预热推理）"""
     global _paddle_ocr
     if _paddle_ocr is None:
-        from paddleocr import PaddleOCR
-        _paddle_ocr = PaddleOCR(
-            use_angle_cls=True,
-            lang='ch',
-            show_log=False,
-            use_gpu=False
-        )
+        with _paddle_ocr_init_lock:
+            if _paddle_ocr is None:
+                from paddleocr import PaddleOCR
+                ocr = PaddleOCR(
+                    use_angle_cls=True,
+                    lang='ch',
+                    show_log=False,
+                    use_gpu=False
+                )
+                # 预热：触发模型加载与首次推理的初始化开销，避免由第一个真实页面承担
+                try:
+                    ocr.ocr(np.zeros((32, 32, 3), dtype=np.uint8), cls=True)
+                except Exception as e:
+                    logger.warning("PaddleOCR预热失败: %s", e)
+                _paddle_ocr = ocr
     return _paddle_ocr
 
 
@@ -35,6 +340,8 @@ class OCRService:
     """OCR识别服务"""
 
     # OCR字段提取正则表达式
+    # keywords与patterns一一对应：文本（转大写后）需包含其中任一关键词，
+    # 对应模式才可能匹配，否则跳过该模式的正则扫描；None表示无法预判
     FIELD_PATTERNS = {
         'batch_number': {
             'patterns': [
@@ -43,6 +350,7 @@ class OCRService:
                 r'(?:LOT|Lot|BATCH|Batch)\s*(?:No\.?|#)?[：:\s]*([A-Z0-9][^\s]*)',
                 r'\(10\)\s*([A-Z0-9]+)',  # 条形码数据标识符 (10)
             ],
+            'keywords': [('批号',), ('批号',), ('LOT', 'BATCH'), ('(10)',)],
             'name': '批号'
         },
         'serial_number': {
@@ -54,6 +362,7 @@ class OCRService:
                 r'SN\s*[:：]?\s*([A-Z]\d+)',  # SN后跟字母+数字格式（如G250030）
                 r'SN\s*[:：]?\s*([A-Z0-9]{4,12})',  # SN后跟4-12位字母数字（过滤长串UDI）
             ],
+            'keywords': [('序列号',), ('SN', 'S/N', 'SERIAL'), ('(21)',), ('SN',), ('SN',), ('SN',)],
             'name': '序列号'
         },
         'production_date': {
@@ -63,6 +372,7 @@ class OCRService:
                 r'\(11\)\s*([0-9]{6})',  # 条形码数据标识符 (11) - 生产日期 YYMMDD
                 r'(?:^|\n)\s*([0-9]{4}[-./][0-9]{1,2}[-./][0-9]{1,2})(?:\s*$|\n)',  # 独立的日期行
             ],
+            'keywords': [('生产日期',), ('MFG', 'MFD', 'DATE'), ('(11)',), None],
             'name': '生产日期'
         },
         'expiration_date': {
@@ -71,6 +381,7 @@ class OCRService:
                 r'(?:EXP|Expiry|Expiration)\s*(?:Date)?[：:\s]*([0-9]{4}[-./][0-9]{1,2}[-./][0-9]{1,2})',
                 r'\(17\)\s*([0-9]{6})',  # 条形码数据标识符 (17) - 失效日期 YYMMDD
             ],
+            'keywords': [('失效日期', '有效期至'), ('EXP',), ('(17)',)],
             'name': '失效日期'
         },
         'model': {
@@ -82,6 +393,7 @@ class OCRService:
                 r'\b([A-Z]{2,}-[A-Z0-9\-]+)\b',  # 直接匹配型号格式
                 r'\b(\d{2,}[\-\.]\d+)\b',  # 数字-数字格式（如80-0000001）
             ],
+            'keywords': [('规格', '型号'), ('REF',), ('REF',), ('-',), ('-', '.')],
             'name': '型号规格'
         },
         'product_name': {
@@ -89,10 +401,23 @@ class OCRService:
                 r'(?:产品名称|名称)[：:\s]*([^\n]+?)(?=\n|$|型号|规格)',
                 r'^([^\n]+?)(?=\n.*REF|医疗器械)',  # 第一行作为产品名，后面跟REF或医疗器械标识
             ],
+            'keywords': [('名称',), ('REF', '医疗器械')],
             'name': '产品名称'
         }
     }
 
+    # 预编译的字段正则（与FIELD_PATTERNS中的patterns一一对应）
+    _FIELD_REGEXES = {
+        field_key: [re.compile(p, re.MULTILINE | re.IGNORECASE) for p in field_config['patterns']]
+        for field_key, field_config in FIELD_PATTERNS.items()
+    }
+
+    # 标准化字段名 -> 字段key（按FIELD_PATTERNS顺序）
+    _NORMALIZED_NAME_TO_KEY = {
+        _normalize_field_name(field_config['name']): field_key
+        for field_key, field_config in FIELD_PATTERNS.items()
+    }
+
     # 条形码数据标识符映射 (GS1标准)
     BARCODE_AI_MAPPING = {
         '10': 'batch_number',      # 批号
@@ -113,6 +438,18 @@ class OCRService:
         self.use_vision_llm = use_vision_llm
         self.vision_llm_fallback = vision_llm_fallback
         self._vision_service = None
+        # 线程局部的OpenCV对象缓存（CLAHE内部持有工作缓冲区，不能跨线程共享）
+        self._cv_local = threading.local()
+
+    def _get_clahe(self, clip_limit: float):
+        """获取当前线程缓存的CLAHE对象，按clipLimit区分"""
+        cache = getattr(self._cv_local, 'clahe', None)
+        if cache is None:
+            cache = self._cv_local.clahe = {}
+        clahe = cache.get(clip_limit)
+        if clahe is None:
+            clahe = cache[clip_limit] = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=(8, 8))
+        return clahe
 
     def _get_vision_service(self):
         """获取视觉LLM服务（延迟初始化）"""
@@ -125,6 +462,15 @@ class OCRService:
         if self.ocr is None:
             self.ocr = get_paddle_ocr()
 
+    def warmup(self):
+        """预先初始化并预热OCR引擎（供服务启动时在后台调用）"""
+        self._ensure_ocr()
+
+    def _run_ocr(self, img: np.ndarray):
+        """执行PaddleOCR识别（共享实例不保证线程安全，串行调用）"""
+        with _paddle_ocr_call_lock:
+            return self.ocr.ocr(img, cls=True)
+
     def recognize_page(self, pdf_path: str, page_num: int) -> OCRResult:
         """
         对PDF页面进行OCR识别
@@ -142,22 +488,75 @@ class OCRService:
         mat = fitz.Matrix(zoom, zoom)
         pix = page.get_pixmap(matrix=mat, alpha=False)
 
-        # 转换为OpenCV格式
-        img_data = np.frombuffer(pix.tobytes("png"), np.uint8)
-        img = cv2.imdecode(img_data, cv2.IMREAD_COLOR)
+        # 转换为OpenCV格式（写入线程复用缓冲区，预处理后不再引用）
+        img = _pixmap_to_bgr(pix, reuse_buffer=True)
 
         doc.close()
 
         # OCR识别
         return self._recognize_image_array(img, page_num=page_num)
 
-    def recognize_image(self, image_path: str, use_vision_llm: Optional[bool] = None) -> OCRResult:
+    def recognize_pages(self, pdf_path: str, page_nums: List[int],
+                        max_workers: Optional[int] = None) -> List[OCRResult]:
+        """
+        对PDF多个页面进行批量OCR识别
+
+        页面渲染在当前线程顺序执行（fitz文档对象不是线程安全的），
+        OpenCV预处理在线程池中并发执行（OpenCV调用会释放GIL），
+        PaddleOCR识别按页码顺序在当前线程执行（实例不保证线程安全）。
+        同时最多保留max_workers页已渲染未识别的图像（400DPI下每页约46MB），限制内存占用。
+
+        Args:
+            pdf_path: PDF文件路径
+            page_nums: 页码列表（从1开始）
+            max_workers: 预处理线程数，默认为CPU核数
+
+        Returns:
+            与page_nums顺序一致的OCRResult列表
+        """
+        import fitz
+
+        if not page_nums:
+            return []
+
+        self._ensure_ocr()
+
+        zoom = 400 / 72
+        mat = fitz.Matrix(zoom, zoom)
+        workers = max_workers or os.cpu_count() or 1
+        results = []
+        page_iter = iter(page_nums)
+
+        doc = fitz.open(pdf_path)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                def submit(page_num: int):
+                    # 各页图像需保留到预处理完成，不能使用复用缓冲区
+                    pix = doc[page_num - 1].get_pixmap(matrix=mat, alpha=False)
+                    return page_num, executor.submit(self._prepare_image, _pixmap_to_bgr(pix))
+
+                pending = deque(submit(page_num) for page_num in islice(page_iter, workers))
+                while pending:
+                    page_num, future = pending.popleft()
+                    results.append(self._ocr_processed_image(future.result(), page_num=page_num))
+                    # 当前页识别完成后再渲染下一页，保证已渲染未识别的页不超过workers
+                    next_page = next(page_iter, None)
+                    if next_page is not None:
+                        pending.append(submit(next_page))
+        finally:
+            doc.close()
+
+        return results
+
+    def recognize_image(self, image_path: str, use_vision_llm: Optional[bool] = None,
+                        image_data: Optional[bytes] = None) -> OCRResult:
         """
         对图片文件进行OCR识别
 
         Args:
             image_path: 图片路径
             use_vision_llm: 是否使用视觉大模型OCR（覆盖初始化设置）
+            image_data: 图片文件内容；提供时直接识别该数据而不读取image_path（路径仅用于记录与判断类型）
         """
         # 确定是否使用视觉LLM
         should_use_vision = use_vision_llm if use_vision_llm is not None else self.use_vision_llm
@@ -165,7 +564,7 @@ class OCRService:
         # 如果优先使用视觉LLM且可用
         if should_use_vision and is_vision_llm_available():
             try:
-                return self._recognize_with_vision_llm(image_path)
+                return self._recognize_with_vision_llm(image_path, image_data)
             except Exception as e:
                 print(f"视觉LLM OCR失败，回退到传统OCR: {e}")
                 # 如果视觉LLM失败，继续传统OCR
@@ -174,7 +573,10 @@ class OCRService:
         self._ensure_ocr()
 
         # 读取图片
-        img = cv2.imread(image_path)
+        if image_data is not None:
+            img = cv2.imdecode(np.frombuffer(image_data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        else:
+            img = cv2.imread(image_path)
         if img is None:
             raise ValueError(f"无法读取图片: {image_path}")
 
@@ -187,7 +589,7 @@ class OCRService:
             self._should_fallback_to_vision(result)):
             try:
                 print(f"传统OCR结果不理想，尝试视觉LLM增强: {image_path}")
-                return self._recognize_with_vision_llm(image_path)
+                return self._recognize_with_vision_llm(image_path, image_data)
             except Exception as e:
                 print(f"视觉LLM fallback失败: {e}")
 
@@ -214,17 +616,21 @@ class OCRService:
 
         return False
 
-    def _recognize_with_vision_llm(self, image_path: str) -> OCRResult:
+    def _recognize_with_vision_llm(self, image_path: str, image_data: Optional[bytes] = None) -> OCRResult:
         """
-        使用视觉大模型进行OCR识别
+        使用视觉大模型进行OCR识别（提供image_data时直接发送该数据）
         """
         vision_service = self._get_vision_service()
 
         if not vision_service.is_available():
             raise RuntimeError("视觉LLM服务不可用")
 
-        # 调用视觉LLM服务
-        vision_result = vision_service.recognize_image(image_path)
+        # 调用视觉LLM服务（限流；超时、限流、服务端错误等临时性失败按指数退避重试）
+        vision_result = retry_call(
+            lambda: vision_service.recognize_image(image_path, image_data=image_data),
+            max_attempts=max(1, settings.OCR_MAX_ATTEMPTS),
+            rate_limiter=_vision_rate_limiter
+        )
 
         # 转换为OCRResult格式
         text_blocks = []
@@ -277,14 +683,27 @@ class OCRService:
         """
         对图片数组进行OCR识别
         """
+        processed_img = self._prepare_image(img)
+        return self._ocr_processed_image(processed_img, page_num=page_num, image_path=image_path)
+
+    def _prepare_image(self, img: np.ndarray) -> np.ndarray:
+        """
+        OCR前的图像准备：裁剪标签区域并预处理
+        仅包含OpenCV操作，可在线程池中并发执行
+        """
         # 首先尝试检测并裁剪标签区域
         img = self.detect_and_crop_label_region(img)
 
         # 图片预处理
-        processed_img = self._preprocess_image(img)
+        return self._preprocess_image(img)
 
+    def _ocr_processed_image(self, processed_img: np.ndarray, page_num: Optional[int] = None,
+                             image_path: Optional[str] = None) -> OCRResult:
+        """
+        对预处理后的图像执行OCR识别并提取结构化字段
+        """
         # OCR识别
-        result = self.ocr.ocr(processed_img, cls=True)
+        result = self._run_ocr(processed_img)
 
         # 解析结果
         text_blocks = []
@@ -388,20 +807,9 @@ class OCRService:
         专门针对标签照片的预处理
         优化光照不均、增强文字对比度
         """
-        # 转换为LAB颜色空间进行CLAHE处理
-        lab = cv2.cvtColor(img, cv2.COLOR_BGR2LAB)
-        l, a, b = cv2.split(lab)
-
-        # CLAHE对比度增强（针对L通道）
-        clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
-        l = clahe.apply(l)
-
-        # 合并通道
-        lab = cv2.merge([l, a, b])
-        img = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
-
-        # 转换为灰度图
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        # 直接在灰度图上做CLAHE对比度增强（等效于LAB亮度通道增强，省去颜色空间往返转换）
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if len(img.shape) == 3 else img
+        gray = self._get_clahe(3.0).apply(gray)
 
         # 去倾斜处理
         gray = self._deskew_image(gray)
@@ -416,9 +824,8 @@ class OCRService:
         )
 
         # 形态学操作：去除噪点，连接断裂的文字
-        kernel = np.ones((2, 2), np.uint8)
-        binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
-        binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel)
+        binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, _KERNEL_2X2)
+        binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, _KERNEL_2X2)
 
         # 转回3通道以兼容PaddleOCR
         result = cv2.cvtColor(binary, cv2.COLOR_GRAY2BGR)
@@ -429,22 +836,17 @@ class OCRService:
         """
         标准文档图像预处理
         """
-        # 轻度降噪（保留更多细节）
-        img = cv2.fastNlMeansDenoisingColored(img, None, 10, 10, 7, 21)
+        # 灰度化后处理，避免LAB颜色空间的拆分/合并
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if len(img.shape) == 3 else img
 
-        # 转换为LAB颜色空间进行CLAHE处理
-        lab = cv2.cvtColor(img, cv2.COLOR_BGR2LAB)
-        l, a, b = cv2.split(lab)
+        # 轻度降噪（保留更多细节）
+        gray = cv2.fastNlMeansDenoising(gray, None, 10, 7, 21)
 
         # 轻度CLAHE增强
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        l = clahe.apply(l)
-
-        # 合并通道
-        lab = cv2.merge([l, a, b])
-        img = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
+        gray = self._get_clahe(2.0).apply(gray)
 
-        return img
+        # 转回3通道以兼容PaddleOCR
+        return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
 
     def _deskew_image(self, gray_img: np.ndarray) -> np.ndarray:
         """
@@ -510,12 +912,15 @@ class OCRService:
         # 高斯模糊
         blurred = cv2.GaussianBlur(gray, (5, 5), 0)
 
-        # 边缘检测
-        edges = cv2.Canny(blurred, 50, 150)
+        # 边缘检测：Sobel梯度幅值 + 阈值
+        # 后续膨胀会把边缘连成区域，Canny的非极大值抑制/滞后阈值细化在此没有意义
+        grad_x = cv2.Sobel(blurred, cv2.CV_16S, 1, 0)
+        grad_y = cv2.Sobel(blurred, cv2.CV_16S, 0, 1)
+        magnitude = cv2.add(cv2.convertScaleAbs(grad_x), cv2.convertScaleAbs(grad_y))
+        _, edges = cv2.threshold(magnitude, 50, 255, cv2.THRESH_BINARY)
 
         # 膨胀连接边缘
-        kernel = np.ones((5, 5), np.uint8)
-        dilated = cv2.dilate(edges, kernel, iterations=2)
+        dilated = cv2.dilate(edges, _KERNEL_5X5, iterations=2)
 
         # 查找轮廓
         contours, _ = cv2.findContours(dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -594,13 +999,18 @@ class OCRService:
         if specific_models:
             structured.update(specific_models)
 
+        # 关键词预扫描：只对文本中出现了锚定关键词的模式运行正则
+        text_upper = text.upper()
+
         for field_key, field_config in self.FIELD_PATTERNS.items():
             # 如果已经通过特定方法提取了该字段，跳过
             if field_key in structured:
                 continue
 
-            for pattern in field_config['patterns']:
-                matches = re.findall(pattern, text, re.MULTILINE | re.IGNORECASE)
+            for regex, keywords in zip(self._FIELD_REGEXES[field_key], field_config['keywords']):
+                if keywords and not any(kw in text_upper for kw in keywords):
+                    continue
+                matches = regex.findall(text)
                 if matches:
                     # 取第一个匹配
                     value = matches[0]
@@ -621,17 +1031,17 @@ class OCRService:
                     # 验证序列号格式：过滤UDI编号
                     if field_key == 'serial_number' and value:
                         if self._is_likely_udi(value):
-                            print(f"[OCR] 序列号提取：过滤掉疑似UDI编号 '{value}'")
+                            logger.debug("序列号提取：过滤掉疑似UDI编号 '%s'", value)
                             continue
                         # 验证序列号长度合理（6-15位）
                         if len(value) > 15 or (value.isdigit() and len(value) > 10):
-                            print(f"[OCR] 序列号提取：长度异常 '{value}'，跳过")
+                            logger.debug("序列号提取：长度异常 '%s'，跳过", value)
                             continue
 
                     # 验证批号格式
                     if field_key == 'batch_number' and value:
                         if not self._is_valid_batch_number(value):
-                            print(f"[OCR] 批号提取：过滤掉无效值 '{value}'")
+                            logger.debug("批号提取：过滤掉无效值 '%s'", value)
                             continue
 
                     structured[field_key] = {
@@ -641,8 +1051,9 @@ class OCRService:
                     break
 
         # 在返回前进行UDI过滤和GS1 (21)优先处理
-        structured = self._filter_udis_from_result(structured, text)
-        structured = self._prioritize_gs21_serial(structured, text)
+        structured = self._filter_udis_from_result(structured)
+        ai_hits = self._collect_gs1_ai_hits(text) if '(21)' in text else {}
+        structured = self._prioritize_gs21_serial(structured, ai_hits)
 
         return structured
 
@@ -652,20 +1063,8 @@ class OCRService:
         """
         structured = {}
 
-        # 特定产品名称到型号的映射模式
-        specific_patterns = [
-            # 显示触控一体机
-            (r'显示触控一体机\s*[\s:：]*([A-Z]{2,}-[A-Z0-9\-]+)', '显示触控一体机'),
-            # 脉冲电场消融设备
-            (r'脉冲电场消融设备\s*[\s:：]*([A-Z]{2,}-[A-Z0-9\-]+)', '脉冲电场消融设备'),
-            # 通用表格行模式：产品名称 + 型号（在同一行或相邻行）
-            (r'(?:4|5|6)\s*显示触控一体机\s+([A-Z]{2,}-[A-Z0-9\-]+)', '显示触控一体机'),
-            # 支持数字-数字格式的型号（如80-0000001）
-            (r'显示触控一体机\s*[\s:：]*(\d+[\-\.]\d+)', '显示触控一体机'),
-        ]
-
-        for pattern, product_name in specific_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for regex, product_name in _SPECIFIC_MODEL_PATTERNS:
+            match = regex.search(text)
             if match:
                 model_value = match.group(1).strip()
                 if self._is_valid_model(model_value):
@@ -686,37 +1085,35 @@ class OCRService:
 
         value = value.strip()
 
+        # 快速预判：型号只由ASCII字母数字和-.组成，非ASCII直接排除
+        if not value.isascii():
+            return False
+
+        # 快速预判：纯数字加点（如标准号0466.1、16.9）不是型号
+        if '.' in value and value.replace('.', '').isdigit():
+            return False
+
         # 排除常见错误匹配
-        invalid_patterns = [
-            r'^\d{4}-\d{2}-\d{2}$',  # 日期格式
-            r'^\d{4}-\d{2}$',         # 年月格式如 2024-01
-            r'^[\s\/]+$',            # 纯符号
-            r'^(批号|日期|序列号|规格|型号|名称)',  # 常见前缀
-            r'^\d{4}\.\d{1,2}$',      # 标准引用号格式如 0466.1, 5465.2 (GB/T, YY/T等标准)
-            r'^\d{2}\.\d$',           # 短数字格式如 16.9
-        ]
-
-        for pattern in invalid_patterns:
-            if re.match(pattern, value, re.IGNORECASE):
+        for pattern in _MODEL_INVALID_PATTERNS:
+            if pattern.match(value):
                 return False
 
         # 有效型号应该包含字母和数字的组合，或者有连字符/点
-        valid_pattern = r'^[A-Z0-9\-.]+$'
-        if not re.match(valid_pattern, value, re.IGNORECASE):
+        if not _RE_MODEL_CHARS.fullmatch(value):
             return False
 
         # 型号格式：要么包含至少一个大写字母，要么是数字-数字格式（如80-0000001）
-        has_letter = re.search(r'[A-Z]', value) is not None
+        has_letter = _RE_UPPER.search(value) is not None
         # 数字-数字格式：要求至少2位数字-至少5位数字（如80-0000001）
         # 避免匹配像9706.202这样的标准编号（4位.3位）
-        is_number_dash_number = re.match(r'^\d{2,}[\-]\d{5,}$', value) is not None
+        is_number_dash_number = _RE_NUMBER_DASH_NUMBER.fullmatch(value) is not None
 
         if not has_letter and not is_number_dash_number:
             return False
 
         # 额外过滤：排除看起来像标准引用号的模式
         # 如 0466.1, 5465.2, 9706.202 (GB/T, YY/T等标准)
-        if re.match(r'^\d{4}\.\d{1,3}$', value):
+        if _RE_STANDARD_NUMBER.fullmatch(value):
             return False
 
         return True
@@ -729,30 +1126,22 @@ class OCRService:
             return False
 
         value = value.strip()
+        is_ascii = value.isascii()
 
-        # 排除中文字符（批号应该是字母数字组合）
-        if re.search(r'[\u4e00-\u9fff]', value):
+        # 排除中文字符（批号应该是字母数字组合），纯ASCII无需正则扫描
+        if not is_ascii and _RE_CJK.search(value):
             return False
 
         # 排除常见错误匹配
-        invalid_patterns = [
-            r'^\d{4}-\d{2}-\d{2}$',   # 日期格式
-            r'^\d{4}-\d{2}$',          # 年月格式
-            r'^[\s\/]+$',             # 纯符号
-            r'^(生产|委托|抽样|签发|检验)',  # 常见中文前缀
-            r'^批号[/／]序列号',       # 列标题
-        ]
-
-        for pattern in invalid_patterns:
-            if re.match(pattern, value, re.IGNORECASE):
+        for pattern in _BATCH_INVALID_PATTERNS:
+            if pattern.match(value):
                 return False
 
         # 批号应该是字母数字组合，或纯数字，或包含连字符
         # 但至少应该包含一些字母数字字符
-        if not re.search(r'[A-Z0-9]', value, re.IGNORECASE):
-            return False
-
-        return True
+        if is_ascii:
+            return any(c.isalnum() for c in value)
+        return _RE_ALNUM.search(value) is not None
 
     def _extract_from_text_blocks(self, text_blocks: List, existing_data: Dict) -> Dict[str, Any]:
         """
@@ -768,20 +1157,16 @@ class OCRService:
 
         # 查找并处理REF后的型号
         if 'model' not in result:
-            # 查找REF和后续的型号值
-            for i, block in enumerate(text_blocks):
-                block_text = block.text.strip()
-                block_text_upper = block_text.upper()
+            # 预先计算去空白文本，避免循环内重复strip/upper
+            stripped_texts = [text.strip() for text in texts]
 
+            # 查找REF和后续的型号值
+            for i, block_text in enumerate(stripped_texts):
                 # 情况1: REF在同一行，后面跟着型号
-                if 'REF' in block_text_upper:
+                if 'REF' in block_text.upper():
                     # 尝试从当前文本中提取型号（REF: XXX 或 REF XXX 格式）
-                    ref_patterns = [
-                        r'REF\s*[:：]?\s*([A-Z0-9\-]+)',
-                        r'REF\s*[:：]?\s*\n?\s*([A-Z0-9\-]+)',
-                    ]
-                    for pattern in ref_patterns:
-                        match = re.search(pattern, block_text, re.IGNORECASE)
+                    for regex in _REF_MODEL_PATTERNS:
+                        match = regex.search(block_text)
                         if match:
                             model_value = match.group(1).strip()
                             if model_value:
@@ -794,10 +1179,10 @@ class OCRService:
                         break
 
                     # 情况2: REF在单独一行，检查下一个block是否是型号
-                    if i + 1 < len(text_blocks):
-                        next_text = text_blocks[i + 1].text.strip()
+                    if i + 1 < len(stripped_texts):
+                        next_text = stripped_texts[i + 1]
                         # 型号通常是字母数字组合，包含连字符
-                        if re.match(r'^[A-Z0-9\-]+$', next_text):
+                        if _RE_MODEL_TOKEN.fullmatch(next_text):
                             result['model'] = {
                                 'value': next_text,
                                 'name': '型号规格'
@@ -807,16 +1192,8 @@ class OCRService:
         # 新增：查找表格中的型号（如"显示触控一体机"后的型号）
         if 'model' not in result:
             # 在全文查找特定产品名称后的型号
-            table_model_patterns = [
-                r'显示触控一体机\s*[\s:：]*([A-Z0-9\-]+)',
-                r'(?:部件名称|名称)[\s\S]*?显示触控一体机[\s\S]*?(?:规格型号|型号)[\s:：]*([A-Z0-9\-]+)',
-                r'显示触控一体机.*?\n.*?([A-Z]{2,}-[A-Z0-9\-]+)',
-                # 支持数字-数字格式的型号（如80-0000001）
-                r'显示触控一体机\s*[\s:：]*(\d+[\-\.]\d+)',
-                r'(?:规格型号|型号|规格)[\s:：]*(\d{2,}[\-\.]\d+)',
-            ]
-            for pattern in table_model_patterns:
-                match = re.search(pattern, full_text, re.IGNORECASE | re.MULTILINE)
+            for regex in _TABLE_MODEL_PATTERNS:
+                match = regex.search(full_text)
                 if match:
                     result['model'] = {
                         'value': match.group(1).strip(),
@@ -829,7 +1206,7 @@ class OCRService:
             # 查找符合型号格式的文本
             for text in texts:
                 # 匹配 ENGX-XXX-XXX 格式
-                model_match = re.search(r'\b(ENGX-[A-Z0-9\-]+)\b', text)
+                model_match = _RE_ENGX_MODEL.search(text)
                 if model_match:
                     result['model'] = {
                         'value': model_match.group(1),
@@ -839,16 +1216,13 @@ class OCRService:
 
         # 查找独立的日期（格式：YYYY-MM-DD）
         if 'production_date' not in result:
-            date_pattern = r'\b(20\d{2}[-./](0[1-9]|1[0-2])[-./](0[1-9]|[12]\d|3[01]))\b'
-            dates = re.findall(date_pattern, combined_text)
-            if dates:
-                # 取第一个找到的日期
-                date_match = re.search(date_pattern, combined_text)
-                if date_match:
-                    result['production_date'] = {
-                        'value': date_match.group(1).replace('/', '-').replace('.', '-'),
-                        'name': '生产日期'
-                    }
+            # 取第一个找到的日期
+            date_match = _RE_STANDALONE_DATE.search(combined_text)
+            if date_match:
+                result['production_date'] = {
+                    'value': date_match.group(1).replace('/', '-').replace('.', '-'),
+                    'name': '生产日期'
+                }
 
         # 查找表格中的序列号（如G250030、RC250030等格式）
         # 这些通常出现在"批号/序列号"列中
@@ -858,25 +1232,8 @@ class OCRService:
             if 'model' in result:
                 known_model_value = result['model'].get('value', '').upper()
 
-            # 匹配常见的序列号格式：
-            # 1. 字母+数字（如G250030, RC250030, LC250030）
-            # 2. 字母-数字格式（如OT3-250030）
-            # 3. 表格布局：批号/序列号列后的值
-            serial_patterns = [
-                # 表格布局：批号/序列号标题后，换行，然后是字母开头的序列号
-                r'批号[/／]序列号[^\n]*\n+\s*([A-Z]\w+)\s*\n',  # 批号/序列号后跟字母开头的值
-                r'批号[/／]序列号[^\n]*\n+\s*([A-Z]{2,3}\d{4,})\s*\n',  # 2-3字母+数字（如RC250030）
-                r'批号[/／]序列号[^\n]*\n+\s*([A-Z]\d{2,}-\d{4,})\s*\n',  # 字母+数字-数字（如OT3-250030）
-                # 通用模式
-                r'(?:批号[/／]序列号|序列号)[\s:：]*\n?\s*([A-Z]\d{4,})',  # 序列号后跟字母+数字
-                r'(?:批号[/／]序列号|序列号)[\s:：]*\n?\s*([A-Z]{2,3}\d{4,})',  # 2-3字母+数字
-                r'(?:批号[/／]序列号|序列号)[\s:：]*\n?\s*([A-Z]\d{2,}-\d{4,})',  # 字母+数字-数字
-                # 独立的序列号格式（在表格上下文中）
-                r'\b([A-Z]\d{6})\b',  # 独立的字母+6位数字（如G250030）
-                r'\b([A-Z]{2,3}\d{6})\b',  # 独立的2-3字母+6位数字（如RC250030）
-            ]
-            for pattern in serial_patterns:
-                match = re.search(pattern, full_text, re.IGNORECASE | re.MULTILINE)
+            for regex in _SERIAL_TABLE_PATTERNS:
+                match = regex.search(full_text)
                 if match:
                     serial_value = match.group(1).strip()
                     # 验证不是UDI编号
@@ -884,30 +1241,39 @@ class OCRService:
                         continue
                     # 验证不是已提取的规格型号值（防止字段错位）
                     if known_model_value and serial_value.upper() == known_model_value:
-                        print(f"[OCR] 序列号提取：跳过与规格型号相同的值 '{serial_value}'")
+                        logger.debug("序列号提取：跳过与规格型号相同的值 '%s'", serial_value)
                         continue
                     # 检查该值在原文中是否紧跟在「规格型号」标签后（再次防止字段错位）
                     model_label_pattern = r'(?:规格型号|型号规格|型号|规格)[：:\s]*' + re.escape(serial_value)
                     if re.search(model_label_pattern, full_text, re.IGNORECASE):
-                        print(f"[OCR] 序列号提取：'{serial_value}' 实际属于规格型号字段，跳过")
+                        logger.debug("序列号提取：'%s' 实际属于规格型号字段，跳过", serial_value)
                         continue
                     result['serial_number'] = {
                         'value': serial_value,
                         'name': '序列号'
                     }
-                    print(f"[OCR] 从表格中提取序列号: {serial_value}")
+                    logger.debug("从表格中提取序列号: %s", serial_value)
                     break
 
         # 处理条形码标识符格式 (11), (17), (21)等
         # 检查是否在combined_text中
         # 注意：明确排除 (01) - 这是UDI编号，不应被用作序列号/批号
-        barcode_pattern = r'\((\d{2})\)\s*([A-Z0-9]+)'
-        for ai_code, value in re.findall(barcode_pattern, combined_text):
+        ai_hits = self._collect_gs1_ai_hits(combined_text)
+        for ai_code, values in ai_hits.items():
             # 跳过UDI编号 (01)
             if ai_code == '01':
                 continue
             field_key = self.BARCODE_AI_MAPPING.get(ai_code)
-            if field_key and field_key not in result:
+            if not field_key:
+                continue
+            for value in values:
+                if field_key in result:
+                    break
+                # 字段值只取大写字母数字部分
+                value_match = _RE_UPPER_ALNUM.match(value)
+                if not value_match:
+                    continue
+                value = value_match.group()
                 # 验证序列号格式：不应是纯数字长串（如UDI编号）
                 if field_key == 'serial_number':
                     if value.isdigit() and len(value) >= 10:
@@ -928,14 +1294,28 @@ class OCRService:
 
         # 增强UDI编号检测：过滤纯数字长串（10位以上）
         # UDI编号通常是14位数字（如06977566650113）
-        result = self._filter_udis_from_result(result, combined_text)
+        result = self._filter_udis_from_result(result)
 
         # 优先使用GS1 (21)序列号
-        result = self._prioritize_gs21_serial(result, combined_text)
+        result = self._prioritize_gs21_serial(result, ai_hits)
 
         return result
 
-    def _filter_udis_from_result(self, result: Dict[str, Any], combined_text: str) -> Dict[str, Any]:
+    def _collect_gs1_ai_hits(self, text: str) -> Dict[str, List[str]]:
+        """
+        单次扫描文本，收集所有GS1数据标识符及其值
+        如 "(01)06977566650113(21)G250030" -> {'01': ['06977566650113'], '21': ['G250030']}
+        """
+        ai_hits: Dict[str, List[str]] = {}
+        if '(' not in text:
+            return ai_hits
+
+        for ai_code, value in _RE_GS1_AI.findall(text):
+            ai_hits.setdefault(ai_code, []).append(value)
+
+        return ai_hits
+
+    def _filter_udis_from_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """
         从结果中过滤掉UDI编号
         UDI编号特征：
@@ -943,16 +1323,17 @@ class OCRService:
         2. 以01开头的14位数字（如0106977566650113）
         3. 在OCR结果中被错误识别为序列号
         """
-        if 'serial_number' not in result:
+        serial = result.get('serial_number')
+        if serial is None:
             return result
 
-        serial_value = result['serial_number']['value']
+        serial_value = serial['value']
 
         # 检查是否为UDI编号特征
         if self._is_likely_udi(serial_value):
             # 移除这个错误的序列号
             del result['serial_number']
-            print(f"[OCR] 过滤掉疑似UDI编号: {serial_value}")
+            logger.debug("过滤掉疑似UDI编号: %s", serial_value)
 
         return result
 
@@ -963,51 +1344,49 @@ class OCRService:
         if not value:
             return False
 
-        # 纯数字且长度>=10（UDI通常是14位）
-        if value.isdigit() and len(value) >= 10:
-            return True
-
-        # 以01开头的14位数字（典型的GS1 UDI格式）
-        if value.isdigit() and len(value) == 14 and value.startswith('01'):
-            return True
+        # 纯数字且长度>=10（UDI通常是14位，含以01开头的GS1 UDI格式）
+        if value.isdigit():
+            return len(value) >= 10
 
         # 包含(01)标识符
-        if '(01)' in value or '01)' in value:
-            return True
+        return '01)' in value
 
-        return False
-
-    def _prioritize_gs21_serial(self, result: Dict[str, Any], combined_text: str) -> Dict[str, Any]:
+    def _prioritize_gs21_serial(self, result: Dict[str, Any], ai_hits: Dict[str, List[str]]) -> Dict[str, Any]:
         """
         优先使用GS1 (21)序列号
         当检测到(21)标签时，优先使用其值作为序列号
         即使(21)值有识别错误，也比UDI编号更接近真实值
+
+        Args:
+            result: 已提取的结构化字段
+            ai_hits: _collect_gs1_ai_hits 收集的数据标识符及其值
         """
         # 查找GS1 (21)序列号
-        gs21_pattern = r'\(21\)\s*([A-Z0-9]+)'
-        gs21_matches = re.findall(gs21_pattern, combined_text, re.IGNORECASE)
+        gs21_matches = ai_hits.get('21')
+        if not gs21_matches:
+            return result
 
-        if gs21_matches:
-            gs21_value = gs21_matches[0]
+        gs21_value = gs21_matches[0]
 
-            # 验证GS21值不是UDI编号
-            if not self._is_likely_udi(gs21_value):
-                # 如果当前没有序列号，或者当前序列号是UDI编号，则使用GS21值
-                if 'serial_number' not in result or self._is_likely_udi(result['serial_number']['value']):
-                    result['serial_number'] = {
-                        'value': gs21_value,
-                        'name': '序列号'
-                    }
-                    print(f"[OCR] 使用GS1 (21)序列号: {gs21_value}")
-            else:
-                # GS21值本身可能是误识别的UDI，尝试清理
-                cleaned_value = self._clean_gs21_value(gs21_value)
-                if cleaned_value and cleaned_value != gs21_value:
-                    result['serial_number'] = {
-                        'value': cleaned_value,
-                        'name': '序列号'
-                    }
-                    print(f"[OCR] 使用清理后的GS1 (21)序列号: {cleaned_value}")
+        # 验证GS21值不是UDI编号
+        if not self._is_likely_udi(gs21_value):
+            # 如果当前没有序列号，或者当前序列号是UDI编号，则使用GS21值
+            serial = result.get('serial_number')
+            if serial is None or self._is_likely_udi(serial['value']):
+                result['serial_number'] = {
+                    'value': gs21_value,
+                    'name': '序列号'
+                }
+                logger.debug("使用GS1 (21)序列号: %s", gs21_value)
+        else:
+            # GS21值本身可能是误识别的UDI，尝试清理
+            cleaned_value = self._clean_gs21_value(gs21_value)
+            if cleaned_value and cleaned_value != gs21_value:
+                result['serial_number'] = {
+                    'value': cleaned_value,
+                    'name': '序列号'
+                }
+                logger.debug("使用清理后的GS1 (21)序列号: %s", cleaned_value)
 
         return result
 
@@ -1027,7 +1406,7 @@ class OCRService:
                 # 对于6开头的7位数字（如6250015），校正为G+后6位
                 # 因为G250030被识别为6250015，6->G, 250030->250015（部分错误）
                 corrected = 'G' + value[1:]
-                print(f"[OCR] 序列号校正: {value} -> {corrected}")
+                logger.debug("序列号校正: %s -> %s", value, corrected)
                 return corrected
 
             # 其他可能的校正规则
@@ -1050,9 +1429,10 @@ class OCRService:
 
         # 首先尝试提取日期中的数字部分
         original_value = value
+        is_ascii_digits = value.isascii() and value.isdigit()
 
         # 处理6位数字（YYMMDD格式）
-        if re.match(r'^\d{6}$', value):
+        if is_ascii_digits and len(value) == 6:
             year = value[0:2]
             month = value[2:4]
             day = value[4:6]
@@ -1068,7 +1448,7 @@ class OCRService:
             return f"{full_year}-{month}-{day}"
 
         # 处理8位数字（YYYYMMDD格式）
-        if re.match(r'^\d{8}$', value):
+        if is_ascii_digits and len(value) == 8:
             year = value[0:4]
             month = value[4:6]
             day = value[6:8]
@@ -1080,9 +1460,13 @@ class OCRService:
 
             return f"{year}-{month}-{day}"
 
+        # 快速预判：标准日期格式的第5个字符必为分隔符（纯数字等输入直接返回），
+        # 否则既不会匹配标准格式，也不会被OCR校正改变
+        if len(value) < 8 or value[4] not in _DATE_SEPARATORS:
+            return value
+
         # 处理标准日期格式（yyyy-mm-dd, yyyy/mm/dd, yyyy年mm月dd日等）
-        date_pattern = r'^(\d{4})[-./年](\d{1,2})[-./月](\d{1,2})日?$'
-        match = re.match(date_pattern, value)
+        match = _RE_DATE_FULL.fullmatch(value)
         if match:
             year = match.group(1)
             month = match.group(2).zfill(2)  # 补零
@@ -1116,11 +1500,10 @@ class OCRService:
         Returns:
             校正后的日期字符串（YYYY-MM-DD格式），如果无法校正则返回None
         """
-        try:
-            year_int = int(year)
-            month_int = int(month)
-            day_int = int(day)
-        except (ValueError, TypeError):
+        year_int = _as_int(year)
+        month_int = _as_int(month)
+        day_int = _as_int(day)
+        if year_int is None or month_int is None or day_int is None:
             return None
 
         # 检查月份有效性
@@ -1129,7 +1512,6 @@ class OCRService:
             corrected_month = self._correct_month_value(month_int, original_value)
             if corrected_month is not None:
                 month_int = corrected_month
-                month = str(corrected_month).zfill(2)
             else:
                 # 无法校正，返回None让调用者处理
                 return None
@@ -1141,122 +1523,44 @@ class OCRService:
             corrected_day = self._correct_day_value(day_int, max_day, original_value)
             if corrected_day is not None:
                 day_int = corrected_day
-                day = str(corrected_day).zfill(2)
             else:
                 return None
 
         # 返回标准化格式
-        return f"{year_int}-{str(month_int).zfill(2)}-{str(day_int).zfill(2)}"
+        return "%d-%02d-%02d" % (year_int, month_int, day_int)
 
     def _correct_month_value(self, month_int: int, original_value: str = None) -> Optional[int]:
         """
         校正月份值（处理OCR识别错误）
 
-        常见错误模式：
-        - 10被识别为15（1->1, 0->5）
-        - 11被识别为17
-        - 12被识别为18
-        - 01被识别为05
+        校正规则见 _build_month_correction_table，此处为查表
         """
-        # 常见OCR混淆映射
-        # 15 -> 10 (1-5混淆，0-5混淆)
-        if month_int == 15:
-            return 10
-
-        # 17 -> 11
-        if month_int == 17:
-            return 11
-
-        # 18 -> 12
-        if month_int == 18:
-            return 12
-
-        # 05 -> 01 或 06
+        # 05 -> 01：原始值包含"01"或看起来像1月
         if month_int == 5:
-            # 如果原始值包含"01"或看起来像1月
             if original_value and ('01' in original_value or '1月' in original_value):
                 return 1
-            # 否则可能是5月或6月，优先尝试6（如果日期较大）
             return None
 
-        # 如果月份>12，尝试找出最接近的有效月份
-        if month_int > 12:
-            # 检查是否是数字混淆（如22可能是12，33可能是03等）
-            month_str = str(month_int)
-
-            # 两位数月份，尝试替换第一位
-            if len(month_str) == 2:
-                first_digit = month_str[0]
-                second_digit = month_str[1]
-
-                # 尝试可能的有效月份
-                candidates = []
-
-                # 尝试将第一位改为0或1
-                if first_digit in '23456789':
-                    # 可能是0或1被误识别
-                    for replacement in ['0', '1']:
-                        try_month = int(replacement + second_digit)
-                        if 1 <= try_month <= 12:
-                            candidates.append(try_month)
-
-                # 尝试将第二位改为0-9中的合理值
-                if second_digit in '56789':
-                    # 可能是0-4被误识别为5-9
-                    for replacement in ['0', '1', '2']:
-                        try_month = int(first_digit + replacement)
-                        if 1 <= try_month <= 12:
-                            candidates.append(try_month)
-
-                if candidates:
-                    # 返回最小的有效月份（最保守的选择）
-                    return min(candidates)
-
-        return None
+        return _MONTH_CORRECTION.get(month_int)
 
     def _correct_day_value(self, day_int: int, max_day: int, original_value: str = None) -> Optional[int]:
         """
         校正日期值
-        """
-        if day_int > max_day:
-            # 尝试常见的OCR混淆
-            day_str = str(day_int)
-
-            # 两位数日期
-            if len(day_str) == 2:
-                first_digit = day_str[0]
-                second_digit = day_str[1]
-
-                # 尝试将第一位减小（如35->25->15->05）
-                candidates = []
-                for replacement in ['0', '1', '2']:
-                    if replacement <= first_digit:
-                        try_day = int(replacement + second_digit)
-                        if 1 <= try_day <= max_day:
-                            candidates.append(try_day)
-
-                if candidates:
-                    return max(candidates)  # 返回最大的有效日期
-
-            # 如果日期太大，可能是月份和日期颠倒了
-            # 这种情况在外层处理
 
-        return None
+        校正规则见 _build_day_correction_table，此处为查表
+        如果日期太大，可能是月份和日期颠倒了，这种情况在外层处理
+        """
+        return _DAY_CORRECTION.get((day_int, max_day))
 
     def _get_days_in_month(self, year: int, month: int) -> int:
         """
         获取指定月份的天数
         """
-        if month in [1, 3, 5, 7, 8, 10, 12]:
-            return 31
-        elif month in [4, 6, 9, 11]:
-            return 30
-        elif month == 2:
-            # 闰年判断
-            if (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0):
-                return 29
-            return 28
-        return 31  # 默认
+        if not 1 <= month <= 12:
+            return 31  # 默认
+        if month == 2 and calendar.isleap(year):
+            return 29
+        return _DAYS_IN_MONTH[month]
 
     def _correct_date_ocr_confusion(self, value: str) -> str:
         """
@@ -1270,9 +1574,12 @@ class OCRService:
         if not value:
             return value
 
+        # 快速预判：没有日期分隔符时无需正则匹配
+        if len(value) < 8 or value[4] not in _DATE_SEPARATORS:
+            return value
+
         # 匹配日期格式中的数字部分
-        date_pattern = r'^(\d{4})[-./年](\d{1,2})[-./月](\d{1,2})日?$'
-        match = re.match(date_pattern, value)
+        match = _RE_DATE_FULL.fullmatch(value)
 
         if not match:
             return value
@@ -1285,18 +1592,8 @@ class OCRService:
         corrected_month = self._correct_date_digits(month, is_month=True)
         corrected_day = self._correct_date_digits(day, is_month=False)
 
-        # 重建日期字符串（保持原分隔符）
-        separator1 = value[4] if len(value) > 4 and value[4] in '-./年' else '-'
-        separator2_idx = 4 + len(month) + 1
-        separator2 = value[separator2_idx] if len(value) > separator2_idx and value[separator2_idx] in '-./月' else '-'
-
-        corrected = f"{year}{separator1}{corrected_month}{separator2}{corrected_day}"
-
-        # 如果末尾有"日"，保留它
-        if value.endswith('日'):
-            corrected += '日'
-
-        return corrected
+        # 统一以"-"重建日期字符串（_normalize_date_value 最终也输出YYYY-MM-DD）
+        return f"{year}-{corrected_month}-{corrected_day}"
 
     def _correct_date_digits(self, digits: str, is_month: bool = False) -> str:
         """
@@ -1306,33 +1603,9 @@ class OCRService:
             digits: 数字字符串（如"15"）
             is_month: 是否是月份（用于特殊处理）
         """
-        if not digits or len(digits) > 2:
-            return digits
-
-        # 如果是月份且值>12，尝试校正
+        # 仅对>12的两位月份进行校正，规则见 _build_month_digits_correction_table
         if is_month:
-            try:
-                val = int(digits)
-                if val > 12:
-                    # 15 -> 10 (0被识别为5)
-                    if val == 15:
-                        return '10'
-                    # 17 -> 11
-                    if val == 17:
-                        return '11'
-                    # 18 -> 12
-                    if val == 18:
-                        return '12'
-                    # 其他情况：尝试将第一位改为0或1
-                    if len(digits) == 2:
-                        second = digits[1]
-                        # 尝试0x和1x
-                        for first in ['0', '1']:
-                            try_val = int(first + second)
-                            if 1 <= try_val <= 12:
-                                return f"{first}{second}"
-            except ValueError:
-                pass
+            return _MONTH_DIGITS_CORRECTION.get(digits, digits)
 
         return digits
 
@@ -1343,16 +1616,7 @@ class OCRService:
 
         # 型号字段清洗
         if field_key == 'model':
-            # 注意：顺序很重要，更具体的模式应该放在前面
-            prefixes = [
-                r'^型号规格[：:\s]*',  # 先匹配更长的
-                r'^规格型号[：:\s]*',  # 先匹配更长的
-                r'^规格[：:\s]*',
-                r'^型号[：:\s]*',
-                r'^REF[：:\s]*',
-            ]
-            for prefix in prefixes:
-                value = re.sub(prefix, '', value, flags=re.IGNORECASE)
+            value = _RE_MODEL_PREFIX.sub('', value, count=1)
 
             # OCR字符校正：修正易混淆字符
             value = self._correct_ocr_confusion(value)
@@ -1367,6 +1631,10 @@ class OCRService:
         if not value:
             return value
 
+        # 绝大多数型号不含O/o，无需拆分逐字检查
+        if 'O' not in value and 'o' not in value:
+            return value
+
         # 对于型号字段，应用特定的校正规则
         # 1. 在数字位置（通常是型号的最后几位）将O/o替换为0
         # 型号格式通常是：XXX-XXX-XXXX（最后部分是数字）
@@ -1376,40 +1644,34 @@ class OCRService:
             # 处理最后一部分（通常是纯数字或数字+字母组合）
             last_part = parts[-1]
 
-            # 在最后一部分中，将可能是数字位置的O/o替换为0
-            # 策略：如果O/o后面跟着数字，或者前面是字母且整体长度较短，则可能是0
-            corrected_last = []
-            for i, char in enumerate(last_part):
-                if char.upper() == 'O':
-                    # 判断是否应该替换为0
-                    # 规则1：如果O在数字中间或末尾，且前后都是数字
-                    # 规则2：如果O在短字符串中（如PCO1 -> PC01）
-                    should_be_zero = False
-
-                    # 检查上下文
-                    prev_is_digit = i > 0 and last_part[i-1].isdigit()
-                    next_is_digit = i < len(last_part) - 1 and last_part[i+1].isdigit()
-
-                    if prev_is_digit or next_is_digit:
-                        should_be_zero = True
-                    elif len(last_part) <= 4:
-                        # 短代码中，O很可能是0
-                        should_be_zero = True
-
-                    if should_be_zero:
-                        corrected_last.append('0')
-                    else:
-                        corrected_last.append(char)
-                else:
+            # 最后一部分没有O/o时无需校正
+            if 'O' not in last_part and 'o' not in last_part:
+                return value
+
+            if len(last_part) <= 4:
+                # 短代码中，O很可能是0（如PCO1 -> PC01）
+                last_part = last_part.translate(_O_TO_ZERO)
+            else:
+                # 在最后一部分中，将可能是数字位置的O/o替换为0
+                # 规则：O/o前一位或后一位是数字（按原始字符判断）
+                corrected_last = []
+                for i, char in enumerate(last_part):
+                    if char in 'Oo':
+                        prev_is_digit = i > 0 and last_part[i-1].isdigit()
+                        next_is_digit = i < len(last_part) - 1 and last_part[i+1].isdigit()
+                        if prev_is_digit or next_is_digit:
+                            char = '0'
                     corrected_last.append(char)
+                last_part = ''.join(corrected_last)
 
-            parts[-1] = ''.join(corrected_last)
+            parts[-1] = last_part
             value = '-'.join(parts)
 
         return value
 
     def recognize_label(self, image_path: str, expected_fields: List[str] = None,
-                       use_vision_llm: Optional[bool] = None) -> OCRResult:
+                       use_vision_llm: Optional[bool] = None,
+                       image_data: Optional[bytes] = None) -> OCRResult:
         """
         专门用于识别中文标签
         可以指定期望的字段列表进行针对性提取
@@ -1418,8 +1680,9 @@ class OCRService:
             image_path: 图片路径
             expected_fields: 期望提取的字段列表
             use_vision_llm: 是否使用视觉大模型OCR（覆盖初始化设置）
+            image_data: 图片文件内容（已在内存中时提供，不再读取文件）
         """
-        result = self.recognize_image(image_path, use_vision_llm=use_vision_llm)
+        result = self.recognize_image(image_path, use_vision_llm=use_vision_llm, image_data=image_data)
 
         # 如果指定了期望字段，进行额外处理
         if expected_fields:
@@ -1445,8 +1708,11 @@ class OCRService:
 
         if field_key and field_key in self.FIELD_PATTERNS:
             field_config = self.FIELD_PATTERNS[field_key]
-            for pattern in field_config['patterns']:
-                matches = re.findall(pattern, text, re.MULTILINE | re.IGNORECASE)
+            text_upper = text.upper()
+            for regex, keywords in zip(self._FIELD_REGEXES[field_key], field_config['keywords']):
+                if keywords and not any(kw in text_upper for kw in keywords):
+                    continue
+                matches = regex.findall(text)
                 if matches:
                     value = matches[0]
                     if isinstance(value, tuple):
@@ -1463,16 +1729,22 @@ class OCRService:
 
         return None
 
-    def _find_field_key_by_name(self, name: str) -> Optional[str]:
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _find_field_key_by_name(cls, name: str) -> Optional[str]:
         """
-        根据字段名查找字段key
+        根据字段名查找字段key（字段名词汇有限，结果缓存）
         """
-        name_lower = name.replace(' ', '').replace('　', '').lower()
+        name_lower = _normalize_field_name(name)
 
         # 直接名称映射
-        for key, config in self.FIELD_PATTERNS.items():
-            config_name = config['name'].replace(' ', '').replace('　', '').lower()
-            if config_name == name_lower or config_name in name_lower or name_lower in config_name:
+        key = cls._NORMALIZED_NAME_TO_KEY.get(name_lower)
+        if key is not None:
+            return key
+
+        # 包含关系匹配
+        for config_name, key in cls._NORMALIZED_NAME_TO_KEY.items():
+            if config_name in name_lower or name_lower in config_name:
                 return key
 
         return None
@@ -1536,34 +1808,23 @@ class OCRService:
 
         return value
 
-    def _field_names_match(self, name1: str, name2: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _field_names_match(name1: str, name2: str) -> bool:
         """
-        判断两个字段名是否匹配（处理同义词）
+        判断两个字段名是否匹配（处理同义词，结果缓存）
         """
         # 清理并标准化
-        n1 = name1.replace(' ', '').replace('　', '').lower()
-        n2 = name2.replace(' ', '').replace('　', '').lower()
+        n1 = _normalize_field_name(name1)
+        n2 = _normalize_field_name(name2)
 
         # 直接匹配
         if n1 == n2:
             return True
 
-        # 同义词映射
-        synonyms = {
-            '批号': ['批号', 'lot', 'batch', 'batchno', 'lotno'],
-            '序列号': ['序列号', 'sn', 's/n', 'serial', 'serialno'],
-            '生产日期': ['生产日期', 'mfg', 'mfd', 'manufacturedate', 'productiondate'],
-            '失效日期': ['失效日期', '有效期至', 'exp', 'expiry', 'expirationdate'],
-            '型号规格': ['型号规格', '规格型号', '型号', '规格', 'model', 'specification'],
-            '产品名称': ['产品名称', '名称', 'productname', 'name'],
-        }
-
         # 检查是否属于同一组同义词
-        for group in synonyms.values():
-            if n1 in group and n2 in group:
-                return True
-
-        return False
+        group = _SYNONYM_INDEX.get(n1)
+        return group is not None and n2 in group
 
     def extract_model_from_pdf_table(self, pdf_path: str, page_num: int, product_name_hint: str = None) -> Optional[Dict[str, str]]:
         """
@@ -1578,92 +1839,119 @@ class OCRService:
         Returns:
             包含型号的字典，如果未找到则返回None
         """
-        import fitz
+        # 使用更高DPI（400）渲染以获得更好的OCR效果，直接使用原始像素（不经PNG编解码）
+        img = _render_page(pdf_path, page_num)
 
-        doc = fitz.open(pdf_path)
-        page = doc[page_num - 1]
+        # OCR识别
+        self._ensure_ocr()
+        return self._extract_model_from_table_image(img, product_name_hint)
 
-        # 使用更高DPI渲染以获得更好的OCR效果
-        zoom = 400 / 72
-        mat = fitz.Matrix(zoom, zoom)
-        pix = page.get_pixmap(matrix=mat, alpha=False)
+    def extract_models_from_pdf_tables(self, pdf_path: str, page_nums: List[int],
+                                       product_name_hint: str = None,
+                                       max_workers: Optional[int] = None) -> Dict[int, Optional[Dict[str, str]]]:
+        """
+        批量从多个PDF表格页面中提取型号
 
-        # 转换为OpenCV格式
-        img_data = np.frombuffer(pix.tobytes("png"), np.uint8)
-        img = cv2.imdecode(img_data, cv2.IMREAD_COLOR)
+        页面渲染在线程池中并发执行（PyMuPDF渲染会释放GIL），
+        OCR识别按页码顺序在当前线程执行（PaddleOCR实例不保证线程安全）。
+        同时最多保留max_workers页已渲染未识别的图像，限制内存占用。
 
-        doc.close()
+        Args:
+            pdf_path: PDF文件路径
+            page_nums: 页码列表（从1开始）
+            product_name_hint: 产品名称提示（如"显示触控一体机"）
+            max_workers: 渲染线程数，默认为CPU核数
 
-        # OCR识别
+        Returns:
+            页码 -> 型号字典（未找到为None）
+        """
         self._ensure_ocr()
-        result = self.ocr.ocr(img, cls=True)
 
-        # 收集所有文本块及其位置信息
-        text_blocks = []
+        workers = max_workers or os.cpu_count() or 1
+        results = {}
+        page_iter = iter(page_nums)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque(
+                (page_num, executor.submit(_render_page, pdf_path, page_num))
+                for page_num in islice(page_iter, workers)
+            )
+            while pending:
+                page_num, future = pending.popleft()
+                results[page_num] = self._extract_model_from_table_image(future.result(), product_name_hint)
+                # 当前页识别完成、图像释放后再提交下一页，保证已渲染未识别的页不超过workers
+                next_page = next(page_iter, None)
+                if next_page is not None:
+                    pending.append((next_page, executor.submit(_render_page, pdf_path, next_page)))
+
+        return results
+
+    def _extract_model_from_table_image(self, img: np.ndarray,
+                                        product_name_hint: str = None) -> Optional[Dict[str, str]]:
+        """
+        对已渲染的表格页面图像进行OCR并提取型号
+        """
+        result = self._run_ocr(img)
+
+        # 收集所有文本块及其位置信息（按列存储：文本、置信度、中心点坐标）
+        texts = []
+        confidences = []
+        centers_x = []
+        centers_y = []
         if result and result[0]:
             for line in result[0]:
                 if line:
                     bbox = line[0]  # 边界框 [[x1,y1], [x2,y1], [x2,y2], [x1,y2]]
-                    text = line[1][0]  # 文本
-                    confidence = line[1][1]  # 置信度
+                    texts.append(line[1][0])  # 文本
+                    confidences.append(line[1][1])  # 置信度
 
                     # 计算中心点
-                    center_x = (bbox[0][0] + bbox[2][0]) / 2
-                    center_y = (bbox[0][1] + bbox[2][1]) / 2
+                    centers_x.append((bbox[0][0] + bbox[2][0]) / 2)
+                    centers_y.append((bbox[0][1] + bbox[2][1]) / 2)
 
-                    text_blocks.append({
-                        'text': text,
-                        'bbox': bbox,
-                        'center': (center_x, center_y),
-                        'confidence': confidence
-                    })
+        cx = np.asarray(centers_x, dtype=np.float64)
+        cy = np.asarray(centers_y, dtype=np.float64)
 
         # 如果提供了产品名称提示，尝试在表格中查找对应行
         if product_name_hint:
-            for i, block in enumerate(text_blocks):
-                if product_name_hint in block['text']:
-                    # 找到了产品名称，在其右侧或下方查找型号
-                    product_center = block['center']
-
-                    # 查找右侧的文本块（表格布局：型号在右侧列）
-                    right_blocks = [
-                        b for b in text_blocks
-                        if b['center'][0] > product_center[0] + 50  # 右侧50像素以上
-                        and abs(b['center'][1] - product_center[1]) < 100  # 垂直方向接近
-                    ]
-
-                    # 按x坐标排序，取最左边的（即产品名称右侧最近的）
-                    right_blocks.sort(key=lambda b: b['center'][0])
-
-                    for candidate in right_blocks:
+            for i, text in enumerate(texts):
+                if product_name_hint in text:
+                    # 找到了产品名称，在其右侧查找型号（表格布局：型号在右侧列）
+                    mask = (cx > cx[i] + 50) & (np.abs(cy - cy[i]) < 100)  # 右侧50像素以上，垂直方向接近
+                    right_idx = np.flatnonzero(mask)
+
+                    # 按x坐标从左到右检查（即从产品名称右侧最近的开始）
+                    for k in _iter_nearest_first(cx[right_idx]):
+                        j = right_idx[k]
+                        candidate_text = texts[j].strip()
                         # 检查是否符合型号格式
-                        if re.match(r'^[A-Z]{2,}-[A-Z0-9\-]+$', candidate['text'].strip()):
+                        if _RE_MODEL_TABLE_CELL.fullmatch(candidate_text):
                             return {
-                                'value': candidate['text'].strip(),
+                                'value': candidate_text,
                                 'name': '型号规格',
-                                'confidence': candidate['confidence']
+                                'confidence': confidences[j]
                             }
 
         # 如果没有找到，尝试查找所有符合型号格式的文本
-        for block in text_blocks:
-            text = block['text'].strip()
+        for text, confidence in zip(texts, confidences):
+            text = text.strip()
             # 匹配常见型号格式：ENGX-XXX-XXX 或类似格式
-            if re.match(r'^[A-Z]{2,4}-[A-Z0-9\-]+$', text):
+            if _RE_MODEL_1.fullmatch(text):
                 # 排除可能是其他内容的（如日期、纯数字等）
-                if not re.match(r'^\d{4}-\d{2}$', text):  # 排除年月格式如2024-01
+                if not _RE_YEARMONTH.fullmatch(text):  # 排除年月格式如2024-01
                     return {
                         'value': text,
                         'name': '型号规格',
-                        'confidence': block['confidence']
+                        'confidence': confidence
                     }
             # 支持数字-数字格式的型号（如80-0000001）
-            if re.match(r'^\d{2,}[\-\.]\d+$', text):
+            if _RE_MODEL_2.fullmatch(text):
                 # 排除日期格式
-                if not re.match(r'^\d{4}-\d{2}-\d{2}$', text) and not re.match(r'^\d{4}-\d{2}$', text):
+                if not _RE_DATE_YMD.fullmatch(text) and not _RE_YEARMONTH.fullmatch(text):
                     return {
                         'value': text,
                         'name': '型号规格',
-                        'confidence': block['confidence']
+                        'confidence': confidence
                     }
 
         return None
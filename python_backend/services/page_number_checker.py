@@ -8,12 +8,11 @@
   3. 所有页的XXX值必须相同
 """
 
-import re
-import fitz  # PyMuPDF
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 from models.schemas import ErrorItem, PageInfo
+from services.pdf_parser import PAGE_NUMBER_PATTERN, _WS_DELETE
 
 
 @dataclass
@@ -29,9 +28,7 @@ class PageNumberChecker:
     """页码连续性校验器"""
 
     # 页码正则模式：匹配 "共XXX页 第Y页" 格式
-    PAGE_NUMBER_PATTERN = re.compile(
-        r'共\s*(\d+)\s*页\s*第\s*(\d+)\s*页'
-    )
+    PAGE_NUMBER_PATTERN = PAGE_NUMBER_PATTERN
 
     # 错误代码定义
     ERROR_CODES = {
@@ -46,48 +43,77 @@ class PageNumberChecker:
     def check_page_numbers(
         self,
         pdf_path: str,
-        pages: List[PageInfo]
+        pages: List[PageInfo],
+        max_consecutive_misses: Optional[int] = None
     ) -> Tuple[List[PageNumberInfo], List[ErrorItem]]:
         """
         执行页码连续性校验
 
+        页码文本已在PDF解析时随页面一并提取（PageInfo.page_number_raw），无需再次打开文档
+
         Args:
             pdf_path: PDF文件路径
             pages: 页面信息列表
+            max_consecutive_misses: 连续多少页未找到页码后停止提取（如报告正文后的附录页），
+                为None时检查到最后一页
 
         Returns:
             Tuple[List[PageNumberInfo], List[ErrorItem]]: (页码信息列表, 错误列表)
         """
+        # 1-2. 定位第三页并提取其后所有页码
+        page_number_infos = self._extract_page_number_infos(pages, max_consecutive_misses)
+
+        if not page_number_infos:
+            return [], []
+
+        # 3. 校验页码连续性
+        errors = self._validate_page_numbers(page_number_infos)
+
+        return page_number_infos, errors
+
+    def _extract_page_number_infos(
+        self,
+        pages: List[PageInfo],
+        max_consecutive_misses: Optional[int] = None
+    ) -> List[PageNumberInfo]:
+        """
+        仅提取页码信息（不做校验）：从第三页（检验报告首页）开始的所有页码
+
+        Args:
+            pages: 页面信息列表
+            max_consecutive_misses: 连续多少页未找到页码后停止提取，为None时不提前停止
+
+        Returns:
+            页码信息列表，未找到第三页时为空
+        """
         # 1. 定位第三页（检验报告首页）
         start_page_idx = self._find_third_page_index(pages)
 
         if start_page_idx is None:
-            return [], []
+            return []
 
         # 2. 提取从第三页开始的所有页码
         page_number_infos = []
-        doc = fitz.open(pdf_path)
-
-        try:
-            for i in range(start_page_idx, len(pages)):
-                page_info = pages[i]
-                page = doc[page_info.page_num - 1]  # 0-based index
+        consecutive_misses = 0
 
-                # 提取右上角页码
-                page_number_info = self._extract_page_number(
-                    page, page_info.page_num
-                )
+        for i in range(start_page_idx, len(pages)):
+            page_info = pages[i]
 
-                if page_number_info:
-                    page_number_infos.append(page_number_info)
-
-        finally:
-            doc.close()
+            # 解析右上角页码
+            page_number_info = self._extract_page_number(
+                page_info.page_number_raw, page_info.page_num
+            )
 
-        # 3. 校验页码连续性
-        errors = self._validate_page_numbers(page_number_infos)
+            if page_number_info:
+                page_number_infos.append(page_number_info)
+                consecutive_misses = 0
+            else:
+                consecutive_misses += 1
+                # 连续多页没有页码，视为已离开报告正文
+                if max_consecutive_misses is not None and consecutive_misses >= max_consecutive_misses:
+                    break
 
-        return page_number_infos, errors
+        return page_number_infos
 
     def _find_third_page_index(self, pages: List[PageInfo]) -> Optional[int]:
         """
@@ -96,41 +122,28 @@ class PageNumberChecker:
         Returns:
             第三页的索引（0-based），如果未找到则返回None
         """
-        for idx, page in enumerate(pages):
-            if page.page_header:
-                # 清理空白字符进行匹配
-                cleaned_header = re.sub(r'\s+', '', page.page_header)
-                if '检验报告首页' in cleaned_header:
-                    return idx
-        return None
+        # 清理空白字符进行匹配，命中第一页即停止
+        return next(
+            (idx for idx, page in enumerate(pages)
+             if page.page_header and '检验报告首页' in page.page_header.translate(_WS_DELETE)),
+            None
+        )
 
     def _extract_page_number(
         self,
-        page: Any,
+        text: Optional[str],
         page_num: int
     ) -> Optional[PageNumberInfo]:
         """
-        从页面右上角提取页码文本
+        从页面右上角的页码文本解析页码
 
         Args:
-            page: PyMuPDF页面对象
+            text: 右上角页码文本（PageInfo.page_number_raw）
             page_num: 页码（1-based）
 
         Returns:
             PageNumberInfo对象，如果未找到则返回None
         """
-        # 获取页面右上角区域（右上20%区域）
-        page_rect = page.rect
-        header_right_rect = fitz.Rect(
-            page_rect.x1 - page_rect.width * 0.5,  # 右侧50%宽度
-            page_rect.y0,                           # 顶部
-            page_rect.x1,                           # 右边界
-            page_rect.y0 + page_rect.height * 0.20  # 顶部20%高度
-        )
-
-        # 提取该区域文本
-        text = page.get_text("text", clip=header_right_rect)
-
         if not text:
             return None
 
@@ -259,7 +272,8 @@ class PageNumberChecker:
     def extract_page_number_info(
         self,
         pdf_path: str,
-        pages: List[PageInfo]
+        pages: List[PageInfo],
+        max_consecutive_misses: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         提取页码信息（用于外部调用）
@@ -267,18 +281,13 @@ class PageNumberChecker:
         Args:
             pdf_path: PDF文件路径
             pages: 页面信息列表
+            max_consecutive_misses: 连续多少页未找到页码后停止提取，为None时不提前停止
 
         Returns:
             页码信息字典列表
         """
-        page_number_infos, _ = self.check_page_numbers(pdf_path, pages)
-
+        # 只需页码信息，跳过校验
         return [
-            {
-                'page_num': info.page_num,
-                'total_pages': info.total_pages,
-                'current_page': info.current_page,
-                'raw_text': info.raw_text
-            }
-            for info in page_number_infos
+            dict(vars(info))
+            for info in self._extract_page_number_infos(pages, max_consecutive_misses)
         ]
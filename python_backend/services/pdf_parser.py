@@ -5,14 +5,154 @@ PDF解析服务
 - 定位特定页面
 """
 
+import atexit
 import fitz  # PyMuPDF
+import multiprocessing
+import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 import json
 
 from models.schemas import PageInfo, TableData
 
+# 图片压缩过滤器 -> 文件扩展名（与extract_image的ext一致，其余格式导出为png）
+_IMAGE_FILTER_EXT = (
+    ('DCTDecode', 'jpeg'),
+    ('JPXDecode', 'jpx'),
+    ('JBIG2Decode', 'jb2'),
+)
+
+# 页码正则模式：匹配 "共XXX页 第Y页" 格式
+PAGE_NUMBER_PATTERN = re.compile(
+    r'共\s*(\d+)\s*页\s*第\s*(\d+)\s*页'
+)
+
+# 空白字符删除表（与正则\s等价：所有str.isspace()字符，最大为U+3000全角空格）
+_WS_DELETE = dict.fromkeys(c for c in range(0x3001) if chr(c).isspace())
+
+# 并行解析：每个任务处理的连续页数，以及启用多进程的最少页数（至少拆分为两个任务）
+_PAGES_PER_TASK = 4
+_PARALLEL_MIN_PAGES = 2 * _PAGES_PER_TASK
+# 单个页段任务的最长等待秒数，超时则放弃并行改为顺序解析
+_PARSE_TASK_TIMEOUT = 120
+
+# 页面解析进程池（延迟创建，跨调用复用以避免重复启动进程）
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+# 已打开文档缓存：(路径, 修改时间) -> fitz.Document，供各检查器共享，避免重复解析xref与字体
+_DOC_CACHE_SIZE = 4
+_doc_cache = OrderedDict()
+_doc_cache_lock = threading.Lock()
+
+
+def _open_doc(pdf_path: str, mtime: Optional[float] = None) -> fitz.Document:
+    """
+    获取共享的已打开文档（按路径与修改时间缓存，文件变化后自动重新打开）
+
+    返回的文档由缓存统一管理，调用方不应关闭
+    """
+    if mtime is None:
+        mtime = os.path.getmtime(pdf_path)
+    key = (pdf_path, mtime)
+
+    with _doc_cache_lock:
+        doc = _doc_cache.get(key)
+        if doc is not None:
+            _doc_cache.move_to_end(key)
+            return doc
+
+        doc = fitz.open(pdf_path)
+        _doc_cache[key] = doc
+        # 淘汰最久未使用的文档并释放句柄
+        while len(_doc_cache) > _DOC_CACHE_SIZE:
+            _, evicted = _doc_cache.popitem(last=False)
+            evicted.close()
+        return doc
+
+
+def close_cached_docs(pdf_path: Optional[str] = None):
+    """
+    关闭缓存中的文档（删除或覆盖PDF文件前调用）
+
+    Args:
+        pdf_path: 仅关闭该路径的文档；为None时关闭全部
+    """
+    with _doc_cache_lock:
+        for key in [k for k in _doc_cache if pdf_path is None or k[0] == pdf_path]:
+            _doc_cache.pop(key).close()
+
+
+atexit.register(close_cached_docs)
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """
+    获取页面解析进程池
+
+    使用spawn方式启动子进程：服务进程中存在事件循环、OCR等线程，fork会复制其持有的锁而导致子进程死锁
+    """
+    global _process_pool
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+    return _process_pool
+
+
+def _reset_process_pool(pool: ProcessPoolExecutor):
+    """丢弃损坏或卡住的进程池，下次调用时重新创建"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _stream_length(doc: fitz.Document, xref: int) -> int:
+    """
+    获取对象数据流在PDF中存储的（压缩后）字节数
+
+    优先读取流字典的/Length键（可能为间接引用），不读取数据流本身；
+    /Length缺失或无法解析时才读取原始数据流计算长度
+    """
+    value_type, value = doc.xref_get_key(xref, 'Length')
+    try:
+        if value_type == 'int':
+            return int(value)
+        if value_type == 'xref':
+            return int(doc.xref_object(int(value.split()[0]), compressed=True))
+    except ValueError:
+        pass
+    return len(doc.xref_stream_raw(xref) or b'')
+
+
+def _parse_page_range(pdf_path: str, start: int, end: int) -> List[Dict[str, Any]]:
+    """
+    在子进程中解析[start, end)范围内的页面（自行打开文档）
+
+    Returns:
+        页面信息字典列表（可跨进程传递）
+    """
+    parser = PDFParser()
+    doc = fitz.open(pdf_path)
+    parser.current_doc = doc
+    parser.current_path = pdf_path
+    try:
+        return [parser._parse_page(doc, page_num).dict() for page_num in range(start, end)]
+    finally:
+        parser.close()
+
 
 class PDFParser:
     """PDF文档解析器"""
@@ -24,6 +164,31 @@ class PDFParser:
         'photo_page': ['检验报告照片页']
     }
 
+    # 首页关键字段，以及去空格后的字段名（用于匹配）
+    HOME_PAGE_FIELDS = ['委 托 方', '样品名称', '型号规格']
+    _CLEANED_HOME_PAGE_FIELDS = tuple(f.replace(' ', '') for f in HOME_PAGE_FIELDS)
+
+    # 页眉区域：页面顶部高度比例
+    HEADER_HEIGHT_RATIO = 0.15
+    # 右上角页码区域：右侧宽度比例、顶部高度比例
+    PAGE_NUMBER_WIDTH_RATIO = 0.5
+    PAGE_NUMBER_HEIGHT_RATIO = 0.20
+
+    # 页面文本内容（text_content）保留的最大长度
+    TEXT_CONTENT_LIMIT = 2000
+
+    # 构成表格单元格所需的最少线段数（上下左右各一条）
+    MIN_TABLE_EDGES = 4
+
+    # 预处理后的页眉模式：(去空白模式, 原始模式)，按长度降序（先匹配更具体的模式）
+    _CLEANED_PATTERNS = sorted(
+        dict.fromkeys(
+            (re.sub(r'\s+', '', pattern), pattern)
+            for patterns in HEADER_PATTERNS.values() for pattern in patterns
+        ),
+        key=lambda item: -len(item[0])
+    )
+
     def __init__(self):
         self.current_doc = None
         self.current_path = None
@@ -31,27 +196,59 @@ class PDFParser:
     def parse(self, pdf_path: str) -> List[PageInfo]:
         """
         解析PDF文件，返回所有页面信息
+
+        页数较多时按连续页段分发到多进程并行解析，结果按页码顺序合并；
+        页数较少或多进程不可用时在当前进程顺序解析（使用共享的缓存文档，不由本解析器关闭）
         """
-        doc = fitz.open(pdf_path)
-        self.current_doc = doc
+        doc = _open_doc(pdf_path)
+        page_count = len(doc)
+        self.current_doc = None
         self.current_path = pdf_path
 
+        if page_count >= _PARALLEL_MIN_PAGES:
+            try:
+                return self._parse_parallel(pdf_path, page_count)
+            except Exception as e:
+                print(f"并行解析失败，改为顺序解析: {e}")
+
         pages = []
-        for page_num in range(len(doc)):
+        for page_num in range(page_count):
             page_info = self._parse_page(doc, page_num)
             pages.append(page_info)
 
         return pages
 
+    def _parse_parallel(self, pdf_path: str, page_count: int) -> List[PageInfo]:
+        """按页段提交到进程池解析，并按页码顺序重组结果"""
+        pool = _get_process_pool()
+        futures = [
+            pool.submit(_parse_page_range, pdf_path, start, min(start + _PAGES_PER_TASK, page_count))
+            for start in range(0, page_count, _PAGES_PER_TASK)
+        ]
+
+        pages = []
+        try:
+            for future in futures:
+                pages.extend(PageInfo(**page) for page in future.result(timeout=_PARSE_TASK_TIMEOUT))
+        except (BrokenProcessPool, FutureTimeoutError):
+            # 子进程崩溃后进程池不可再用，超时的任务仍占用工作进程，均需重建进程池
+            _reset_process_pool(pool)
+            raise
+
+        return pages
+
     def _parse_page(self, doc: fitz.Document, page_num: int) -> PageInfo:
         """解析单个页面"""
         page = doc[page_num]
 
-        # 提取文本
-        text = page.get_text()
+        # 提取文本（全文、页眉区域和右上角页码区域文本一次得到）
+        text, header_text, page_number_text = self._extract_text(page, self.TEXT_CONTENT_LIMIT)
 
         # 识别页眉（页面顶部区域）
-        header = self._extract_header(page, text)
+        header = self._extract_header(header_text)
+
+        # 识别右上角页码
+        page_number_match = PAGE_NUMBER_PATTERN.search(page_number_text)
 
         # 检测表格
         tables = self._extract_tables(page)
@@ -62,54 +259,84 @@ class PDFParser:
         return PageInfo(
             page_num=page_num + 1,  # 1-based page number
             page_header=header,
-            text_content=text[:2000] if text else None,  # 限制长度
+            text_content=text or None,  # 已限制长度
+            page_number_raw=page_number_match.group(0) if page_number_match else None,
             has_table=len(tables) > 0,
             has_image=len(images) > 0,
             tables=tables,
             images=images
         )
 
-    def _extract_header(self, page: fitz.Page, text: str) -> Optional[str]:
-        """
-        提取页眉文本
-        策略：检查页面顶部区域和文本开头
-        按模式长度从长到短匹配，避免"检验报告"误匹配"检验报告照片页"
+    def _extract_text(self, page: fitz.Page, max_text_length: int) -> Tuple[str, str, str]:
         """
-        # 获取页面顶部区域的文本（顶部10%区域）
-        page_rect = page.rect
-        header_rect = fitz.Rect(
-            page_rect.x0,
-            page_rect.y0,
-            page_rect.x1,
-            page_rect.y0 + page_rect.height * 0.15
-        )
+        只解析一次页面内容，同时得到全文、页眉区域和右上角页码区域文本
 
-        header_text = page.get_text("text", clip=header_rect)
+        全文与page.get_text()的输出一致（每行以换行结尾），截断至max_text_length，
+        达到长度后不再拼接正文行；
+        页眉区域为页面顶部15%，按整行划分（行的上边缘位于该区域内）；
+        页码区域为右侧50%宽度、顶部20%高度，按文本片段划分（片段与该区域相交）
 
+        Returns:
+            (全文, 页眉区域文本, 页码区域文本)
+        """
+        # 页面尺寸只读取一次，各区域边界预先算为局部变量
+        x0, y0, x1, y1 = page.rect
+        header_bottom = y0 + (y1 - y0) * self.HEADER_HEIGHT_RATIO
+        page_number_left = x1 - (x1 - x0) * self.PAGE_NUMBER_WIDTH_RATIO
+        page_number_bottom = y0 + (y1 - y0) * self.PAGE_NUMBER_HEIGHT_RATIO
+
+        # 使用纯文本的提取选项，避免在结果中附带图片数据
+        page_dict = page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)
+
+        text_lines = []
+        text_length = 0
+        header_lines = []
+        page_number_lines = []
+        for block in page_dict['blocks']:
+            for line in block.get('lines', ()):
+                spans = line['spans']
+                bbox = line['bbox']
+                line_text = None
+
+                if text_length < max_text_length:
+                    line_text = ''.join(span['text'] for span in spans) + '\n'
+                    text_lines.append(line_text)
+                    text_length += len(line_text)
+
+                if bbox[1] < header_bottom:
+                    if line_text is None:
+                        line_text = ''.join(span['text'] for span in spans) + '\n'
+                    header_lines.append(line_text)
+
+                if bbox[1] < page_number_bottom and bbox[2] > page_number_left:
+                    page_number_lines.append(''.join(
+                        span['text'] for span in spans
+                        if span['bbox'][2] > page_number_left and span['bbox'][1] < page_number_bottom
+                    ) + '\n')
+
+        return ''.join(text_lines)[:max_text_length], ''.join(header_lines), ''.join(page_number_lines)
+
+    def _extract_header(self, header_text: str) -> Optional[str]:
+        """
+        根据页面顶部区域的文本识别页眉
+        按模式长度从长到短匹配，避免"检验报告"误匹配"检验报告照片页"
+        """
         # 清理空白字符进行匹配
         cleaned_header = self._clean_whitespace(header_text)
 
-        # 收集所有模式并按长度排序（从长到短匹配）
-        all_patterns = []
-        for header_type, patterns in self.HEADER_PATTERNS.items():
-            for pattern in patterns:
-                all_patterns.append((len(pattern), pattern))
-
-        # 按长度降序排序，确保先匹配更具体的模式
-        all_patterns.sort(key=lambda x: -x[0])
-
-        # 检查是否匹配已知页眉模式
-        for _, pattern in all_patterns:
-            cleaned_pattern = self._clean_whitespace(pattern)
+        # 检查是否匹配已知页眉模式（已按长度从长到短排序）
+        for cleaned_pattern, pattern in self._CLEANED_PATTERNS:
             if cleaned_pattern in cleaned_header:
                 return pattern
 
         # 返回原始页眉文本（前100字符）
         return header_text[:100].strip() if header_text else None
 
-    def _clean_whitespace(self, text: str) -> str:
-        """移除所有空白字符用于匹配"""
-        return re.sub(r'\s+', '', text)
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _clean_whitespace(text: str) -> str:
+        """移除所有空白字符用于匹配（页眉在各页间大量重复，结果缓存）"""
+        return text.translate(_WS_DELETE)
 
     def _extract_tables(self, page: fitz.Page) -> List[Dict[str, Any]]:
         """
@@ -118,6 +345,10 @@ class PDFParser:
         """
         tables = []
 
+        # 矢量线段不足以围成单元格的页面（纯文本页、照片页）不做表格检测
+        if not self._may_contain_table(page):
+            return tables
+
         try:
             # 查找表格
             tab = page.find_tables()
@@ -143,98 +374,126 @@ class PDFParser:
 
         return tables
 
+    def _may_contain_table(self, page: fitz.Page) -> bool:
+        """
+        根据矢量绘图快速预判页面是否可能包含表格
+
+        表格检测基于线段，矩形/四边形计为4条边，直线计为1条；
+        线段总数不足MIN_TABLE_EDGES时不可能构成单元格
+        """
+        edges = 0
+        for path in page.get_cdrawings():
+            for item in path['items']:
+                edges += 4 if item[0] in ('re', 'qu') else 1
+                if edges >= self.MIN_TABLE_EDGES:
+                    return True
+        return False
+
     def _extract_images(self, page: fitz.Page, page_num: int) -> List[Dict[str, Any]]:
         """
         提取页面中的图片信息
+
+        只读取图片对象的字典信息（含/Length），不读取或解码图片数据流；
+        size为PDF中存储的压缩数据大小（/Length），而非解码后的像素数据大小
         """
         images = []
 
         try:
-            # 获取页面中的图片列表
+            # 获取页面中的图片列表：(xref, smask, width, height, bpc, colorspace, alt_colorspace, name, filter, ...)
             image_list = page.get_images(full=True)
 
             for img_index, img in enumerate(image_list):
                 xref = img[0]
-                base_image = self.current_doc.extract_image(xref)
-
-                if base_image:
-                    images.append({
-                        'index': img_index,
-                        'xref': xref,
-                        'width': base_image.get('width'),
-                        'height': base_image.get('height'),
-                        'ext': base_image.get('ext'),
-                        'size': len(base_image.get('image', b''))
-                    })
+                image_filter = img[8]
+                ext = next((e for f, e in _IMAGE_FILTER_EXT if f in image_filter), 'png')
+
+                images.append({
+                    'index': img_index,
+                    'xref': xref,
+                    'width': img[2],
+                    'height': img[3],
+                    'ext': ext,
+                    'size': _stream_length(page.parent, xref)
+                })
 
         except Exception as e:
             print(f"图片提取失败: {e}")
 
         return images
 
-    def extract_table_detailed(self, pdf_path: str, page_num: int, table_index: int = 0) -> Optional[TableData]:
+    def extract_table_detailed(self, pdf_path: str, page_num: int, table_index: int = 0,
+                               doc: Optional[fitz.Document] = None) -> Optional[TableData]:
         """
         提取指定页面的详细表格数据
-        """
-        doc = fitz.open(pdf_path)
 
-        try:
-            page = doc[page_num - 1]  # 0-based index
-            tab = page.find_tables()
-
-            if not tab.tables or table_index >= len(tab.tables):
-                return None
+        Args:
+            doc: 已打开的文档；为None时使用共享的缓存文档
+        """
+        if doc is None:
+            doc = _open_doc(pdf_path)
 
-            table = tab.tables[table_index]
-            data = table.extract()
+        page = doc[page_num - 1]  # 0-based index
+        tab = page.find_tables()
 
-            if not data:
-                return None
+        if not tab.tables or table_index >= len(tab.tables):
+            return None
 
-            # 转换为字符串列表
-            headers = [str(h) if h is not None else '' for h in data[0]]
-            rows = []
-            for row_data in data[1:]:
-                rows.append([str(cell) if cell is not None else '' for cell in row_data])
+        return self.extract_table_detailed_from(tab.tables[table_index], page_num, table_index)
 
-            return TableData(
-                page_num=page_num,
-                table_index=table_index,
-                headers=headers,
-                rows=rows,
-                row_count=len(rows),
-                col_count=len(headers)
-            )
+    def extract_table_detailed_from(self, table: Any, page_num: int, table_index: int) -> Optional[TableData]:
+        """
+        从已检测到的表格对象提取详细表格数据（调用方已执行find_tables时使用，避免重复检测）
 
-        finally:
-            doc.close()
+        Args:
+            table: page.find_tables().tables中的表格对象
+        """
+        data = table.extract()
+
+        if not data:
+            return None
+
+        # 转换为字符串列表
+        headers = [str(h) if h is not None else '' for h in data[0]]
+        rows = []
+        for row_data in data[1:]:
+            rows.append([str(cell) if cell is not None else '' for cell in row_data])
+
+        return TableData(
+            page_num=page_num,
+            table_index=table_index,
+            headers=headers,
+            rows=rows,
+            row_count=len(rows),
+            col_count=len(headers)
+        )
 
-    def extract_page_as_image(self, pdf_path: str, page_num: int, dpi: int = 150) -> str:
+    def extract_page_as_image(self, pdf_path: str, page_num: int, dpi: int = 150,
+                              doc: Optional[fitz.Document] = None) -> str:
         """
         将指定页面转换为图片并保存
         返回图片路径
-        """
-        doc = fitz.open(pdf_path)
 
-        try:
-            page = doc[page_num - 1]
+        Args:
+            doc: 已打开的文档；为None时使用共享的缓存文档
+        """
+        if doc is None:
+            doc = _open_doc(pdf_path)
 
-            # 设置缩放比例
-            zoom = dpi / 72
-            mat = fitz.Matrix(zoom, zoom)
+        page = doc[page_num - 1]
 
-            # 渲染为图片
-            pix = page.get_pixmap(matrix=mat)
+        # 设置缩放比例
+        zoom = dpi / 72
+        mat = fitz.Matrix(zoom, zoom)
 
-            # 保存图片
-            output_path = f"temp/page_{page_num}.png"
-            Path(output_path).parent.mkdir(exist_ok=True)
-            pix.save(output_path)
+        # 渲染为图片
+        pix = page.get_pixmap(matrix=mat)
 
-            return output_path
+        # 保存图片
+        output_path = f"temp/page_{page_num}.png"
+        Path(output_path).parent.mkdir(exist_ok=True)
+        pix.save(output_path)
 
-        finally:
-            doc.close()
+        return output_path
 
     def find_pages_by_header(self, pages: List[PageInfo], header_pattern: str) -> List[int]:
         """
@@ -257,49 +516,63 @@ class PDFParser:
 
         return result
 
-    def extract_home_page_fields(self, pdf_path: str) -> Dict[str, str]:
+    def extract_home_page_fields(self, pdf_path: str, doc: Optional[fitz.Document] = None) -> Dict[str, str]:
         """
         提取首页的三个关键字段：
         - 委 托 方
         - 样品名称
         - 型号规格
-        """
-        doc = fitz.open(pdf_path)
 
-        try:
-            page = doc[0]  # 第一页
-            text = page.get_text()
+        Args:
+            doc: 已打开的文档；为None时使用共享的缓存文档
+        """
+        if doc is None:
+            doc = _open_doc(pdf_path)
 
-            fields = {}
-            field_names = ['委 托 方', '样品名称', '型号规格']
+        page = doc[0]  # 第一页
+        text = page.get_text()
 
-            for field_name in field_names:
-                value = self._extract_field_value(text, field_name)
-                fields[field_name] = value
+        return self._extract_field_values(text, self.HOME_PAGE_FIELDS)
 
-            return fields
+    def _extract_field_values(self, text: str, field_names: List[str]) -> Dict[str, str]:
+        """
+        从文本中提取多个字段值（文本只拆分、清理一次）
+        """
+        lines = text.split('\n')
+        cleaned_lines = [line.replace(' ', '') for line in lines]
 
-        finally:
-            doc.close()
+        return {
+            field_name: self._find_field_value(lines, cleaned_lines, field_name.replace(' ', ''))
+            for field_name in field_names
+        }
 
     def _extract_field_value(self, text: str, field_name: str) -> str:
         """
         从文本中提取字段值
         策略：查找字段名，然后取右侧或下一行的内容
         """
-        lines = text.split('\n')
+        return self._extract_field_values(text, [field_name])[field_name]
 
-        for i, line in enumerate(lines):
-            # 清理字段名中的空格进行匹配
-            cleaned_field = field_name.replace(' ', '')
-            cleaned_line = line.replace(' ', '')
+    def _find_field_value(self, lines: List[str], cleaned_lines: List[str], cleaned_field: str) -> str:
+        """
+        在已拆分的文本行中查找字段值
 
+        Args:
+            lines: 原始文本行
+            cleaned_lines: 去空格后的文本行（与lines一一对应）
+            cleaned_field: 去空格后的字段名
+        """
+        for i, cleaned_line in enumerate(cleaned_lines):
             if cleaned_field in cleaned_line:
+                line = lines[i]
+
                 # 尝试在同一行获取值（字段名右侧）
                 field_pos = cleaned_line.find(cleaned_field)
                 if field_pos >= 0:
-                    # 获取原始行中对应位置右侧的内容
-                    original_pos = self._find_original_position(line, cleaned_line, field_pos + len(cleaned_field))
+                    # 获取原始行中对应位置右侧的内容（清理后位置 -> 原始位置的映射，一次构建）
+                    idx_map = [idx for idx, char in enumerate(line) if char != ' ']
+                    cleaned_pos = field_pos + len(cleaned_field)
+                    original_pos = idx_map[cleaned_pos] if cleaned_pos < len(idx_map) else len(line)
                     if original_pos < len(line):
                         value = line[original_pos:].strip()
                         if value:
@@ -308,27 +581,12 @@ class PDFParser:
                 # 尝试下一行
                 if i + 1 < len(lines):
                     next_line = lines[i + 1].strip()
-                    if next_line and not any(f.replace(' ', '') in next_line.replace(' ', '') for f in ['委 托 方', '样品名称', '型号规格']):
+                    next_cleaned = cleaned_lines[i + 1]
+                    if next_line and not any(f in next_cleaned for f in self._CLEANED_HOME_PAGE_FIELDS):
                         return next_line
 
         return ''
 
-    def _find_original_position(self, original: str, cleaned: str, cleaned_pos: int) -> int:
-        """
-        将清理后的位置映射回原始字符串位置
-        """
-        original_pos = 0
-        cleaned_idx = 0
-
-        for char in original:
-            if cleaned_idx >= cleaned_pos:
-                return original_pos
-            if not char.isspace():
-                cleaned_idx += 1
-            original_pos += 1
-
-        return len(original)
-
     def close(self):
         """关闭当前文档"""
         if self.current_doc:
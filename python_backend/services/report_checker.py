@@ -3,24 +3,78 @@
 整合PDF解析、OCR识别和字段比对
 """
 
+import asyncio
+import hashlib
+import logging
 import re
 import json
+import unicodedata
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import orjson  # 可选依赖：序列化大体积核对结果更快
+except ImportError:
+    orjson = None
 
 from models.schemas import (
     CheckResult, ComponentCheck, FieldComparison,
     ErrorItem, TableData, OCRResult
 )
-from services.pdf_parser import PDFParser
+from services.pdf_parser import PDFParser, _WS_DELETE, _open_doc
 from services.ocr_service import OCRService
 from services.inspection_item_checker import InspectionItemChecker
 from services.page_number_checker import PageNumberChecker
 from services.third_page_checker import third_page_checker
-from utils.comparison_logger import ComparisonLogger
+from utils.comparison_logger import ComparisonLogger, NULL_LOGGER
 from config import is_llm_comparison_enabled, settings as app_settings
 
+logger = logging.getLogger(__name__)
+
+# 预编译的正则（逐行/逐图调用，避免每次查找re的内部缓存）
+# 带编号的caption行：整页文本一次扫描，group(1)为去掉行首空白的整行，group(2)为编号
+# （行内空白用[^\S\n]，不跨行匹配，与逐行strip后匹配的结果一致）
+_RE_CAPTION_LINE = re.compile(
+    r'^[^\S\n]*((?:№|No\.?|NO\.?|Number)?[^\S\n]*(\d+)[^\n]*)',
+    re.IGNORECASE | re.MULTILINE
+)
+_RE_LEADING_ALNUM = re.compile(r'^[A-Z0-9]')
+_RE_LEADING_DATE = re.compile(r'^20\d{2}[-/]')
+# 样品描述表格的表头/元数据关键词（命中任一即为非数据行）
+_RE_HEADER_KEYWORDS = re.compile('|'.join(map(re.escape, (
+    '序号', '部件名称', '产品名称', '规格型号', '型号规格',
+    '序列号', '批号', '生产日期', '失效日期', '备注',
+    '被检样品主要部件包括',
+))))
+
+# 照片页图片写盘的线程数，以及非JPEG图片转存为JPEG的质量
+_IMAGE_WRITE_WORKERS = 4
+_IMAGE_JPEG_QUALITY = 90
+
+# 部件名称匹配的边界字符：主体名中部件名之后的连接词/分隔符，部件名中主体名之后的分隔符
+_SUBJECT_CONNECTORS = frozenset('及和与-（([<《')
+_NAME_DELIMITERS = frozenset('-（([<《')
+
+# 部件表格与标签OCR逐一比对的字段：(标准化字段名, 字段显示名)；序列号/批号联合列单独处理
+_COMPONENT_FIELD_CONFIGS = (
+    ('model', '型号规格'),
+    ('production_date', '生产日期'),
+    ('expiration_date', '失效日期'),
+)
+
+# 表示无固定值的等价写法（/、空白、见实物）
+_EMPTY_VALUES = frozenset(('', '/', '见实物'))
+
+# 标签OCR结果缓存容量（按图片内容哈希缓存，跨核对复用）
+_OCR_CACHE_SIZE = 256
+
+# 中文标签caption关键词（中文标签样张/样本/照片等变体都包含"中文标签"，无需单独列出）
+_CHINESE_LABEL_PATTERNS = ('中文标签', '中文標籤', '标签样张')
+
 
 class ReportChecker:
     """报告核对器"""
@@ -37,6 +91,15 @@ class ReportChecker:
         '失效日期': ['失效日期', '有效期至', 'EXP']
     }
 
+    # 表格列识别顺序：(标准列名, 是否用去除空白后的表头匹配)；部件名称列按原表头匹配
+    _COLUMN_MATCH_ORDER = (
+        ('部件名称', False),
+        ('规格型号', True),
+        ('序列号批号', True),
+        ('生产日期', True),
+        ('失效日期', True),
+    )
+
     # Caption解析正则
     CAPTION_PATTERNS = {
         'prefix_number': r'^(?:№|No\.?|NO\.?|Number)\s*\d+\s*',
@@ -44,12 +107,15 @@ class ReportChecker:
         'position_words': r'(?:前侧|后侧|左侧|右侧|左面|右面|正面|背面|侧面|俯视|仰视|顶部|底部|局部)',
         'label_types': r'(?:中文标签样张|中文标签|英文标签|原文标签|标签)'
     }
+    _CAPTION_RES = {key: re.compile(pattern) for key, pattern in CAPTION_PATTERNS.items()}
 
     def __init__(self):
         self.pdf_parser = PDFParser()
         self.ocr_service = OCRService()
         self.inspection_checker = InspectionItemChecker()
         self.page_number_checker = PageNumberChecker()
+        # 图片内容哈希 -> OCRResult（LRU）
+        self._ocr_cache: OrderedDict = OrderedDict()
 
     async def check(self, pdf_path: str, file_id: str, enable_detailed: bool = False) -> CheckResult:
         """
@@ -63,15 +129,18 @@ class ReportChecker:
         # 1. 解析PDF获取页面信息
         pages = self.pdf_parser.parse(pdf_path)
 
+        # 2~6步与其他检查器共用缓存中的同一个打开文档（由缓存管理，此处不关闭）
+        doc = _open_doc(pdf_path)
+
         # 2. 提取首页字段
-        home_page_fields = self.pdf_parser.extract_home_page_fields(pdf_path)
+        home_page_fields = self.pdf_parser.extract_home_page_fields(pdf_path, doc=doc)
 
-        # 3. 定位第三页（检验报告首页）
-        third_page_num = self._find_third_page(pages)
+        # 3. 定位第三页（检验报告首页）和照片页（一次遍历页眉）
+        third_page_num, photo_pages = self._locate_pages(pages)
         third_page_fields = {}
 
         if third_page_num:
-            third_page_fields = self._extract_third_page_fields(pdf_path, third_page_num)
+            third_page_fields = self._extract_third_page_fields(doc, third_page_num)
 
         # 4. 比对首页和第三页
         home_third_comparison = self._compare_home_third(
@@ -79,30 +148,27 @@ class ReportChecker:
         )
 
         # 5. 提取样品描述表格（第四页起）
-        sample_table = self._extract_sample_table(pdf_path, pages)
+        sample_table = self._extract_sample_table(doc, pages)
 
-        # 6. 定位照片页
-        photo_pages = self._find_photo_pages(pages)
+        # 6. 解析照片页内容
+        photo_analysis = await self._analyze_photo_pages(doc, photo_pages, file_id)
 
-        # 7. 解析照片页内容
-        photo_analysis = self._analyze_photo_pages(pdf_path, photo_pages)
-
-        # 8. 第三页扩展字段核对（新增 v2.2）
+        # 7. 第三页扩展字段核对（新增 v2.2）
         third_page_extended_checks = self._check_third_page_extended_fields(
             pdf_path, third_page_num, third_page_fields, photo_analysis
         )
 
-        # 9. 核对部件
+        # 8. 核对部件
         component_checks = self._check_components(
             sample_table, photo_analysis, enable_detailed=enable_detailed
         )
 
-        # 10. 检验项目表格核对（新增 v2.1）
+        # 9. 检验项目表格核对（新增 v2.1）
         inspection_item_check = self.inspection_checker.check_inspection_items(
             pdf_path, pages
         )
 
-        # 11. 页码连续性校验（新增 v2.2）
+        # 10. 页码连续性校验（新增 v2.2）
         page_number_infos, page_number_errors = self.page_number_checker.check_page_numbers(
             pdf_path, pages
         )
@@ -112,13 +178,14 @@ class ReportChecker:
             page_number_infos, page_number_errors
         )
 
-        # 12. 收集错误和警告
+        # 11. 收集错误和警告
         errors, warnings, info = self._collect_issues(
             home_third_comparison, component_checks, photo_analysis,
             inspection_item_check, page_number_errors, third_page_extended_checks
         )
 
-        # 13. 保存结果
+        # 12. 保存结果
+        status_counts = Counter(c.status for c in component_checks)
         result = CheckResult(
             success=True,
             file_id=file_id,
@@ -138,8 +205,8 @@ class ReportChecker:
             warnings=warnings,
             info=info,
             total_components=len(component_checks),
-            passed_components=sum(1 for c in component_checks if c.status == 'pass'),
-            failed_components=sum(1 for c in component_checks if c.status == 'fail')
+            passed_components=status_counts['pass'],
+            failed_components=status_counts['fail']
         )
 
         # 保存结果到临时文件
@@ -147,32 +214,31 @@ class ReportChecker:
 
         return result
 
-    def _find_third_page(self, pages: List[Any]) -> Optional[int]:
-        """定位第三页（页眉包含"检验报告首页"）"""
+    def _locate_pages(self, pages: List[Any]) -> Tuple[Optional[int], List[int]]:
+        """
+        一次遍历页眉，定位第三页（页眉包含"检验报告首页"，取第一个）和所有照片页（页眉包含"检验报告照片页"）
+
+        Returns:
+            (第三页页码或None, 照片页页码列表)
+        """
+        third_page_num = None
+        photo_pages = []
+
         for page in pages:
             if page.page_header:
                 cleaned = self.pdf_parser._clean_whitespace(page.page_header)
-                if '检验报告首页' in cleaned or '检验报告首页' in cleaned:
-                    return page.page_num
-        return None
-
-    def _extract_third_page_fields(self, pdf_path: str, page_num: int) -> Dict[str, str]:
-        """提取第三页的三个关键字段"""
-        import fitz
+                if third_page_num is None and '检验报告首页' in cleaned:
+                    third_page_num = page.page_num
+                if '检验报告照片页' in cleaned:
+                    photo_pages.append(page.page_num)
 
-        doc = fitz.open(pdf_path)
-        try:
-            page = doc[page_num - 1]
-            text = page.get_text()
+        return third_page_num, photo_pages
 
-            fields = {}
-            for field_name in self.KEY_FIELDS:
-                value = self.pdf_parser._extract_field_value(text, field_name)
-                fields[field_name] = value
+    def _extract_third_page_fields(self, doc: Any, page_num: int) -> Dict[str, str]:
+        """提取第三页的三个关键字段（doc为已打开的文档）"""
+        text = doc[page_num - 1].get_text()
 
-            return fields
-        finally:
-            doc.close()
+        return self.pdf_parser._extract_field_values(text, self.KEY_FIELDS)
 
     def _compare_home_third(self, home_fields: Dict[str, str],
                            third_fields: Dict[str, str]) -> List[FieldComparison]:
@@ -201,161 +267,157 @@ class ReportChecker:
         v1 = val1.strip() if val1 else ''
         v2 = val2.strip() if val2 else ''
 
-        # / 和空白等价
-        if v1 in ['', '/'] and v2 in ['', '/']:
-            return True
-
         # /、空白、见实物 都视为等价（表示无固定值）
-        empty_values = ['', '/', '见实物']
-        if v1 in empty_values and v2 in empty_values:
+        if v1 in _EMPTY_VALUES and v2 in _EMPTY_VALUES:
             return True
 
         return v1 == v2
 
-    def _extract_sample_table(self, pdf_path: str, pages: List[Any]) -> Optional[TableData]:
-        """提取样品描述表格（支持跨页表格）"""
-        import fitz
-
+    def _extract_sample_table(self, doc: Any, pages: List[Any]) -> Optional[TableData]:
+        """提取样品描述表格（支持跨页表格，doc为已打开的文档）"""
         # 从第四页开始查找
-        doc = fitz.open(pdf_path)
+        first_table = None
+        all_rows = []
+        found_sample_page = False
+        last_item_number = 0  # 用于追踪最后一个序号
 
-        try:
-            first_table = None
-            all_rows = []
-            found_sample_page = False
-            last_item_number = 0  # 用于追踪最后一个序号
-
-            for page_info in pages:
-                if page_info.page_num < 4:
-                    continue
+        for page_info in pages:
+            if page_info.page_num < 4:
+                continue
 
-                page = doc[page_info.page_num - 1]
-                text = page.get_text()
-
-                # 查找"样品描述"标记，开始提取
-                if '样品描述' in text:
-                    found_sample_page = True
-
-                # 如果已经找到了样品描述页，继续处理后续可能包含表格延续的页
-                if found_sample_page:
-                    # 查找所有表格，找到包含部件数据的表格
-                    tab = page.find_tables()
-                    for table_idx in range(len(tab.tables)):
-                        table_data = self.pdf_parser.extract_table_detailed(
-                            pdf_path, page_info.page_num, table_idx
-                        )
-
-                        if not table_data:
-                            continue
-
-                        headers_str = ' '.join(str(h) for h in table_data.headers) if table_data.headers else ''
+            page = doc[page_info.page_num - 1]
+            text = page.get_text()
 
-                        # 检查是否是部件表格
-                        is_component_table = False
-                        has_component_header = '部件名称' in headers_str
+            # 查找"样品描述"标记，开始提取
+            if '样品描述' in text:
+                found_sample_page = True
+
+            # 本页之前部件表格是否已开始，以及开始处理本页时已收集的行数
+            table_started = first_table is not None
+            rows_before_page = len(all_rows)
+
+            # 如果已经找到了样品描述页，继续处理后续可能包含表格延续的页
+            if found_sample_page:
+                # 查找所有表格，找到包含部件数据的表格
+                for table_idx, table in enumerate(page.find_tables().tables):
+                    table_data = self.pdf_parser.extract_table_detailed_from(
+                        table, page_info.page_num, table_idx
+                    )
+
+                    if not table_data:
+                        continue
+
+                    headers_str = ' '.join(str(h) for h in table_data.headers) if table_data.headers else ''
+
+                    # 检查是否是部件表格
+                    is_component_table = False
+                    has_component_header = '部件名称' in headers_str
+
+                    if first_table is None:
+                        # 第一个表格必须有"部件名称"列头
+                        if has_component_header:
+                            is_component_table = True
+                            first_table = table_data
+                            all_rows.extend(table_data.rows)
+                            # 更新最后一个序号
+                            if table_data.rows:
+                                last_item = table_data.rows[-1][0].strip() if table_data.rows[-1] else '0'
+                                try:
+                                    last_item_number = int(last_item)
+                                except ValueError:
+                                    last_item_number = 0
+                    else:
+                        # 后续页面：检查是否是表格延续
+                        # 1. 检查列数是否匹配
+                        if table_data.col_count == first_table.col_count:
+                            # 2. 检查是否有序号连续性
+                            # 首先检查headers（第一行可能被当作header）
+                            header_first_cell = table_data.headers[0].strip() if table_data.headers else ''
+                            rows_to_add = []
+                            found_continuation = False
+
+                            # 检查headers中的序号
+                            try:
+                                header_item_num = int(header_first_cell)
+                                if header_item_num == last_item_number + 1:
+                                    # Headers包含延续的第一项
+                                    rows_to_add = [table_data.headers] + table_data.rows
+                                    found_continuation = True
+                            except ValueError:
+                                pass
+
+                            # 如果headers不是延续，检查第一行数据
+                            if not found_continuation and table_data.rows and len(table_data.rows[0]) > 0:
+                                first_cell = table_data.rows[0][0].strip()
+                                try:
+                                    first_item_num = int(first_cell)
+                                    # 如果第一个序号紧接上一个表格的最后一个序号，认为是延续
+                                    if first_item_num == last_item_number + 1:
+                                        rows_to_add = table_data.rows
+                                        found_continuation = True
+                                    # 或者第一行包含"部件名称"（重复的header）
+                                    elif has_component_header:
+                                        # 跳过header行，添加其余行
+                                        if len(table_data.rows) > 1:
+                                            rows_to_add = table_data.rows[1:]
+                                            found_continuation = True
+                                except ValueError:
+                                    # 第一列不是数字，检查是否包含"部件名称"
+                                    if has_component_header:
+                                        if len(table_data.rows) > 1:
+                                            rows_to_add = table_data.rows[1:]
+                                            found_continuation = True
 
-                        if first_table is None:
-                            # 第一个表格必须有"部件名称"列头
-                            if has_component_header:
+                            if found_continuation and rows_to_add:
                                 is_component_table = True
-                                first_table = table_data
-                                all_rows.extend(table_data.rows)
+                                all_rows.extend(rows_to_add)
                                 # 更新最后一个序号
-                                if table_data.rows:
-                                    last_item = table_data.rows[-1][0].strip() if table_data.rows[-1] else '0'
-                                    try:
-                                        last_item_number = int(last_item)
-                                    except ValueError:
-                                        last_item_number = 0
-                        else:
-                            # 后续页面：检查是否是表格延续
-                            # 1. 检查列数是否匹配
-                            if table_data.col_count == first_table.col_count:
-                                # 2. 检查是否有序号连续性
-                                # 首先检查headers（第一行可能被当作header）
-                                header_first_cell = table_data.headers[0].strip() if table_data.headers else ''
-                                rows_to_add = []
-                                found_continuation = False
-
-                                # 检查headers中的序号
+                                last_item = rows_to_add[-1][0].strip() if rows_to_add[-1] else '0'
                                 try:
-                                    header_item_num = int(header_first_cell)
-                                    if header_item_num == last_item_number + 1:
-                                        # Headers包含延续的第一项
-                                        rows_to_add = [table_data.headers] + table_data.rows
-                                        found_continuation = True
+                                    last_item_number = int(last_item)
                                 except ValueError:
                                     pass
 
-                                # 如果headers不是延续，检查第一行数据
-                                if not found_continuation and table_data.rows and len(table_data.rows[0]) > 0:
-                                    first_cell = table_data.rows[0][0].strip()
-                                    try:
-                                        first_item_num = int(first_cell)
-                                        # 如果第一个序号紧接上一个表格的最后一个序号，认为是延续
-                                        if first_item_num == last_item_number + 1:
-                                            rows_to_add = table_data.rows
-                                            found_continuation = True
-                                        # 或者第一行包含"部件名称"（重复的header）
-                                        elif has_component_header:
-                                            # 跳过header行，添加其余行
-                                            if len(table_data.rows) > 1:
-                                                rows_to_add = table_data.rows[1:]
-                                                found_continuation = True
-                                    except ValueError:
-                                        # 第一列不是数字，检查是否包含"部件名称"
-                                        if has_component_header:
-                                            if len(table_data.rows) > 1:
-                                                rows_to_add = table_data.rows[1:]
-                                                found_continuation = True
-
-                                if found_continuation and rows_to_add:
-                                    is_component_table = True
-                                    all_rows.extend(rows_to_add)
-                                    # 更新最后一个序号
-                                    last_item = rows_to_add[-1][0].strip() if rows_to_add[-1] else '0'
-                                    try:
-                                        last_item_number = int(last_item)
-                                    except ValueError:
-                                        pass
-
-            if first_table:
-                # 创建合并后的表格数据
-                merged_table = TableData(
-                    page_num=first_table.page_num,
-                    table_index=first_table.table_index,
-                    headers=first_table.headers,
-                    rows=all_rows,
-                    row_count=len(all_rows),
-                    col_count=first_table.col_count
-                )
-                return merged_table
-
-            return None
-
-        finally:
-            doc.close()
+            # 部件表格已开始后，本页既无延续行也不是样品描述页，说明表格已结束，不再检查后续页
+            if table_started and len(all_rows) == rows_before_page and '样品描述' not in text:
+                break
 
-    def _find_photo_pages(self, pages: List[Any]) -> List[int]:
-        """定位所有照片页"""
-        photo_pages = []
+        if first_table:
+            # 创建合并后的表格数据
+            merged_table = TableData(
+                page_num=first_table.page_num,
+                table_index=first_table.table_index,
+                headers=first_table.headers,
+                rows=all_rows,
+                row_count=len(all_rows),
+                col_count=first_table.col_count
+            )
+            return merged_table
 
-        for page in pages:
-            if page.page_header:
-                cleaned = self.pdf_parser._clean_whitespace(page.page_header)
-                if '检验报告照片页' in cleaned:
-                    photo_pages.append(page.page_num)
+        return None
 
-        return photo_pages
+    async def _analyze_photo_pages(self, doc: Any, photo_pages: List[int], file_id: str) -> Dict[str, Any]:
+        """
+        分析照片页内容（doc为已打开的文档）
 
-    def _analyze_photo_pages(self, pdf_path: str, photo_pages: List[int]) -> Dict[str, Any]:
-        """分析照片页内容"""
-        import fitz
+        先顺序提取所有图片及caption，再对标签图片并发执行OCR（并发数由OCR_CONCURRENCY限制）。
+        OCR等待期间其他核对可能同时运行，图片保存在本次核对专用的temp/{file_id}/目录下，互不覆盖
+        """
+        photos = []
+        # 图片内容哈希 -> 该图片对应的标签照片列表（相同图片只OCR一次）
+        label_groups: Dict[str, List[Dict[str, Any]]] = {}
+        # 图片内容哈希 -> 图片数据（OCR直接识别哈希所对应的内存数据，不回读文件）
+        label_data: Dict[str, bytes] = {}
+        label_photos = []
 
-        doc = fitz.open(pdf_path)
+        # 已保存图片的xref -> (路径, 内容哈希, 图片数据)（同一图片在多页重复引用时只写一次；提取失败记为None）
+        saved_images: Dict[int, Optional[Tuple[str, str, bytes]]] = {}
+        image_dir = Path("temp") / file_id
+        image_dir.mkdir(parents=True, exist_ok=True)
 
-        photos = []
-        labels = []
+        # 图片写盘放到线程池，与下一张图片的提取重叠
+        writer = ThreadPoolExecutor(max_workers=_IMAGE_WRITE_WORKERS)
+        pending_writes: List[Future] = []
 
         try:
             for page_num in photo_pages:
@@ -369,15 +431,14 @@ class ReportChecker:
 
                 for img_idx, img in enumerate(images):
                     xref = img[0]
-                    base_image = doc.extract_image(xref)
-
-                    if base_image:
-                        # 保存图片
-                        img_path = f"temp/photo_{page_num}_{img_idx}.png"
-                        Path(img_path).parent.mkdir(exist_ok=True)
+                    if xref not in saved_images:
+                        saved_images[xref] = self._save_embedded_image(
+                            doc, xref, img[8], str(image_dir / f"photo_{page_num}_{img_idx}"), writer, pending_writes
+                        )
+                    saved = saved_images[xref]
 
-                        with open(img_path, 'wb') as f:
-                            f.write(base_image['image'])
+                    if saved:
+                        img_path, img_digest, img_data = saved
 
                         # 分析caption（简化版：基于文本位置）
                         caption = self._extract_caption(text, img_idx)
@@ -400,16 +461,26 @@ class ReportChecker:
                         photos.append(photo_info)
 
                         if is_label:
-                            # 对标签进行OCR
-                            try:
-                                ocr_result = self.ocr_service.recognize_label(img_path)
-                                photo_info['ocr_result'] = ocr_result.dict()
-                                labels.append(photo_info)
-                            except Exception as e:
-                                photo_info['ocr_error'] = str(e)
-
+                            label_photos.append(photo_info)
+                            label_groups.setdefault(img_digest, []).append(photo_info)
+                            label_data[img_digest] = img_data
         finally:
-            doc.close()
+            # 等待所有图片写入完成（写入失败时抛出），再开始OCR
+            writer.shutdown(wait=True)
+
+        for future in pending_writes:
+            future.result()
+
+        # 对标签并发进行OCR（每种图片内容识别一次，结果写回对应的所有photo_info）
+        if label_groups:
+            semaphore = asyncio.Semaphore(max(1, app_settings.OCR_CONCURRENCY))
+            await asyncio.gather(*(
+                self._recognize_label_photo(semaphore, digest, label_data[digest], group)
+                for digest, group in label_groups.items()
+            ))
+
+        # 保持照片顺序，仅保留识别成功的标签
+        labels = [p for p in label_photos if 'ocr_result' in p]
 
         return {
             'total_photos': len(photos),
@@ -418,6 +489,71 @@ class ReportChecker:
             'labels': labels
         }
 
+    async def _recognize_label_photo(self, semaphore: asyncio.Semaphore,
+                                     image_digest: str,
+                                     image_data: bytes,
+                                     photo_infos: List[Dict[str, Any]]):
+        """
+        对一种标签图片内容进行OCR，结果或错误写回photo_infos中的每一项
+
+        相同内容的图片优先复用缓存结果；OCR在工作线程中执行，识别的是image_data本身，
+        保证缓存结果与image_digest对应的图片内容一致（视觉大模型调用的限流与重试由OCR服务负责）
+        """
+        ocr_result = self._ocr_cache.get(image_digest)
+        if ocr_result is not None:
+            self._ocr_cache.move_to_end(image_digest)
+        else:
+            async with semaphore:
+                try:
+                    ocr_result = await asyncio.to_thread(
+                        self.ocr_service.recognize_label, photo_infos[0]['image_path'], image_data=image_data
+                    )
+                except Exception as e:
+                    for photo_info in photo_infos:
+                        photo_info['ocr_error'] = str(e)
+                    return
+
+            self._ocr_cache[image_digest] = ocr_result
+            while len(self._ocr_cache) > _OCR_CACHE_SIZE:
+                self._ocr_cache.popitem(last=False)
+
+        for photo_info in photo_infos:
+            result_data = ocr_result.dict()
+            if result_data.get('image_path'):
+                # 复用的结果指向本照片自己的图片文件
+                result_data['image_path'] = photo_info['image_path']
+            photo_info['ocr_result'] = result_data
+
+    def _save_embedded_image(self, doc: Any, xref: int, image_filter: str, img_stem: str,
+                             writer: ThreadPoolExecutor, pending_writes: List[Future]) -> Optional[Tuple[str, str, bytes]]:
+        """
+        保存PDF内嵌图片供OCR使用，返回(带扩展名的图片路径, 图片内容哈希, 图片数据)；提取失败返回None
+
+        - JPEG图片直接写出原始数据（不经解码重编码）
+        - 其他格式解码后编码为JPEG（OCR无需无损，比PNG编码快且文件小），带透明通道时保存为PNG
+
+        写盘提交到writer线程池异步执行，future追加到pending_writes
+        """
+        import fitz
+
+        if 'DCTDecode' in image_filter:
+            base_image = doc.extract_image(xref)
+            if not base_image:
+                return None
+            data, ext = base_image['image'], 'jpg'
+        else:
+            pix = fitz.Pixmap(doc, xref)
+            if pix.alpha:
+                data, ext = pix.tobytes('png'), 'png'
+            else:
+                if pix.colorspace.n not in (1, 3):
+                    pix = fitz.Pixmap(fitz.csRGB, pix)
+                data, ext = pix.tobytes('jpeg', jpg_quality=_IMAGE_JPEG_QUALITY), 'jpg'
+
+        img_path = f"{img_stem}.{ext}"
+        pending_writes.append(writer.submit(Path(img_path).write_bytes, data))
+        return img_path, hashlib.blake2b(data, digest_size=16).hexdigest(), data
+
     def _extract_caption(self, page_text: str, image_index: int) -> str:
         """从页面文本中提取图片的caption
 
@@ -428,16 +564,12 @@ class ReportChecker:
         Returns:
             匹配到的caption文本，如果没有找到则返回空字符串
         """
-        lines = [l.strip() for l in page_text.split('\n') if l.strip()]
-
         # 收集所有带编号的caption
-        numbered_lines = []
-        for line in lines:
-            # 匹配各种编号格式：№25, No.25, NO 25, Number 25, 纯数字25等
-            match = re.search(r'^(?:№|No\.?|NO\.?|Number)?\s*(\d+)[:.\s]*', line, re.IGNORECASE)
-            if match:
-                line_number = int(match.group(1))
-                numbered_lines.append((line_number, line))
+        # 匹配各种编号格式：№25, No.25, NO 25, Number 25, 纯数字25等
+        numbered_lines = [
+            (int(match.group(2)), match.group(1).strip())
+            for match in _RE_CAPTION_LINE.finditer(page_text)
+        ]
 
         if not numbered_lines:
             return ''
@@ -449,16 +581,16 @@ class ReportChecker:
         expected_number = image_index + 1
         for num, line in numbered_lines:
             if num == expected_number:
-                print(f"[DEBUG] Caption匹配(连续编号): image_index={image_index} -> №{num}")
+                logger.debug("Caption匹配(连续编号): image_index=%d -> №%d", image_index, num)
                 return line
 
         # 方法2: 如果编号不连续（如从25开始），使用位置匹配
         if image_index < len(numbered_lines):
             matched_num, matched_line = numbered_lines[image_index]
-            print(f"[DEBUG] Caption匹配(位置): image_index={image_index} -> №{matched_num}: {matched_line[:40]}...")
+            logger.debug("Caption匹配(位置): image_index=%d -> №%d: %.40s...", image_index, matched_num, matched_line)
             return matched_line
 
-        print(f"[DEBUG] Caption未匹配: image_index={image_index}, 找到{len(numbered_lines)}个编号caption")
+        logger.debug("Caption未匹配: image_index=%d, 找到%d个编号caption", image_index, len(numbered_lines))
         return ''
 
     def _is_chinese_label(self, caption: str) -> bool:
@@ -467,19 +599,9 @@ class ReportChecker:
             return False
 
         # 清理空白字符，提高匹配鲁棒性
-        caption_clean = re.sub(r'\s+', '', caption)
-
-        # 支持多种中文标签变体
-        chinese_label_patterns = [
-            '中文标签',
-            '中文标签样张',
-            '中文標籤',
-            '中文标签样本',
-            '中文标签照片',
-            '标签样张',
-        ]
+        caption_clean = caption.translate(_WS_DELETE)
 
-        return any(pattern in caption_clean for pattern in chinese_label_patterns)
+        return any(pattern in caption_clean for pattern in _CHINESE_LABEL_PATTERNS)
 
     def _extract_subject_name(self, caption: str) -> str:
         """从caption中提取主体名"""
@@ -489,16 +611,16 @@ class ReportChecker:
         name = caption
 
         # 1. 去除前缀编号
-        name = re.sub(self.CAPTION_PATTERNS['prefix_number'], '', name)
+        name = self._CAPTION_RES['prefix_number'].sub('', name)
 
         # 2. 去除尾部方位词
-        name = re.sub(self.CAPTION_PATTERNS['position_words'], '', name)
+        name = self._CAPTION_RES['position_words'].sub('', name)
 
         # 3. 去除尾部类别词
-        name = re.sub(self.CAPTION_PATTERNS['label_types'], '', name)
+        name = self._CAPTION_RES['label_types'].sub('', name)
 
         # 4. 清理所有空白字符（包括中间的空格、换行符等）
-        name = re.sub(r'\s+', '', name)
+        name = name.translate(_WS_DELETE)
 
         return name
 
@@ -522,8 +644,13 @@ class ReportChecker:
             return False
 
         # 清理两个名称中的空白字符（包括换行符）
-        component_clean = re.sub(r'\s+', '', component_name)
-        subject_clean = re.sub(r'\s+', '', subject_name)
+        return self._match_clean(component_name.translate(_WS_DELETE),
+                                 subject_name.translate(_WS_DELETE))
+
+    def _match_clean(self, component_clean: str, subject_clean: str) -> bool:
+        """在已去除空白字符的部件名称与主体名之间进行匹配（规则见_is_component_name_match）"""
+        if not component_clean or not subject_clean:
+            return False
 
         # 精确匹配
         if component_clean == subject_clean:
@@ -542,7 +669,7 @@ class ReportChecker:
 
             # 如果后面跟着连接词（及、和、与）或分隔符，是合法匹配
             next_char = subject_clean[end_pos]
-            if next_char in '及和与-（([<《':
+            if next_char in _SUBJECT_CONNECTORS:
                 return True
 
             # 如果后面跟着其他字符（字母/数字/中文），可能是误匹配
@@ -562,7 +689,7 @@ class ReportChecker:
 
             # 如果后面跟着分隔符（-、（、[等），是合法匹配
             next_char = component_clean[end_pos]
-            if next_char in '-（([<《':
+            if next_char in _NAME_DELIMITERS:
                 return True
 
             # 如果后面跟着的是字母/数字/中文，说明是另一个词的开始，是误匹配
@@ -588,11 +715,23 @@ class ReportChecker:
         photos = photo_analysis.get('photos', [])
         labels = photo_analysis.get('labels', [])
 
+        # 主体名只清理一次，避免在部件×照片的双重循环中重复清理
+        photo_subjects = [(p, p['subject_name'].translate(_WS_DELETE)) for p in photos if not p['is_label']]
+        label_subjects = [(l, l['subject_name'].translate(_WS_DELETE)) for l in labels]
+
+        # 同一主体通常有多张照片（各方位、标签），匹配规则只对不重复的主体名执行
+        distinct_subjects = {s for _, s in photo_subjects} | {s for _, s in label_subjects}
+
+        # 标签的OCRResult按需构造并复用（同一标签可能被多个部件匹配，避免重复校验）
+        label_ocr_results: Dict[int, Optional[OCRResult]] = {}
+
         for component in components:
             component_name = component['name']
+            component_clean = component_name.translate(_WS_DELETE)
+            matched_subjects = {s for s in distinct_subjects if self._match_clean(component_clean, s)}
 
-            # 初始化比对日志记录器
-            logger = ComparisonLogger(component_name, enable_logging=enable_detailed)
+            # 初始化比对日志记录器（未启用详细模式时使用空记录器，不分配步骤数据）
+            logger = ComparisonLogger(component_name) if enable_detailed else NULL_LOGGER
 
             # 记录开始
             logger.start_step(
@@ -605,7 +744,7 @@ class ReportChecker:
 
             # 检查是否为"本次检测未使用"（清理换行符后检查）
             remark = component.get('remark', '')
-            remark_clean = re.sub(r'\s+', '', remark)
+            remark_clean = remark.translate(_WS_DELETE)
             is_unused = '本次检测未使用' in remark_clean
 
             logger.start_step(
@@ -622,19 +761,16 @@ class ReportChecker:
                 available_photos=len(photos)
             )
 
-            matched_photos = []
-            for p in photos:
-                is_match = self._is_component_name_match(component_name, p['subject_name'])
-                if is_match and not p['is_label']:
-                    matched_photos.append(p)
+            matched_photos = [p for p, subject_clean in photo_subjects if subject_clean in matched_subjects]
 
             has_photo = len(matched_photos) > 0
-            logger.end_step(
-                True,
-                has_photo=has_photo,
-                matched_count=len(matched_photos),
-                matched_captions=[p['caption'] for p in matched_photos]
-            )
+            if enable_detailed:
+                logger.end_step(
+                    True,
+                    has_photo=has_photo,
+                    matched_count=len(matched_photos),
+                    matched_captions=[p['caption'] for p in matched_photos]
+                )
 
             # 标签匹配 - 详细记录
             logger.start_step(
@@ -643,19 +779,16 @@ class ReportChecker:
                 available_labels=len(labels)
             )
 
-            matched_labels = []
-            for l in labels:
-                is_match = self._is_component_name_match(component_name, l['subject_name'])
-                if is_match:
-                    matched_labels.append(l)
+            matched_labels = [l for l, subject_clean in label_subjects if subject_clean in matched_subjects]
 
             has_chinese_label = len(matched_labels) > 0
-            logger.end_step(
-                True,
-                has_chinese_label=has_chinese_label,
-                matched_count=len(matched_labels),
-                matched_captions=[l['caption'] for l in matched_labels]
-            )
+            if enable_detailed:
+                logger.end_step(
+                    True,
+                    has_chinese_label=has_chinese_label,
+                    matched_count=len(matched_labels),
+                    matched_captions=[l['caption'] for l in matched_labels]
+                )
 
             # 字段比对
             field_comparisons = []
@@ -666,8 +799,7 @@ class ReportChecker:
                 if has_chinese_label:
                     # 进行OCR字段与表格字段比对
                     for idx, label_info in enumerate(matched_labels):
-                        ocr_result_data = label_info.get('ocr_result', {})
-                        ocr_result = OCRResult(**ocr_result_data) if ocr_result_data else None
+                        ocr_result = self._get_label_ocr_result(label_info, label_ocr_results)
 
                         if ocr_result:
                             logger.start_step(
@@ -682,24 +814,23 @@ class ReportChecker:
                             )
                             field_comparisons.extend(comparisons)
 
-                            comparison_results = []
                             for comp in comparisons:
-                                comparison_results.append({
-                                    "field": comp.field_name,
-                                    "table": comp.table_value,
-                                    "ocr": comp.ocr_value,
-                                    "match": comp.is_match
-                                })
                                 if not comp.is_match:
                                     issues.append(
                                         f"{comp.field_name}: 表格'{comp.table_value}' vs OCR'{comp.ocr_value}'"
                                     )
 
-                            logger.end_step(
-                                True,
-                                comparisons=comparison_results,
-                                mismatch_count=sum(1 for c in comparisons if not c.is_match)
-                            )
+                            if enable_detailed:
+                                logger.end_step(
+                                    True,
+                                    comparisons=[{
+                                        "field": comp.field_name,
+                                        "table": comp.table_value,
+                                        "ocr": comp.ocr_value,
+                                        "match": comp.is_match
+                                    } for comp in comparisons],
+                                    mismatch_count=sum(1 for c in comparisons if not c.is_match)
+                                )
 
                 # 未使用的部件，没有照片/标签是正常的
                 if not has_photo and not has_chinese_label:
@@ -719,8 +850,7 @@ class ReportChecker:
                 if has_chinese_label:
                     # 进行OCR字段与表格字段比对
                     for idx, label_info in enumerate(matched_labels):
-                        ocr_result_data = label_info.get('ocr_result', {})
-                        ocr_result = OCRResult(**ocr_result_data) if ocr_result_data else None
+                        ocr_result = self._get_label_ocr_result(label_info, label_ocr_results)
 
                         if ocr_result:
                             logger.start_step(
@@ -735,24 +865,23 @@ class ReportChecker:
                             )
                             field_comparisons.extend(comparisons)
 
-                            comparison_results = []
                             for comp in comparisons:
-                                comparison_results.append({
-                                    "field": comp.field_name,
-                                    "table": comp.table_value,
-                                    "ocr": comp.ocr_value,
-                                    "match": comp.is_match
-                                })
                                 if not comp.is_match:
                                     issues.append(
                                         f"{comp.field_name}: 表格'{comp.table_value}' vs OCR'{comp.ocr_value}'"
                                     )
 
-                            logger.end_step(
-                                True,
-                                comparisons=comparison_results,
-                                mismatch_count=sum(1 for c in comparisons if not c.is_match)
-                            )
+                            if enable_detailed:
+                                logger.end_step(
+                                    True,
+                                    comparisons=[{
+                                        "field": comp.field_name,
+                                        "table": comp.table_value,
+                                        "ocr": comp.ocr_value,
+                                        "match": comp.is_match
+                                    } for comp in comparisons],
+                                    mismatch_count=sum(1 for c in comparisons if not c.is_match)
+                                )
                 else:
                     issues.append("缺少中文标签")
 
@@ -796,146 +925,133 @@ class ReportChecker:
 
         return component_checks
 
+    def _get_label_ocr_result(self, label_info: Dict[str, Any],
+                              cache: Dict[int, Optional[OCRResult]]) -> Optional[OCRResult]:
+        """获取标签的OCRResult（按标签对象缓存，无OCR结果时为None）"""
+        key = id(label_info)
+        if key not in cache:
+            ocr_result_data = label_info.get('ocr_result', {})
+            cache[key] = OCRResult(**ocr_result_data) if ocr_result_data else None
+        return cache[key]
+
     def _extract_components_from_table(self, table: TableData) -> List[Dict[str, str]]:
         """从样品描述表格中提取部件列表"""
         components = []
 
         # 调试信息
-        print(f"[DEBUG] 表格表头: {table.headers}")
-        print(f"[DEBUG] 表格行数: {len(table.rows)}")
-
-        # 找到各列索引
-        name_col_idx = None
-        model_col_idx = None
-        serial_batch_col_idx = None
-        prod_date_col_idx = None
-        exp_date_col_idx = None
+        logger.debug("表格表头: %s", table.headers)
+        logger.debug("表格行数: %d", len(table.rows))
 
+        # 找到各列索引（每列取第一个命中同义词的表头，所有列都找到后不再检查后续表头）
+        # 备注列单独处理（不加入COLUMN_SYNONYMS），但在同一遍扫描中识别
+        col_indices: Dict[str, int] = {}
+        remark_col_idx = None
         for idx, header in enumerate(table.headers):
-            header_clean = header.strip() if header else ''
-            header_clean_no_space = re.sub(r'\s+', '', header_clean)
-
-            # 部件名称列
-            if name_col_idx is None:
-                for synonym in self.COLUMN_SYNONYMS.get('部件名称', []):
-                    if synonym in header_clean or header_clean in synonym:
-                        name_col_idx = idx
-                        print(f"[DEBUG] 找到部件名称列: idx={idx}, header='{header}'")
-                        break
-
-            # 规格型号列（映射到model）
-            if model_col_idx is None:
-                for synonym in self.COLUMN_SYNONYMS.get('规格型号', []):
-                    if synonym in header_clean_no_space or header_clean_no_space in synonym:
-                        model_col_idx = idx
-                        print(f"[DEBUG] 找到规格型号列: idx={idx}, header='{header}'")
-                        break
-
-            # 序列号/批号列
-            if serial_batch_col_idx is None:
-                for synonym in self.COLUMN_SYNONYMS.get('序列号批号', []):
-                    if synonym in header_clean_no_space or header_clean_no_space in synonym:
-                        serial_batch_col_idx = idx
-                        print(f"[DEBUG] 找到序列号/批号列: idx={idx}, header='{header}'")
-                        break
+            if len(col_indices) == len(self._COLUMN_MATCH_ORDER) and remark_col_idx is not None:
+                break
 
-            # 生产日期列
-            if prod_date_col_idx is None:
-                for synonym in self.COLUMN_SYNONYMS.get('生产日期', []):
-                    if synonym in header_clean_no_space or header_clean_no_space in synonym:
-                        prod_date_col_idx = idx
-                        print(f"[DEBUG] 找到生产日期列: idx={idx}, header='{header}'")
-                        break
+            header_clean = header.strip() if header else ''
 
-            # 失效日期列
-            if exp_date_col_idx is None:
-                for synonym in self.COLUMN_SYNONYMS.get('失效日期', []):
-                    if synonym in header_clean_no_space or header_clean_no_space in synonym:
-                        exp_date_col_idx = idx
-                        print(f"[DEBUG] 找到失效日期列: idx={idx}, header='{header}'")
-                        break
+            for column in self._match_header_columns(header_clean):
+                if column not in col_indices:
+                    col_indices[column] = idx
+                    logger.debug("找到%s列: idx=%d, header='%s'", column, idx, header)
 
-        # 备注列（单独处理，不加入COLUMN_SYNONYMS）
-        remark_col_idx = None
-        for idx, header in enumerate(table.headers):
-            header_clean = header.strip() if header else ''
-            if '备注' in header_clean:
+            if remark_col_idx is None and '备注' in header_clean:
                 remark_col_idx = idx
-                print(f"[DEBUG] 找到备注列: idx={idx}, header='{header}'")
-                break
+                logger.debug("找到备注列: idx=%d, header='%s'", idx, header)
+
+        name_col_idx = col_indices.get('部件名称')
+        model_col_idx = col_indices.get('规格型号')  # 映射到model
+        serial_batch_col_idx = col_indices.get('序列号批号')
+        prod_date_col_idx = col_indices.get('生产日期')
+        exp_date_col_idx = col_indices.get('失效日期')
 
         # 如果没找到部件名称列，可能是文本格式表格
         if name_col_idx is None and table.rows:
-            print(f"[DEBUG] 未找到标准表格结构，尝试解析文本格式")
+            logger.debug("未找到标准表格结构，尝试解析文本格式")
             return self._extract_components_from_text_format(table)
 
         if name_col_idx is None:
-            print(f"[DEBUG] 无法识别表格结构，返回空列表")
+            logger.debug("无法识别表格结构，返回空列表")
             return components
 
+        # 需去除空白的数据列：(列索引, 标准化字段名)；列序与字段写入顺序一致
+        # 序列号/批号为联合列：值可能是序列号或批号，同时存储在两个字段中，并保留原始字段用于显示
+        value_fields = [
+            (col_idx, keys)
+            for col_idx, keys in (
+                (model_col_idx, ('model',)),
+                (serial_batch_col_idx, ('serial_number', 'batch_number', 'serial_batch')),
+                (prod_date_col_idx, ('production_date',)),
+                (exp_date_col_idx, ('expiration_date',)),
+            )
+            if col_idx is not None
+        ]
+
+        # 逐行调试输出的参数需额外取值，调试关闭时整体跳过
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
         # 提取每行数据，使用标准化字段名
-        for row_idx, row in enumerate(table.rows):
-            if len(row) > name_col_idx:
+        for row in table.rows:
+            row_len = len(row)
+            if row_len > name_col_idx:
                 component_name = row[name_col_idx].strip() if row[name_col_idx] else ''
                 # 清理部件名称中的换行符和多余空白
-                component_name = re.sub(r'\s+', '', component_name)
+                component_name = component_name.translate(_WS_DELETE)
                 # 过滤掉空行和非数据行
                 if component_name and not self._is_header_or_metadata_row(component_name):
                     # 使用标准化字段名存储数据
                     component = {'name': component_name}
 
-                    # 型号规格 -> model
-                    if model_col_idx is not None and model_col_idx < len(row):
-                        model_value = row[model_col_idx].strip() if row[model_col_idx] else ''
-                        model_value = re.sub(r'\s+', '', model_value)  # 清理换行符
-                        component['model'] = model_value
-
-                    # 序列号/批号 -> 同时作为serial_number和batch_number
-                    if serial_batch_col_idx is not None and serial_batch_col_idx < len(row):
-                        serial_batch_value = row[serial_batch_col_idx].strip() if row[serial_batch_col_idx] else ''
-                        serial_batch_value = re.sub(r'\s+', '', serial_batch_value)
-                        # 联合列：值可能是序列号或批号，同时存储在两个字段中
-                        component['serial_number'] = serial_batch_value
-                        component['batch_number'] = serial_batch_value
-                        # 保留原始字段用于显示
-                        component['serial_batch'] = serial_batch_value
-
-                    # 生产日期 -> production_date
-                    if prod_date_col_idx is not None and prod_date_col_idx < len(row):
-                        prod_date_value = row[prod_date_col_idx].strip() if row[prod_date_col_idx] else ''
-                        prod_date_value = re.sub(r'\s+', '', prod_date_value)
-                        component['production_date'] = prod_date_value
-
-                    # 失效日期 -> expiration_date
-                    if exp_date_col_idx is not None and exp_date_col_idx < len(row):
-                        exp_date_value = row[exp_date_col_idx].strip() if row[exp_date_col_idx] else ''
-                        exp_date_value = re.sub(r'\s+', '', exp_date_value)
-                        component['expiration_date'] = exp_date_value
+                    # 型号规格/序列号批号/生产日期/失效日期（清理换行符等空白）
+                    for col_idx, keys in value_fields:
+                        if col_idx < row_len:
+                            cell = row[col_idx]
+                            value = cell.translate(_WS_DELETE) if cell else ''
+                            for key in keys:
+                                component[key] = value
 
                     # 备注
-                    if remark_col_idx is not None and remark_col_idx < len(row):
+                    if remark_col_idx is not None and remark_col_idx < row_len:
                         remark_value = row[remark_col_idx].strip() if row[remark_col_idx] else ''
                         component['remark'] = remark_value
 
                     components.append(component)
-                    print(f"[DEBUG] 提取部件 #{len(components)}: {component_name}, model={component.get('model', '')}, serial_batch={component.get('serial_batch', '')}, remark={component.get('remark', '')[:20]}")
+                    if debug_enabled:
+                        logger.debug("提取部件 #%d: %s, model=%s, serial_batch=%s, remark=%.20s",
+                                     len(components), component_name, component.get('model', ''),
+                                     component.get('serial_batch', ''), component.get('remark', ''))
 
-        print(f"[DEBUG] 共提取 {len(components)} 个部件")
+        logger.debug("共提取 %d 个部件", len(components))
         return components
 
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _match_header_columns(cls, header_clean: str) -> Tuple[str, ...]:
+        """
+        表头命中同义词的所有标准列名（按_COLUMN_MATCH_ORDER顺序）
+
+        同义词与表头互为子串即命中；表头先做NFKC规范化（全角字母、康熙部首等兼容字符
+        还原为常规字符），避免因字形变体匹配失败而退回文本格式解析。
+        各报告的表头词汇有限，结果缓存
+        """
+        header_clean = unicodedata.normalize('NFKC', header_clean)
+        header_clean_no_space = header_clean.translate(_WS_DELETE)
+        matched = []
+        for column, match_no_space in cls._COLUMN_MATCH_ORDER:
+            target = header_clean_no_space if match_no_space else header_clean
+            if any(synonym in target or target in synonym for synonym in cls.COLUMN_SYNONYMS[column]):
+                matched.append(column)
+        return tuple(matched)
+
     def _is_header_or_metadata_row(self, text: str) -> bool:
         """判断是否为表头行或元数据行（非数据行）"""
-        header_keywords = ['序号', '部件名称', '产品名称', '规格型号', '型号规格',
-                          '序列号', '批号', '生产日期', '失效日期', '备注',
-                          '被检样品主要部件包括']
         text_clean = text.strip()
         # 如果是纯数字（序号列），也认为是非数据行
         if text_clean.isdigit():
             return True
-        for keyword in header_keywords:
-            if keyword in text_clean:
-                return True
-        return False
+        return _RE_HEADER_KEYWORDS.search(text_clean) is not None
 
     def _extract_components_from_text_format(self, table: TableData) -> List[Dict[str, str]]:
         """从文本格式的表格内容中提取部件（当PyMuPDF无法正确识别表格结构时）
@@ -958,49 +1074,49 @@ class ReportChecker:
         if not table.rows:
             return components
 
-        # 获取所有文本内容（可能在第一行的第一列）
-        text_content = ''
-        for row in table.rows:
-            for cell in row:
-                if cell:
-                    text_content += cell + '\n'
-
-        print(f"[DEBUG] 文本格式内容长度: {len(text_content)}")
+        # 逐单元格按行拆分文本内容（可能在第一行的第一列），保留原始换行结构；各行预先去除首尾空白
+        lines = [
+            l.strip()
+            for row in table.rows
+            for cell in row
+            if cell
+            for l in cell.split('\n')
+            if l.strip()
+        ]
 
-        # 解析文本内容（保留原始换行结构）
-        lines = [l.rstrip() for l in text_content.split('\n') if l.strip()]
+        logger.debug("文本格式内容行数: %d", len(lines))
 
         # 找到第一个数据行（序号"1"）
         start_idx = -1
         for i, line in enumerate(lines):
-            if line.strip() == '1':
+            if line == '1':
                 start_idx = i
                 break
 
         if start_idx < 0:
-            print(f"[DEBUG] 未找到数据开始位置")
+            logger.debug("未找到数据开始位置")
             return components
 
-        print(f"[DEBUG] 数据开始位置: {start_idx}")
+        logger.debug("数据开始位置: %d", start_idx)
 
         # 按列顺序解析数据
         i = start_idx
         while i < len(lines):
-            line = lines[i].strip()
+            line = lines[i]
 
             # 检查是否是纯数字序号（新部件开始）
             if line.isdigit():
                 seq_num = line
-                print(f"[DEBUG] 找到序号: {seq_num}")
+                logger.debug("找到序号: %s", seq_num)
 
                 # 收集部件名称（可能跨多行）
                 i += 1
                 component_name_parts = []
                 while i < len(lines):
-                    current = lines[i].strip()
+                    current = lines[i]
 
                     # 检查是否是规格型号（通常以大写字母/数字开头，较短）
-                    if re.match(r'^[A-Z0-9]', current) and len(current) < 30 and not current.startswith('心脏'):
+                    if _RE_LEADING_ALNUM.match(current) and len(current) < 30 and not current.startswith('心脏'):
                         break
 
                     # 检查是否是纯数字（序列号）
@@ -1008,7 +1124,7 @@ class ReportChecker:
                         break
 
                     # 检查是否是日期格式
-                    if re.match(r'^20\d{2}[-/]', current):
+                    if _RE_LEADING_DATE.match(current):
                         break
 
                     # 检查是否是备注标记
@@ -1025,34 +1141,34 @@ class ReportChecker:
 
                 component_name = ' '.join(component_name_parts)
                 # 清理部件名称中的换行符和多余空白
-                component_name = re.sub(r'\s+', '', component_name)
-                print(f"[DEBUG] 部件名称: {component_name}")
+                component_name = component_name.translate(_WS_DELETE)
+                logger.debug("部件名称: %s", component_name)
 
                 # 当前行应该是规格型号
                 model_spec = ''
                 if i < len(lines):
-                    model_spec = lines[i].strip()
-                    print(f"[DEBUG] 规格型号: {model_spec}")
+                    model_spec = lines[i]
+                    logger.debug("规格型号: %s", model_spec)
                     i += 1
 
                 # 序列号/批号
                 serial_batch = ''
                 if i < len(lines):
-                    serial_batch = lines[i].strip()
-                    print(f"[DEBUG] 序列号/批号: {serial_batch}")
+                    serial_batch = lines[i]
+                    logger.debug("序列号/批号: %s", serial_batch)
                     i += 1
 
                 # 生产日期
                 prod_date = ''
                 if i < len(lines):
-                    prod_date = lines[i].strip()
-                    print(f"[DEBUG] 生产日期: {prod_date}")
+                    prod_date = lines[i]
+                    logger.debug("生产日期: %s", prod_date)
                     i += 1
 
                 # 备注
                 remark = ''
                 if i < len(lines):
-                    remark_line = lines[i].strip()
+                    remark_line = lines[i]
                     if remark_line in ['/', '本次检测未使用']:
                         remark = remark_line
                         i += 1
@@ -1061,17 +1177,17 @@ class ReportChecker:
                         remark_parts = [remark_line]
                         i += 1
                         while i < len(lines):
-                            next_line = lines[i].strip()
+                            next_line = lines[i]
                             if next_line.isdigit():  # 下一个序号
                                 i -= 1
                                 break
-                            if re.match(r'^[A-Z0-9]', next_line) and len(next_line) < 30:
+                            if _RE_LEADING_ALNUM.match(next_line) and len(next_line) < 30:
                                 i -= 1
                                 break
                             remark_parts.append(next_line)
                             i += 1
                         remark = ' '.join(remark_parts)
-                    print(f"[DEBUG] 备注: {remark}")
+                    logger.debug("备注: %s", remark)
 
                 # 保存部件（使用标准化字段名）
                 if component_name:
@@ -1088,11 +1204,11 @@ class ReportChecker:
                     if serial_batch:
                         component['serial_batch'] = serial_batch
                     components.append(component)
-                    print(f"[DEBUG] 添加部件 #{len(components)}: {component_name[:40]}...")
+                    logger.debug("添加部件 #%d: %.40s...", len(components), component_name)
             else:
                 i += 1
 
-        print(f"[DEBUG] 文本格式共提取 {len(components)} 个部件")
+        logger.debug("文本格式共提取 %d 个部件", len(components))
         return components
 
     def _compare_component_fields(self, component: Dict[str, str],
@@ -1107,27 +1223,20 @@ class ReportChecker:
         - 'expiration_date': 失效日期
         """
         comparisons = []
-
-        # 字段映射配置：(component中的键, OCR字段键列表, 字段显示名)
-        field_configs = [
-            ('model', ['model'], '型号规格'),  # 标准化字段名
-            ('production_date', ['production_date'], '生产日期'),
-            ('expiration_date', ['expiration_date'], '失效日期'),
-        ]
+        structured_data = ocr_result.structured_data
 
         # 处理序列号/批号联合列
         # 表格中是一个联合值（存储在serial_number和batch_number中），OCR中可能是序列号或批号
         serial_batch_table_value = component.get('serial_number', '')  # 使用标准化字段名
         serial_batch_ocr_value = None
-        serial_batch_matched_key = None
 
         # 检查OCR结果中的序列号或批号
-        for ocr_key in ['serial_number', 'batch_number']:
-            if ocr_key in ocr_result.structured_data:
-                ocr_value = ocr_result.structured_data[ocr_key].get('value', '')
+        for ocr_key in ('serial_number', 'batch_number'):
+            ocr_entry = structured_data.get(ocr_key)
+            if ocr_entry is not None:
+                ocr_value = ocr_entry.get('value', '')
                 if ocr_value:
                     serial_batch_ocr_value = ocr_value
-                    serial_batch_matched_key = ocr_key
                     break
 
         # 比对序列号/批号联合列（表格值与OCR识别的序列号或批号任一匹配即可）
@@ -1140,21 +1249,19 @@ class ReportChecker:
             issue_type=None if is_match else 'mismatch'
         ))
 
-        # 处理其他字段（使用标准化字段名从component获取）
-        for comp_key, ocr_keys, display_name in field_configs:
-            table_value = component.get(comp_key, '')
+        # 处理其他字段（component与OCR结果使用相同的标准化字段名）
+        for field_key, display_name in _COMPONENT_FIELD_CONFIGS:
+            table_value = component.get(field_key, '')
 
             # 在OCR结果中查找对应字段
-            ocr_value = None
-            for ocr_key in ocr_keys:
-                if ocr_key in ocr_result.structured_data:
-                    ocr_value = ocr_result.structured_data[ocr_key].get('value', '')
-                    break
+            ocr_entry = structured_data.get(field_key)
+            ocr_value = ocr_entry.get('value', '') if ocr_entry is not None else None
 
             # 比对
             is_match = self._values_equal(table_value, ocr_value or '')
 
-            print(f"[DEBUG] 字段比对 '{display_name}': comp_key={comp_key}, table='{table_value}', ocr='{ocr_value}', match={is_match}")
+            logger.debug("字段比对 '%s': comp_key=%s, table='%s', ocr='%s', match=%s",
+                         display_name, field_key, table_value, ocr_value, is_match)
 
             comparisons.append(FieldComparison(
                 field_name=display_name,
@@ -1209,59 +1316,60 @@ class ReportChecker:
         info = []
 
         # 首页与第三页比对问题
-        for comp in home_third_comparison:
-            if not comp.is_match:
-                errors.append(ErrorItem(
-                    level="ERROR",
-                    message=f"首页与第三页'{comp.field_name}'不一致",
-                    page_num=1,
-                    location="首页/第三页",
-                    details={
-                        'home_value': comp.table_value,
-                        'third_value': comp.ocr_value
-                    }
-                ))
+        errors.extend(
+            ErrorItem(
+                level="ERROR",
+                message=f"首页与第三页'{comp.field_name}'不一致",
+                page_num=1,
+                location="首页/第三页",
+                details={
+                    'home_value': comp.table_value,
+                    'third_value': comp.ocr_value
+                }
+            )
+            for comp in home_third_comparison if not comp.is_match
+        )
 
         # 第三页扩展字段核对问题（v2.2新增）
         if third_page_extended_checks:
             # 添加扩展字段比对信息到info
             if third_page_extended_checks.get('comparisons'):
-                for comp in third_page_extended_checks['comparisons']:
-                    if comp.is_match:
-                        info.append(ErrorItem(
-                            level="INFO",
-                            message=f"第三页扩展字段'{comp.field_name}'核对通过",
-                            page_num=comp.page_num,
-                            location=f"第三页表格/{comp.field_name}",
-                            details={
-                                'table_value': comp.table_value,
-                                'label_value': comp.ocr_value
-                            }
-                        ))
+                info.extend(
+                    ErrorItem(
+                        level="INFO",
+                        message=f"第三页扩展字段'{comp.field_name}'核对通过",
+                        page_num=comp.page_num,
+                        location=f"第三页表格/{comp.field_name}",
+                        details={
+                            'table_value': comp.table_value,
+                            'label_value': comp.ocr_value
+                        }
+                    )
+                    for comp in third_page_extended_checks['comparisons'] if comp.is_match
+                )
 
             # 添加扩展字段错误
             if third_page_extended_checks.get('errors'):
-                for error in third_page_extended_checks['errors']:
-                    errors.append(error)
+                errors.extend(third_page_extended_checks['errors'])
 
-        # 部件问题
+        # 部件问题：fail计入错误，warning计入警告
         for check in component_checks:
             if check.status == 'fail':
-                for issue in check.issues:
-                    errors.append(ErrorItem(
-                        level="ERROR",
-                        message=f"部件'{check.component_name}': {issue}",
-                        location=f"样品描述表/{check.component_name}",
-                        details={'component': check.component_name}
-                    ))
+                target, level = errors, "ERROR"
             elif check.status == 'warning':
-                for issue in check.issues:
-                    warnings.append(ErrorItem(
-                        level="WARN",
-                        message=f"部件'{check.component_name}': {issue}",
-                        location=f"样品描述表/{check.component_name}",
-                        details={'component': check.component_name}
-                    ))
+                target, level = warnings, "WARN"
+            else:
+                continue
+
+            target.extend(
+                ErrorItem(
+                    level=level,
+                    message=f"部件'{check.component_name}': {issue}",
+                    location=f"样品描述表/{check.component_name}",
+                    details={'component': check.component_name}
+                )
+                for issue in check.issues
+            )
 
         # 照片页统计
         info.append(ErrorItem(
@@ -1290,13 +1398,11 @@ class ReportChecker:
 
             # 添加检验项目错误
             if inspection_item_check.errors:
-                for error in inspection_item_check.errors:
-                    errors.append(error)
+                errors.extend(inspection_item_check.errors)
 
         # 页码连续性错误（新增 v2.2）
         if page_number_errors:
-            for error in page_number_errors:
-                errors.append(error)
+            errors.extend(page_number_errors)
 
         return errors, warnings, info
 
@@ -1382,5 +1488,18 @@ class ReportChecker:
         result_path = Path(f"temp/{file_id}_result.json")
         result_path.parent.mkdir(exist_ok=True)
 
+        data = result.dict()
+        pretty = app_settings.RESULT_JSON_PRETTY
+        if orjson is not None:
+            # Dict[str, Any]字段中可能混入OCR返回的numpy标量，需显式开启numpy序列化
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            result_path.write_bytes(orjson.dumps(data, option=option))
+            return
+
         with open(result_path, 'w', encoding='utf-8') as f:
-            json.dump(result.dict(), f, ensure_ascii=False, indent=2)
+            if pretty:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            else:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
@@ -6,6 +6,7 @@
 import json
 import os
 import platform
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List, Optional
@@ -74,8 +75,10 @@ def find_and_register_font():
     return 'Helvetica'
 
 
-# 全局字体名称
-FONT_NAME = find_and_register_font()
+@lru_cache(maxsize=1)
+def _get_font_name() -> str:
+    """获取PDF导出使用的字体名称（首次导出PDF时才查找并注册字体）"""
+    return find_and_register_font()
 
 
 def to_para(text, style):
@@ -87,20 +90,56 @@ def to_para(text, style):
     return Paragraph(text, style)
 
 
+def to_text(text) -> str:
+    """将文本转换为表格单元格字符串（无需换行的短文本，字体等由TableStyle设置）"""
+    return '' if text is None else str(text)
+
+
+@lru_cache(maxsize=None)
+def _excel_font(**kwargs):
+    """获取Excel字体（相同参数共用同一对象）"""
+    from openpyxl.styles import Font
+    return Font(**kwargs)
+
+
+@lru_cache(maxsize=None)
+def _excel_fill(color: str):
+    """获取Excel纯色填充（相同颜色共用同一对象）"""
+    from openpyxl.styles import PatternFill
+    return PatternFill(start_color=color, end_color=color, fill_type='solid')
+
+
+def _excel_cell(ws, value, font=None, fill=None, alignment=None):
+    """创建只写模式下带样式的单元格"""
+    from openpyxl.cell import WriteOnlyCell
+
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
+
+
 class ReportExportService:
     """报告导出服务"""
 
     def __init__(self):
         self.styles = getSampleStyleSheet()
-        self._setup_styles()
+        # PDF字体与样式在首次导出PDF时设置，仅导出Excel/JSON时不查找字体
+        self.font_name = None
 
     def _setup_styles(self):
         """设置PDF样式"""
+        self.font_name = _get_font_name()
+
         # 标题样式
         self.title_style = ParagraphStyle(
             'CustomTitle',
             parent=self.styles['Heading1'],
-            fontName=FONT_NAME,
+            fontName=self.font_name,
             fontSize=20,
             alignment=TA_CENTER,
             spaceAfter=20,
@@ -110,7 +149,7 @@ class ReportExportService:
         self.heading_style = ParagraphStyle(
             'CustomHeading',
             parent=self.styles['Heading2'],
-            fontName=FONT_NAME,
+            fontName=self.font_name,
             fontSize=14,
             spaceBefore=15,
             spaceAfter=10,
@@ -120,7 +159,7 @@ class ReportExportService:
         self.subheading_style = ParagraphStyle(
             'CustomSubHeading',
             parent=self.styles['Heading3'],
-            fontName=FONT_NAME,
+            fontName=self.font_name,
             fontSize=12,
             spaceBefore=10,
             spaceAfter=5,
@@ -130,7 +169,7 @@ class ReportExportService:
         self.body_style = ParagraphStyle(
             'CustomBody',
             parent=self.styles['BodyText'],
-            fontName=FONT_NAME,
+            fontName=self.font_name,
             fontSize=10,
             spaceBefore=3,
             spaceAfter=3,
@@ -140,7 +179,7 @@ class ReportExportService:
         self.note_style = ParagraphStyle(
             'NoteStyle',
             parent=self.styles['BodyText'],
-            fontName=FONT_NAME,
+            fontName=self.font_name,
             fontSize=9,
             textColor=colors.grey,
             spaceBefore=2,
@@ -151,13 +190,88 @@ class ReportExportService:
         self.cell_style = ParagraphStyle(
             'CellStyle',
             parent=self.styles['BodyText'],
-            fontName=FONT_NAME,
+            fontName=self.font_name,
             fontSize=9,
             leading=12,
         )
 
+        # 页脚
+        self.footer_style = ParagraphStyle(
+            'Footer',
+            fontName=self.font_name,
+            alignment=TA_CENTER,
+            fontSize=9,
+            textColor=colors.grey,
+        )
+
+        # 表格样式（各表格共用，避免逐个部件重复构建）
+        # 报告信息表格
+        self.header_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), self.font_name),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 10),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+        ])
+
+        # 统计表格
+        self.stats_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1890ff')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, -1), self.font_name),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#f6ffed')),
+            ('BACKGROUND', (0, 2), (-1, 2), colors.HexColor('#f6ffed')),
+            ('BACKGROUND', (0, 3), (-1, 3), colors.HexColor('#fff1f0')),
+            ('BACKGROUND', (0, 4), (-1, 4), colors.HexColor('#fffbe6')),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ])
+
+        # 首页与第三页比对表格
+        self.comparison_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1890ff')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), self.font_name),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ])
+
+        # 部件照片/标签覆盖表格
+        self.component_info_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), self.font_name),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ])
+
+        # 部件字段比对表格
+        self.component_fields_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f0f0f0')),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), self.font_name),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ])
+
     def export_pdf(self, result: Dict[str, Any], output_path: str) -> str:
         """导出PDF报告"""
+        if self.font_name is None:
+            self._setup_styles()
+
         doc = SimpleDocTemplate(
             output_path,
             pagesize=A4,
@@ -195,13 +309,12 @@ class ReportExportService:
     def export_excel(self, result: Dict[str, Any], output_path: str) -> str:
         """导出Excel报告"""
         from openpyxl import Workbook
-        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 
-        wb = Workbook()
+        # 只写模式：逐行流式写入，不在内存中保留单元格对象
+        wb = Workbook(write_only=True)
 
         # 1. 概览sheet
-        ws_overview = wb.active
-        ws_overview.title = "核对概览"
+        ws_overview = wb.create_sheet("核对概览")
         self._fill_excel_overview(ws_overview, result)
 
         # 2. 部件核对sheet
@@ -231,24 +344,13 @@ class ReportExportService:
         file_id = result.get('file_id', '')
 
         info_data = [
-            [to_para('文件名', self.cell_style), to_para(filename, self.cell_style)],
-            [to_para('核对时间', self.cell_style), to_para(check_time, self.cell_style)],
-            [to_para('报告ID', self.cell_style), to_para(file_id[:8] + '...', self.cell_style)],
+            ['文件名', to_para(filename, self.cell_style)],
+            ['核对时间', to_text(check_time)],
+            ['报告ID', to_text(file_id[:8] + '...')],
         ]
 
         info_table = Table(info_data, colWidths=[4*cm, 12*cm])
-        info_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), FONT_NAME),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-        ]))
+        info_table.setStyle(self.header_table_style)
 
         elements.append(info_table)
         elements.append(Spacer(1, 20))
@@ -267,27 +369,15 @@ class ReportExportService:
         warning = total - passed - failed
 
         stats_data = [
-            [to_para('统计项', self.cell_style), to_para('数量', self.cell_style), to_para('占比', self.cell_style)],
-            [to_para('总部件数', self.cell_style), to_para(str(total), self.cell_style), to_para('100%', self.cell_style)],
-            [to_para('通过', self.cell_style), to_para(str(passed), self.cell_style), to_para(f'{passed/total*100:.1f}%' if total > 0 else '0%', self.cell_style)],
-            [to_para('失败', self.cell_style), to_para(str(failed), self.cell_style), to_para(f'{failed/total*100:.1f}%' if total > 0 else '0%', self.cell_style)],
-            [to_para('警告', self.cell_style), to_para(str(warning), self.cell_style), to_para(f'{warning/total*100:.1f}%' if total > 0 else '0%', self.cell_style)],
+            ['统计项', '数量', '占比'],
+            ['总部件数', str(total), '100%'],
+            ['通过', str(passed), f'{passed/total*100:.1f}%' if total > 0 else '0%'],
+            ['失败', str(failed), f'{failed/total*100:.1f}%' if total > 0 else '0%'],
+            ['警告', str(warning), f'{warning/total*100:.1f}%' if total > 0 else '0%'],
         ]
 
         stats_table = Table(stats_data, colWidths=[6*cm, 4*cm, 6*cm])
-        stats_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1890ff')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, -1), FONT_NAME),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#f6ffed')),
-            ('BACKGROUND', (0, 2), (-1, 2), colors.HexColor('#f6ffed')),
-            ('BACKGROUND', (0, 3), (-1, 3), colors.HexColor('#fff1f0')),
-            ('BACKGROUND', (0, 4), (-1, 4), colors.HexColor('#fffbe6')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        stats_table.setStyle(self.stats_table_style)
 
         elements.append(stats_table)
         elements.append(Spacer(1, 20))
@@ -304,7 +394,7 @@ class ReportExportService:
 
         elements.append(Paragraph("二、首页与第三页字段比对", self.heading_style))
 
-        data = [[to_para('字段名', self.cell_style), to_para('首页值', self.cell_style), to_para('第三页值', self.cell_style), to_para('状态', self.cell_style)]]
+        data = [['字段名', '首页值', '第三页值', '状态']]
 
         for comp in comparisons:
             field_name = comp.get('field_name', '')
@@ -314,23 +404,14 @@ class ReportExportService:
 
             status = '✓ 一致' if is_match else '✗ 不一致'
             data.append([
-                to_para(field_name, self.cell_style),
+                to_text(field_name),
                 to_para(table_value, self.cell_style),
                 to_para(ocr_value, self.cell_style),
-                to_para(status, self.cell_style)
+                status
             ])
 
         table = Table(data, colWidths=[4*cm, 5*cm, 5*cm, 2*cm])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1890ff')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), FONT_NAME),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        table.setStyle(self.comparison_table_style)
 
         elements.append(table)
         elements.append(Spacer(1, 20))
@@ -349,6 +430,12 @@ class ReportExportService:
         elements.append(Paragraph(f"共核对 {len(components)} 个部件", self.note_style))
         elements.append(Spacer(1, 10))
 
+        status_colors = {
+            'pass': ('通过', colors.HexColor('#52c41a')),
+            'fail': ('失败', colors.HexColor('#ff4d4f')),
+            'warning': ('警告', colors.HexColor('#faad14')),
+        }
+
         for idx, item in enumerate(components, 1):
             component_name = item.get('component_name', '未知部件')
             status = item.get('status', 'unknown')
@@ -357,70 +444,52 @@ class ReportExportService:
             field_comparisons = item.get('field_comparisons', [])
             issues = item.get('issues', [])
 
-            status_colors = {
-                'pass': ('通过', colors.HexColor('#52c41a')),
-                'fail': ('失败', colors.HexColor('#ff4d4f')),
-                'warning': ('警告', colors.HexColor('#faad14')),
-            }
             status_text, status_color = status_colors.get(status, ('未知', colors.grey))
 
-            elements.append(Paragraph(f"{idx}. {component_name} [{status_text}]", self.subheading_style))
+            # 每个部件的标题、表格与问题作为一个整体排版，避免标题与表格分页
+            block = [Paragraph(f"{idx}. {component_name} [{status_text}]", self.subheading_style)]
 
             photo_status = '✓ 有' if has_photo else '✗ 无'
             label_status = '✓ 有' if has_label else '✗ 无'
 
             info_data = [
-                [to_para('照片覆盖', self.cell_style), to_para(photo_status, self.cell_style)],
-                [to_para('中文标签', self.cell_style), to_para(label_status, self.cell_style)],
+                ['照片覆盖', photo_status],
+                ['中文标签', label_status],
             ]
 
             info_table = Table(info_data, colWidths=[3*cm, 4*cm])
-            info_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, -1), FONT_NAME),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
-
-            elements.append(info_table)
-            elements.append(Spacer(1, 5))
+            info_table.setStyle(self.component_info_table_style)
+
+            block.append(info_table)
+            block.append(Spacer(1, 5))
 
             if field_comparisons:
-                comp_data = [[to_para('字段名', self.cell_style), to_para('表格值', self.cell_style), to_para('OCR值', self.cell_style), to_para('结果', self.cell_style)]]
+                comp_data = [['字段名', '表格值', 'OCR值', '结果']]
                 for fc in field_comparisons:
                     field = fc.get('field_name', '')
                     table_val = fc.get('table_value', '') or '/'
                     ocr_val = fc.get('ocr_value', '') or '/'
                     match = '✓' if fc.get('is_match') else '✗'
                     comp_data.append([
-                        to_para(field, self.cell_style),
+                        to_text(field),
                         to_para(table_val, self.cell_style),
                         to_para(ocr_val, self.cell_style),
-                        to_para(match, self.cell_style)
+                        match
                     ])
 
                 comp_table = Table(comp_data, colWidths=[3*cm, 4*cm, 4*cm, 1.5*cm])
-                comp_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f0f0f0')),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, -1), FONT_NAME),
-                    ('FONTSIZE', (0, 0), (-1, -1), 8),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ]))
-
-                elements.append(comp_table)
-                elements.append(Spacer(1, 5))
+                comp_table.setStyle(self.component_fields_table_style)
+
+                block.append(comp_table)
+                block.append(Spacer(1, 5))
 
             if issues:
-                elements.append(Paragraph("问题:", self.note_style))
+                block.append(Paragraph("问题:", self.note_style))
                 for issue in issues:
-                    elements.append(Paragraph(f"  • {issue}", self.note_style))
-                elements.append(Spacer(1, 5))
+                    block.append(Paragraph(f"  • {issue}", self.note_style))
+                block.append(Spacer(1, 5))
 
+            elements.append(KeepTogether(block))
             elements.append(Spacer(1, 10))
 
         return elements
@@ -458,13 +527,7 @@ class ReportExportService:
         elements = []
 
         elements.append(Spacer(1, 30))
-        elements.append(Paragraph("— 报告结束 —", ParagraphStyle(
-            'Footer',
-            fontName=FONT_NAME,
-            alignment=TA_CENTER,
-            fontSize=9,
-            textColor=colors.grey,
-        )))
+        elements.append(Paragraph("— 报告结束 —", self.footer_style))
         elements.append(Paragraph(
             f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
             self.note_style
@@ -474,167 +537,132 @@ class ReportExportService:
 
     def _fill_excel_overview(self, ws, result: Dict[str, Any]):
         """填充Excel概览sheet"""
-        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-
-        ws['A1'] = 'PDF报告核对结果'
-        ws['A1'].font = Font(size=16, bold=True)
-        ws['A1'].alignment = Alignment(horizontal='center')
-        ws.merge_cells('A1:D1')
-
-        ws['A3'] = '文件名'
-        ws['B3'] = result.get('filename', '')
-        ws['A4'] = '核对时间'
-        ws['B4'] = result.get('check_time', '')
-        ws['A5'] = '总部件数'
-        ws['B5'] = result.get('total_components', 0)
-        ws['A6'] = '通过'
-        ws['B6'] = result.get('passed_components', 0)
-        ws['A7'] = '失败'
-        ws['B7'] = result.get('failed_components', 0)
-
-        for cell in ['A3', 'A4', 'A5', 'A6', 'A7']:
-            ws[cell].font = Font(bold=True)
-            ws[cell].fill = PatternFill(start_color='E0E0E0', end_color='E0E0E0', fill_type='solid')
+        from openpyxl.styles import Alignment
+
+        ws.append([_excel_cell(ws, 'PDF报告核对结果', font=_excel_font(size=16, bold=True),
+                               alignment=Alignment(horizontal='center'))])
+        ws.merged_cells.add('A1:D1')
+        ws.append([])
+
+        label_font = _excel_font(bold=True)
+        label_fill = _excel_fill('E0E0E0')
+        for label, value in (
+            ('文件名', result.get('filename', '')),
+            ('核对时间', result.get('check_time', '')),
+            ('总部件数', result.get('total_components', 0)),
+            ('通过', result.get('passed_components', 0)),
+            ('失败', result.get('failed_components', 0)),
+        ):
+            ws.append([_excel_cell(ws, label, font=label_font, fill=label_fill), value])
 
     def _fill_excel_components(self, ws, result: Dict[str, Any]):
         """填充Excel部件核对sheet"""
-        from openpyxl.styles import Font, PatternFill, Alignment
+        self._append_excel_header(ws, ['序号', '部件名称', '照片', '标签', '状态', '问题'])
 
-        headers = ['序号', '部件名称', '照片', '标签', '状态', '问题']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color='1890FF', end_color='1890FF', fill_type='solid')
-            cell.font = Font(bold=True, color='FFFFFF')
+        status_map = {'pass': '通过', 'fail': '失败', 'warning': '警告'}
+        status_colors = {
+            'pass': 'C6EFCE',
+            'fail': 'FFC7CE',
+            'warning': 'FFEB9C',
+        }
 
         components = result.get('component_checks', [])
         for idx, item in enumerate(components, 1):
-            row = idx + 1
-            ws.cell(row=row, column=1, value=idx)
-            ws.cell(row=row, column=2, value=item.get('component_name', ''))
-            ws.cell(row=row, column=3, value='有' if item.get('has_photo') else '无')
-            ws.cell(row=row, column=4, value='有' if item.get('has_chinese_label') else '无')
-
-            status_map = {'pass': '通过', 'fail': '失败', 'warning': '警告'}
             status = status_map.get(item.get('status'), '未知')
-            ws.cell(row=row, column=5, value=status)
-
+            color = status_colors.get(item.get('status'), 'FFFFFF')
             issues = item.get('issues', [])
-            ws.cell(row=row, column=6, value='; '.join(issues) if issues else '')
 
-            status_colors = {
-                'pass': 'C6EFCE',
-                'fail': 'FFC7CE',
-                'warning': 'FFEB9C',
-            }
-            color = status_colors.get(item.get('status'), 'FFFFFF')
-            ws.cell(row=row, column=5).fill = PatternFill(start_color=color, end_color=color, fill_type='solid')
+            ws.append([
+                idx,
+                item.get('component_name', ''),
+                '有' if item.get('has_photo') else '无',
+                '有' if item.get('has_chinese_label') else '无',
+                _excel_cell(ws, status, fill=_excel_fill(color)),
+                '; '.join(issues) if issues else '',
+            ])
 
     def _fill_excel_issues(self, ws, result: Dict[str, Any]):
         """填充Excel问题汇总sheet"""
-        from openpyxl.styles import Font, PatternFill, Alignment
-
-        headers = ['类型', '消息', '页码', '位置']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color='1890FF', end_color='1890FF', fill_type='solid')
-            cell.font = Font(bold=True, color='FFFFFF')
-
-        row = 2
-        for error in result.get('errors', []):
-            ws.cell(row=row, column=1, value='错误')
-            ws.cell(row=row, column=1).fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-            ws.cell(row=row, column=2, value=error.get('message', ''))
-            ws.cell(row=row, column=3, value=error.get('page_num', ''))
-            ws.cell(row=row, column=4, value=error.get('location', ''))
-            row += 1
-
-        for warning in result.get('warnings', []):
-            ws.cell(row=row, column=1, value='警告')
-            ws.cell(row=row, column=1).fill = PatternFill(start_color='FFEB9C', end_color='FFEB9C', fill_type='solid')
-            ws.cell(row=row, column=2, value=warning.get('message', ''))
-            ws.cell(row=row, column=3, value=warning.get('page_num', ''))
-            ws.cell(row=row, column=4, value=warning.get('location', ''))
-            row += 1
+        self._append_excel_header(ws, ['类型', '消息', '页码', '位置'])
+
+        for level, color, items in (
+            ('错误', 'FFC7CE', result.get('errors', [])),
+            ('警告', 'FFEB9C', result.get('warnings', [])),
+        ):
+            level_fill = _excel_fill(color)
+            for item in items:
+                ws.append([
+                    _excel_cell(ws, level, fill=level_fill),
+                    item.get('message', ''),
+                    item.get('page_num', ''),
+                    item.get('location', ''),
+                ])
 
     def _fill_excel_inspection_items(self, ws, result: Dict[str, Any]):
         """填充Excel检验项目核对sheet（新增 v2.1）"""
-        from openpyxl.styles import Font, PatternFill, Alignment
+        from openpyxl.styles import Alignment
 
         inspection_check = result.get('inspection_item_check')
 
         if not inspection_check or not inspection_check.get('has_table'):
-            ws['A1'] = '未检测到检验项目表格'
-            ws['A1'].font = Font(bold=True, size=14)
+            ws.append([_excel_cell(ws, '未检测到检验项目表格', font=_excel_font(bold=True, size=14))])
             return
 
+        # 调整列宽（只写模式下需在写入行之前设置）
+        for column, width in zip('ABCDEFGH', (8, 25, 15, 30, 15, 12, 12, 12)):
+            ws.column_dimensions[column].width = width
+
         # 统计信息
-        ws['A1'] = '检验项目核对结果'
-        ws['A1'].font = Font(bold=True, size=14)
-        ws.merge_cells('A1:H1')
-
-        ws['A3'] = '检验项目总数'
-        ws['B3'] = inspection_check.get('total_items', 0)
-        ws['A4'] = '标准条款总数'
-        ws['B4'] = inspection_check.get('total_clauses', 0)
-        ws['A5'] = '正确结论数'
-        ws['B5'] = inspection_check.get('correct_conclusions', 0)
-        ws['A6'] = '错误结论数'
-        ws['B6'] = inspection_check.get('incorrect_conclusions', 0)
-        ws['A7'] = '跨页续表数'
-        ws['B7'] = inspection_check.get('cross_page_continuations', 0)
-
-        for cell in ['A3', 'A4', 'A5', 'A6', 'A7']:
-            ws[cell].font = Font(bold=True)
-            ws[cell].fill = PatternFill(start_color='E0E0E0', end_color='E0E0E0', fill_type='solid')
+        ws.append([_excel_cell(ws, '检验项目核对结果', font=_excel_font(bold=True, size=14))])
+        ws.merged_cells.add('A1:H1')
+        ws.append([])
+
+        label_font = _excel_font(bold=True)
+        label_fill = _excel_fill('E0E0E0')
+        for label, key in (
+            ('检验项目总数', 'total_items'),
+            ('标准条款总数', 'total_clauses'),
+            ('正确结论数', 'correct_conclusions'),
+            ('错误结论数', 'incorrect_conclusions'),
+            ('跨页续表数', 'cross_page_continuations'),
+        ):
+            ws.append([_excel_cell(ws, label, font=label_font, fill=label_fill), inspection_check.get(key, 0)])
+        ws.append([])
 
         # 详细核对结果
         headers = ['序号', '检验项目', '标准条款', '标准要求', '检验结果', '单项结论', '期望值', '核对状态']
-        start_row = 9
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=start_row, column=col, value=header)
-            cell.font = Font(bold=True, color='FFFFFF')
-            cell.fill = PatternFill(start_color='1890FF', end_color='1890FF', fill_type='solid')
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-
-        row = start_row + 1
+        self._append_excel_header(ws, headers, alignment=Alignment(horizontal='center', vertical='center'))
+
+        correct_fill = _excel_fill('C6EFCE')
+        incorrect_fill = _excel_fill('FFC7CE')
+        error_font = _excel_font(color='FF0000')
         for item in inspection_check.get('item_checks', []):
             for clause in item.get('clauses', []):
                 for req in clause.get('requirements', []):
-                    ws.cell(row=row, column=1, value=item.get('item_number', ''))
-                    ws.cell(row=row, column=2, value=item.get('item_name', ''))
-                    ws.cell(row=row, column=3, value=clause.get('clause_number', ''))
-                    ws.cell(row=row, column=4, value=req.get('requirement_text', ''))
-                    ws.cell(row=row, column=5, value=req.get('inspection_result', ''))
-                    ws.cell(row=row, column=6, value=clause.get('conclusion', ''))
-                    ws.cell(row=row, column=7, value=clause.get('expected_conclusion', ''))
-
-                    is_correct = clause.get('is_conclusion_correct', True)
-                    status_text = '✓ 正确' if is_correct else '✗ 错误'
-                    ws.cell(row=row, column=8, value=status_text)
+                    values = [
+                        item.get('item_number', ''),
+                        item.get('item_name', ''),
+                        clause.get('clause_number', ''),
+                        req.get('requirement_text', ''),
+                        req.get('inspection_result', ''),
+                        clause.get('conclusion', ''),
+                        clause.get('expected_conclusion', ''),
+                    ]
 
                     # 设置状态列颜色
-                    if is_correct:
-                        ws.cell(row=row, column=8).fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
+                    if clause.get('is_conclusion_correct', True):
+                        ws.append(values + [_excel_cell(ws, '✓ 正确', fill=correct_fill)])
                     else:
-                        ws.cell(row=row, column=8).fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
                         # 错误行整行标红
-                        for col in range(1, 9):
-                            ws.cell(row=row, column=col).font = Font(color='FF0000')
-
-                    row += 1
-
-        # 调整列宽
-        ws.column_dimensions['A'].width = 8
-        ws.column_dimensions['B'].width = 25
-        ws.column_dimensions['C'].width = 15
-        ws.column_dimensions['D'].width = 30
-        ws.column_dimensions['E'].width = 15
-        ws.column_dimensions['F'].width = 12
-        ws.column_dimensions['G'].width = 12
-        ws.column_dimensions['H'].width = 12
-
+                        ws.append([_excel_cell(ws, value, font=error_font) for value in values]
+                                  + [_excel_cell(ws, '✗ 错误', font=error_font, fill=incorrect_fill)])
+
+    def _append_excel_header(self, ws, headers: List[str], alignment=None):
+        """写入Excel表头行（白色粗体、蓝色底）"""
+        header_font = _excel_font(bold=True, color='FFFFFF')
+        header_fill = _excel_fill('1890FF')
+        ws.append([_excel_cell(ws, header, font=header_font, fill=header_fill, alignment=alignment)
+                   for header in headers])
 
 # 单例
 _export_service = None
@@ -0,0 +1,290 @@
+"""
+OCR服务文本后处理（字段提取、校验、日期标准化）的单元测试
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.ocr_service import OCRService, _iter_nearest_first
+
+
+class TestFieldPatternKeywords:
+    """测试字段模式的关键词预扫描配置"""
+
+    def test_keywords_aligned_with_patterns(self):
+        """测试每个模式都有对应的关键词配置"""
+        for field_key, config in OCRService.FIELD_PATTERNS.items():
+            assert len(config['keywords']) == len(config['patterns']), field_key
+
+    def test_keywords_are_uppercase(self):
+        """测试关键词为大写（与转大写后的文本比较）"""
+        for config in OCRService.FIELD_PATTERNS.values():
+            for keywords in config['keywords']:
+                for kw in keywords or ():
+                    assert kw == kw.upper()
+
+
+class TestExtractFields:
+    """测试从OCR文本中提取结构化字段"""
+
+    def test_extract_lowercase_label(self):
+        """测试小写英文标签仍能命中（关键词预扫描不区分大小写）"""
+        service = OCRService()
+        structured = service._extract_fields("lot: ABC123\nref: ENGX-ABC-001")
+
+        assert structured['batch_number']['value'] == 'ABC123'
+        assert structured['model']['value'] == 'ENGX-ABC-001'
+
+    def test_extract_barcode_fields(self):
+        """测试条形码数据标识符提取"""
+        service = OCRService()
+        structured = service._extract_fields("(01)06977566650113(11)240115(17)260114(21)G250030")
+
+        assert structured['production_date']['value'] == '2024-01-15'
+        assert structured['expiration_date']['value'] == '2026-01-14'
+        assert structured['serial_number']['value'] == 'G250030'
+
+    def test_no_keywords_no_fields(self):
+        """测试无任何字段标签时不提取字段"""
+        service = OCRService()
+
+        assert service._extract_fields("显示屏") == {}
+
+
+class TestFieldValidators:
+    """测试字段值校验"""
+
+    def test_valid_model(self):
+        """测试型号校验"""
+        service = OCRService()
+
+        assert service._is_valid_model('ENGX-ABC-001') is True
+        assert service._is_valid_model('80-0000001') is True
+        assert service._is_valid_model('0466.1') is False
+        assert service._is_valid_model('2024-01-01') is False
+        assert service._is_valid_model('型号ABC') is False
+
+    def test_valid_batch_number(self):
+        """测试批号校验"""
+        service = OCRService()
+
+        assert service._is_valid_batch_number('10627717') is True
+        assert service._is_valid_batch_number('批号/序列号') is False
+        assert service._is_valid_batch_number('2024-01') is False
+        assert service._is_valid_batch_number('//') is False
+
+    def test_likely_udi(self):
+        """测试UDI编号判断"""
+        service = OCRService()
+
+        assert service._is_likely_udi('06977566650113') is True
+        assert service._is_likely_udi('(01)0697') is True
+        assert service._is_likely_udi('G250030') is False
+        assert service._is_likely_udi('250030') is False
+
+
+class TestDateNormalization:
+    """测试日期标准化与OCR校正"""
+
+    def test_normalize_compact_dates(self):
+        """测试YYMMDD与YYYYMMDD格式"""
+        service = OCRService()
+
+        assert service._normalize_date_value('production_date', '240115') == '2024-01-15'
+        assert service._normalize_date_value('production_date', '20240115') == '2024-01-15'
+        assert service._normalize_date_value('serial_number', '20539798') == '20539798'
+
+    def test_normalize_separated_dates(self):
+        """测试带分隔符的日期格式"""
+        service = OCRService()
+
+        assert service._normalize_date_value('production_date', '2024/1/5') == '2024-01-05'
+        assert service._normalize_date_value('production_date', '2024年1月5日') == '2024-01-05'
+
+    def test_correct_month_confusion(self):
+        """测试月份OCR混淆校正"""
+        service = OCRService()
+
+        assert service._correct_month_value(15) == 10
+        assert service._correct_month_value(22) == 2
+        assert service._correct_month_value(5, '2024-05-01') == 1
+        assert service._correct_month_value(0) is None
+        assert service._normalize_date_value('production_date', '2024-15-03') == '2024-10-03'
+
+    def test_correct_day_confusion(self):
+        """测试日期OCR混淆校正"""
+        service = OCRService()
+
+        assert service._correct_day_value(35, 31) == 25
+        assert service._correct_day_value(30, 28) == 20
+        assert service._correct_day_value(0, 31) is None
+
+
+class TestNearestCandidates:
+    """测试表格型号候选的就近排序"""
+
+    def test_order_matches_stable_sort(self):
+        """测试产出顺序与完整稳定排序一致（含并列与超过k个的情况）"""
+        xs = np.array([300.0, 60.0, 200.0, 60.0, 100.0, 40.0, 200.0, 500.0, 60.0, 80.0, 90.0, 10.0])
+
+        assert list(_iter_nearest_first(xs, k=3)) == list(np.argsort(xs, kind='stable'))
+        assert list(_iter_nearest_first(xs)) == list(np.argsort(xs, kind='stable'))
+
+    def test_empty(self):
+        """测试无候选时不产出"""
+        assert list(_iter_nearest_first(np.array([]))) == []
+
+
+class TestRecognizeImageData:
+    """测试直接识别内存中的图片数据"""
+
+    def test_image_data_used_instead_of_file(self, monkeypatch):
+        """测试提供image_data时识别该数据而不读取路径"""
+        import cv2
+
+        service = OCRService()
+        captured = {}
+
+        def fake_recognize(img, page_num=None, image_path=None):
+            captured['shape'] = img.shape
+            captured['path'] = image_path
+            return 'result'
+
+        monkeypatch.setattr(service, '_ensure_ocr', lambda: None)
+        monkeypatch.setattr(service, '_recognize_image_array', fake_recognize)
+
+        ok, encoded = cv2.imencode('.png', np.zeros((12, 34, 3), dtype=np.uint8))
+        result = service.recognize_image('不存在的路径.png', use_vision_llm=False, image_data=encoded.tobytes())
+
+        assert result == 'result'
+        assert captured == {'shape': (12, 34, 3), 'path': '不存在的路径.png'}
+
+
+class TestBatchPageOCR:
+    """测试多页批量OCR的结果顺序"""
+
+    def test_recognize_pages_in_requested_order(self, tmp_path, monkeypatch):
+        """测试recognize_pages按page_nums顺序返回各页结果，且已渲染未识别的页不超过max_workers"""
+        import threading
+
+        import fitz
+
+        import services.ocr_service as ocr_module
+
+        pdf_path = tmp_path / 'pages.pdf'
+        doc = fitz.open()
+        for i in range(4):
+            doc.new_page(width=18 * (i + 1), height=18)  # 以页宽区分页面（400DPI下每页宽100*(i+1)像素）
+        doc.save(str(pdf_path))
+        doc.close()
+
+        lock = threading.Lock()
+        state = {'pending': 0, 'max_pending': 0}
+        pixmap_to_bgr = ocr_module._pixmap_to_bgr
+
+        def counting_pixmap_to_bgr(pix, reuse_buffer=False):
+            with lock:
+                state['pending'] += 1
+                state['max_pending'] = max(state['max_pending'], state['pending'])
+            return pixmap_to_bgr(pix, reuse_buffer)
+
+        def fake_run_ocr(img):
+            with lock:
+                state['pending'] -= 1
+            return [[[[[0, 0], [1, 0], [1, 1], [0, 1]], (f'页{round(img.shape[1] / 100)}', 0.99)]]]
+
+        service = OCRService()
+        monkeypatch.setattr(service, '_ensure_ocr', lambda: None)
+        monkeypatch.setattr(service, '_prepare_image', lambda img: img)
+        monkeypatch.setattr(service, '_run_ocr', fake_run_ocr)
+        monkeypatch.setattr(ocr_module, '_pixmap_to_bgr', counting_pixmap_to_bgr)
+
+        page_nums = [3, 1, 4, 2]
+        results = service.recognize_pages(str(pdf_path), page_nums, max_workers=2)
+
+        assert [r.page_num for r in results] == page_nums
+        assert [r.full_text for r in results] == [f'页{n}' for n in page_nums]
+        assert state['max_pending'] <= 2
+
+    def test_extract_models_bounded_and_ordered(self, monkeypatch):
+        """测试批量提取型号返回全部页且已渲染未识别的页不超过max_workers"""
+        import random
+        import threading
+        import time
+
+        import services.ocr_service as ocr_module
+
+        lock = threading.Lock()
+        state = {'pending': 0, 'max_pending': 0}
+
+        def fake_render(pdf_path, page_num):
+            time.sleep(random.uniform(0, 0.01))
+            with lock:
+                state['pending'] += 1
+                state['max_pending'] = max(state['max_pending'], state['pending'])
+            return np.full((2, 2), page_num, dtype=np.uint8)
+
+        def fake_run_ocr(img):
+            with lock:
+                state['pending'] -= 1
+            return [[[[[0, 0], [1, 0], [1, 1], [0, 1]], (f'ENGX-{int(img[0, 0]):03d}', 0.95)]]]
+
+        service = OCRService()
+        monkeypatch.setattr(service, '_ensure_ocr', lambda: None)
+        monkeypatch.setattr(service, '_run_ocr', fake_run_ocr)
+        monkeypatch.setattr(ocr_module, '_render_page', fake_render)
+
+        page_nums = list(range(1, 21))
+        results = service.extract_models_from_pdf_tables('unused.pdf', page_nums, max_workers=3)
+
+        assert list(results) == page_nums
+        assert [r['value'] for r in results.values()] == [f'ENGX-{n:03d}' for n in page_nums]
+        assert state['max_pending'] <= 3
+
+
+
+class TestPixmapToBgr:
+    """测试Pixmap转换与线程复用缓冲区"""
+
+    def test_a4_page_reuses_buffer(self, monkeypatch):
+        """测试400DPI渲染的A4页面在上限内，连续渲染复用同一缓冲区"""
+        import threading
+
+        import fitz
+
+        import services.ocr_service as ocr_module
+
+        monkeypatch.setattr(ocr_module, '_render_local', threading.local())
+        doc = fitz.open()
+        page = doc.new_page(width=595, height=842)
+        mat = fitz.Matrix(400 / 72, 400 / 72)
+
+        first = ocr_module._pixmap_to_bgr(page.get_pixmap(matrix=mat, alpha=False), reuse_buffer=True)
+        buffer = ocr_module._render_local.buffer
+        second = ocr_module._pixmap_to_bgr(page.get_pixmap(matrix=mat, alpha=False), reuse_buffer=True)
+
+        assert first.shape == (4678, 3306, 3)
+        assert np.shares_memory(first, buffer)
+        assert np.shares_memory(second, buffer)
+        assert ocr_module._render_local.buffer is buffer
+
+    def test_over_cap_not_buffered(self, monkeypatch):
+        """测试超过上限的图像不写入线程复用缓冲区"""
+        import threading
+
+        import fitz
+
+        import services.ocr_service as ocr_module
+
+        monkeypatch.setattr(ocr_module, '_render_local', threading.local())
+        pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 4096, 4097), False)
+        assert pix.width * pix.height * 3 > ocr_module._RENDER_BUFFER_MAX_BYTES
+
+        img = ocr_module._pixmap_to_bgr(pix, reuse_buffer=True)
+
+        assert img.shape == (4097, 4096, 3)
+        assert getattr(ocr_module._render_local, 'buffer', None) is None
@@ -0,0 +1,93 @@
+"""
+页码连续性校验模块的单元测试
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models.schemas import PageInfo
+from services.page_number_checker import PageNumberChecker, PageNumberInfo
+
+
+def make_infos(pairs):
+    """根据(总页数, 当前页)列表构造页码信息，文档页码从3开始"""
+    return [
+        PageNumberInfo(page_num=i + 3, total_pages=total, current_page=current,
+                       raw_text=f'共{total}页 第{current}页')
+        for i, (total, current) in enumerate(pairs)
+    ]
+
+
+def error_codes(errors):
+    return [(e.details['error_code'], e.page_num) for e in errors]
+
+
+class TestValidatePageNumbers:
+    """测试页码校验规则"""
+
+    def test_consecutive_pages_pass(self):
+        """测试连续页码无错误"""
+        checker = PageNumberChecker()
+
+        assert checker._validate_page_numbers(make_infos([(3, 1), (3, 2), (3, 3)])) == []
+
+    def test_duplicate_page(self):
+        """测试重复页码只报告一次（期望页码不前进，后续页仍可连续）"""
+        checker = PageNumberChecker()
+        errors = checker._validate_page_numbers(make_infos([(3, 1), (3, 1), (3, 2), (3, 3)]))
+
+        assert error_codes(errors) == [
+            ('PAGE_NUMBER_ERROR_001', 4),
+        ]
+        assert '重复' in errors[0].message
+
+    def test_total_mismatch_and_last_page(self):
+        """测试总页数不一致与末页页码错误"""
+        checker = PageNumberChecker()
+        errors = checker._validate_page_numbers(make_infos([(4, 1), (5, 2), (4, 3)]))
+
+        assert error_codes(errors) == [
+            ('PAGE_NUMBER_ERROR_003', 4),
+            ('PAGE_NUMBER_ERROR_002', 5),
+        ]
+
+    def test_huge_page_numbers(self):
+        """测试超出int64范围的页码（OCR/文本误识别）按普通错误报告"""
+        checker = PageNumberChecker()
+        errors = checker._validate_page_numbers(make_infos([(2, 1), (10 ** 20, 10 ** 20)]))
+
+        assert error_codes(errors) == [
+            ('PAGE_NUMBER_ERROR_003', 4),
+            ('PAGE_NUMBER_ERROR_001', 4),
+        ]
+
+
+class TestExtractPageNumbers:
+    """测试从页面信息提取页码"""
+
+    def test_extract_from_third_page(self):
+        """测试从检验报告首页开始提取页码信息"""
+        pages = [
+            PageInfo(page_num=1, page_header='封面'),
+            PageInfo(page_num=2, page_header='检验报告首页', page_number_raw='共2页 第1页'),
+            PageInfo(page_num=3, page_header='检验报告', page_number_raw='共 2 页 第 2 页'),
+        ]
+
+        info = PageNumberChecker().extract_page_number_info('unused.pdf', pages)
+
+        assert info == [
+            {'page_num': 2, 'total_pages': 2, 'current_page': 1, 'raw_text': '共2页 第1页'},
+            {'page_num': 3, 'total_pages': 2, 'current_page': 2, 'raw_text': '共 2 页 第 2 页'},
+        ]
+
+    def test_stop_after_consecutive_misses(self):
+        """测试连续多页无页码后停止提取"""
+        pages = [PageInfo(page_num=1, page_header='检验报告首页', page_number_raw='共1页 第1页')]
+        pages += [PageInfo(page_num=n, page_header='附录') for n in range(2, 5)]
+        pages.append(PageInfo(page_num=5, page_header='附录', page_number_raw='共9页 第9页'))
+        checker = PageNumberChecker()
+
+        assert len(checker.extract_page_number_info('unused.pdf', pages)) == 2
+        assert len(checker.extract_page_number_info('unused.pdf', pages, max_consecutive_misses=3)) == 1
@@ -0,0 +1,173 @@
+"""
+PDF解析服务的单元测试
+"""
+
+import sys
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import fitz
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import services.pdf_parser as pdf_parser_module
+from services.pdf_parser import PDFParser
+
+
+HEADERS = ['检验报告首页', '检验报告', '检验报告', '检验报告', '检验报告照片页', '检验报告照片页']
+
+
+@pytest.fixture
+def report_pdf(tmp_path):
+    """生成带页眉和正文的多页测试PDF"""
+    path = tmp_path / 'report.pdf'
+    doc = fitz.open()
+    for i, header in enumerate(HEADERS):
+        page = doc.new_page()
+        page.insert_text((72, 40), header, fontname='china-s')
+        page.insert_text((420, 60), f'共 {len(HEADERS)} 页 第 {i + 1} 页', fontname='china-s', fontsize=9)
+        page.insert_text((72, 200), f'正文内容 第{i + 1}页', fontname='china-s')
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+class TestParse:
+    """测试页面解析"""
+
+    def test_headers_in_page_order(self, report_pdf):
+        """测试页眉识别且页码按顺序"""
+        pages = PDFParser().parse(report_pdf)
+
+        assert [p.page_num for p in pages] == list(range(1, len(HEADERS) + 1))
+        assert [p.page_header for p in pages] == HEADERS
+
+    def test_page_number_raw(self, report_pdf):
+        """测试右上角页码随页面解析一并提取"""
+        pages = PDFParser().parse(report_pdf)
+
+        assert [p.page_number_raw for p in pages] == [
+            f'共 {len(HEADERS)} 页 第 {i} 页' for i in range(1, len(HEADERS) + 1)
+        ]
+
+    def test_parallel_matches_sequential(self, report_pdf, monkeypatch):
+        """测试多进程并行解析与顺序解析结果一致"""
+        sequential = [p.dict() for p in PDFParser().parse(report_pdf)]
+
+        monkeypatch.setattr(pdf_parser_module, '_PAGES_PER_TASK', 2)
+        monkeypatch.setattr(pdf_parser_module, '_PARALLEL_MIN_PAGES', 4)
+        parallel = [p.dict() for p in PDFParser().parse(report_pdf)]
+
+        assert parallel == sequential
+
+    def test_broken_pool_reset_and_fallback(self, report_pdf, monkeypatch):
+        """测试进程池损坏时重置进程池并改为顺序解析"""
+        class BrokenPool:
+            def __init__(self):
+                self.shut_down = False
+
+            def submit(self, *args):
+                future = Future()
+                future.set_exception(BrokenProcessPool('worker died'))
+                return future
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                self.shut_down = True
+
+        pool = BrokenPool()
+        monkeypatch.setattr(pdf_parser_module, '_process_pool', pool)
+        monkeypatch.setattr(pdf_parser_module, '_PARALLEL_MIN_PAGES', 4)
+
+        pages = PDFParser().parse(report_pdf)
+
+        assert [p.page_header for p in pages] == HEADERS
+        assert pool.shut_down
+        assert pdf_parser_module._process_pool is None
+
+
+class TestDocumentCache:
+    """测试共享文档缓存"""
+
+    def test_reuses_open_document(self, report_pdf):
+        """测试同一文件重复获取时复用同一文档对象"""
+        doc = pdf_parser_module._open_doc(report_pdf)
+
+        assert pdf_parser_module._open_doc(report_pdf) is doc
+        PDFParser().extract_home_page_fields(report_pdf)
+        assert not doc.is_closed
+
+    def test_close_cached_docs(self, report_pdf):
+        """测试按路径关闭缓存文档后重新打开"""
+        doc = pdf_parser_module._open_doc(report_pdf)
+        pdf_parser_module.close_cached_docs(report_pdf)
+
+        assert doc.is_closed
+        assert pdf_parser_module._open_doc(report_pdf) is not doc
+
+
+@pytest.fixture
+def table_pdf(tmp_path):
+    """生成带一个带框线表格的单页测试PDF"""
+    path = tmp_path / 'table.pdf'
+    cells = [['序号', '部件名称', '型号'], ['1', '主机', 'ENGX-01'], ['2', '推车', 'ENGX-02']]
+    doc = fitz.open()
+    page = doc.new_page()
+    x0, y0, w, h = 72, 100, 120, 30
+    for r in range(len(cells) + 1):
+        page.draw_line((x0, y0 + r * h), (x0 + w * len(cells[0]), y0 + r * h))
+    for c in range(len(cells[0]) + 1):
+        page.draw_line((x0 + c * w, y0), (x0 + c * w, y0 + h * len(cells)))
+    for r, row in enumerate(cells):
+        for c, text in enumerate(row):
+            page.insert_text((x0 + c * w + 5, y0 + r * h + 20), text, fontname='china-s')
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+class TestExtractTable:
+    """测试表格提取"""
+
+    def test_extract_table_detailed(self, table_pdf):
+        """测试按页码与表格索引提取表头和数据行"""
+        table = PDFParser().extract_table_detailed(table_pdf, 1, 0)
+
+        assert table.headers == ['序号', '部件名称', '型号']
+        assert table.rows == [['1', '主机', 'ENGX-01'], ['2', '推车', 'ENGX-02']]
+        assert PDFParser().extract_table_detailed(table_pdf, 1, 1) is None
+
+    def test_extract_from_found_table(self, table_pdf):
+        """测试复用已检测到的表格对象与按索引提取结果一致"""
+        parser = PDFParser()
+        doc = fitz.open(table_pdf)
+        try:
+            found = doc[0].find_tables().tables
+            from_found = parser.extract_table_detailed_from(found[0], 1, 0)
+        finally:
+            doc.close()
+
+        assert from_found == parser.extract_table_detailed(table_pdf, 1, 0)
+
+
+class TestExtractImages:
+    """测试页面图片信息提取"""
+
+    def test_size_is_stored_stream_length(self, tmp_path):
+        """测试size为PDF中存储的压缩数据长度（/Length，含间接引用）"""
+        doc = fitz.open()
+        page = doc.new_page()
+        pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 40, 30), False)
+        pix.clear_with(200)
+        page.insert_image(fitz.Rect(72, 72, 112, 102), pixmap=pix)
+        xref = page.get_images()[0][0]
+        stored = len(doc.xref_stream_raw(xref))
+
+        parser = PDFParser()
+        assert parser._extract_images(page, 1)[0]['size'] == stored
+
+        length_xref = doc.get_new_xref()
+        doc.update_object(length_xref, str(stored))
+        doc.xref_set_key(xref, 'Length', f'{length_xref} 0 R')
+        assert parser._extract_images(page, 1)[0]['size'] == stored
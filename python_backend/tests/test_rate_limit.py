@@ -0,0 +1,104 @@
+"""
+限流与重试工具的单元测试
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.rate_limit import RateLimiter, is_transient_error, retry_call
+
+
+class StatusError(Exception):
+    """带HTTP状态码的异常（模拟LLM SDK的APIStatusError）"""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"Error code: {status_code}")
+        self.status_code = status_code
+
+
+class TestRateLimiter:
+    """测试令牌桶限流"""
+
+    def test_unlimited(self):
+        """测试rate<=0时不等待"""
+        limiter = RateLimiter(0)
+
+        start = time.monotonic()
+        for _ in range(100):
+            limiter.acquire()
+        assert time.monotonic() - start < 0.5
+
+    def test_rate_limited_across_threads(self):
+        """测试多个线程共享同一限流器时按速率放行"""
+        limiter = RateLimiter(20, burst=1)
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(5)]
+
+        start = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # 首个令牌立即可用，其余4个各需约0.05秒
+        assert time.monotonic() - start >= 0.15
+
+
+class TestRetryCall:
+    """测试临时性失败的重试"""
+
+    def test_transient_error_classification(self):
+        """测试按异常类型与状态码判断临时性错误"""
+        assert is_transient_error(TimeoutError()) is True
+        assert is_transient_error(ConnectionError()) is True
+        assert is_transient_error(StatusError(429)) is True
+        assert is_transient_error(StatusError(503)) is True
+        assert is_transient_error(StatusError(400)) is False
+
+    def test_message_text_not_classified(self):
+        """测试不依据异常消息文本判断（如路径中的页码429）"""
+        assert is_transient_error(ValueError("无法读取图片: temp/photo_429_0.jpg")) is False
+        assert is_transient_error(RuntimeError("rate limit timeout")) is False
+
+    def test_retry_until_success(self):
+        """测试临时性失败后重试成功"""
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise StatusError(429)
+            return 'ok'
+
+        result = retry_call(flaky, max_attempts=3, min_wait=0.01)
+
+        assert result == 'ok'
+        assert len(calls) == 3
+
+    def test_non_transient_not_retried(self):
+        """测试非临时性失败直接抛出"""
+        calls = []
+
+        def broken():
+            calls.append(1)
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            retry_call(broken, max_attempts=3, min_wait=0.01)
+        assert len(calls) == 1
+
+    def test_attempts_exhausted(self):
+        """测试重试耗尽后抛出最后一次异常"""
+        calls = []
+
+        def always_timeout():
+            calls.append(1)
+            raise TimeoutError("timed out")
+
+        with pytest.raises(TimeoutError):
+            retry_call(always_timeout, max_attempts=2, min_wait=0.01)
+        assert len(calls) == 2
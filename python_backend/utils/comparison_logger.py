@@ -81,3 +81,25 @@ class ComparisonLogger:
         """清空记录"""
         self.steps = []
         self.current_step = None
+
+
+class _NullComparisonLogger(ComparisonLogger):
+    """空记录器：不记录任何步骤（未启用详细比对时共用同一实例）"""
+
+    def __init__(self):
+        super().__init__("", enable_logging=False)
+
+    def start_step(self, step_name: str, method: str = "", **inputs) -> 'ComparisonLogger':
+        return self
+
+    def end_step(self, success: bool = True, **outputs) -> 'ComparisonLogger':
+        return self
+
+    def record_error(self, error_message: str):
+        pass
+
+    def get_details(self) -> List[Dict[str, Any]]:
+        return []
+
+
+NULL_LOGGER = _NullComparisonLogger()
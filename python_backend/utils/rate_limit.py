@@ -0,0 +1,113 @@
+"""
+限流与重试工具
+用于控制视觉大模型等远程服务的调用速率，并对临时性失败进行指数退避重试
+（远程调用在工作线程中同步执行，限流器为线程安全，可在多个核对间共享）
+"""
+
+import logging
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """令牌桶限流器（线程安全）"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Args:
+            rate: 每秒允许的调用次数，<=0表示不限流
+            burst: 令牌桶容量（允许的瞬时并发调用数），默认为max(1, rate)
+        """
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """获取一个令牌，令牌不足时阻塞等待"""
+        if self.rate <= 0:
+            return
+
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                time.sleep((1 - self._tokens) / self.rate)
+
+
+# 可重试的HTTP状态码：请求超时、限流、服务端错误（529为Anthropic过载）
+_TRANSIENT_STATUS_CODES = frozenset((408, 429, 500, 502, 503, 504, 529))
+
+
+@lru_cache(maxsize=1)
+def _sdk_connection_error_types() -> Tuple[Type[BaseException], ...]:
+    """已安装的LLM SDK中表示连接失败/超时的异常类型（SDK为可选依赖）"""
+    types = []
+    try:
+        import openai
+        types.append(openai.APIConnectionError)  # 包括APITimeoutError
+    except ImportError:
+        pass
+    try:
+        import anthropic
+        types.append(anthropic.APIConnectionError)  # 包括APITimeoutError
+    except ImportError:
+        pass
+    return tuple(types)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    判断异常是否为可重试的临时性失败
+
+    按异常类型（超时、连接失败）或HTTP状态码（限流、服务端错误）判断，不依据异常消息文本
+    """
+    if isinstance(error, (TimeoutError, ConnectionError) + _sdk_connection_error_types()):
+        return True
+
+    status_code = getattr(error, 'status_code', None)
+    return status_code in _TRANSIENT_STATUS_CODES
+
+
+def retry_call(func: Callable[[], Any],
+               max_attempts: int = 3,
+               min_wait: float = 0.5,
+               max_wait: float = 8.0,
+               rate_limiter: Optional[RateLimiter] = None) -> Any:
+    """
+    执行调用，临时性失败时按指数退避重试
+
+    Args:
+        func: 无参的调用（每次尝试重新调用）
+        max_attempts: 最多尝试次数
+        min_wait: 首次重试前的等待秒数，之后每次翻倍
+        max_wait: 单次等待的上限秒数
+        rate_limiter: 每次尝试前获取令牌的限流器
+
+    Returns:
+        调用结果；非临时性失败或重试耗尽时抛出最后一次的异常
+    """
+    wait = min_wait
+    for attempt in range(1, max_attempts + 1):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+
+        try:
+            return func()
+        except Exception as e:
+            if attempt >= max_attempts or not is_transient_error(e):
+                raise
+            logger.warning("调用失败（第%d次），%.1f秒后重试: %s", attempt, wait, e)
+            time.sleep(wait)
+            wait = min(wait * 2, max_wait)